@@ -4,10 +4,11 @@ from typing import List, Tuple, Type
 
 import bpy
 
-from .addon_preferences import register_preferences, unregister_preferences
+from .addon_preferences import get_preferences, register_preferences, unregister_preferences
 from .addon_properties import register_properties, unregister_properties
 from .handlers import register_handlers, unregister_handlers
 from .operators import get_operator_classes
+from .operators.utils.profiler import get_profiler
 from .tools import get_tool_classes
 from .ui import register_ui, unregister_ui
 from .utils import addon_auto_imports
@@ -54,6 +55,8 @@ def register():
     classes_operator = get_operator_classes()
     for cls in classes_operator:
         bpy.utils.register_class(cls)
+    if get_preferences(bpy.context).profile_operators:
+        get_profiler().enable(classes_operator)
 
     # Register tools
     classes_tool = get_tool_classes()
@@ -79,6 +82,7 @@ def unregister():
         km.keymap_items.remove(kmi)
     addon_keymaps.clear()
 
+    get_profiler().disable()
     for cls in classes_operator:
         bpy.utils.unregister_class(cls)
 
@@ -8,6 +8,9 @@ import subprocess
 import bpy
 from bpy.props import BoolProperty, StringProperty
 
+from .operators import get_operator_classes
+from .operators.utils.profiler import get_profiler
+
 
 def get_preferences(context):
     return context.preferences.addons[__package__].preferences
@@ -20,6 +23,15 @@ class PowerSequencerPreferences(bpy.types.AddonPreferences):
     proxy_50: bpy.props.BoolProperty(name="50%", default=False)
     proxy_75: bpy.props.BoolProperty(name="75%", default=False)
     proxy_100: bpy.props.BoolProperty(name="100%", default=False)
+    proxy_disk_budget: bpy.props.FloatProperty(
+        name="Proxy Disk Budget (GB)",
+        description=(
+            "Maximum disk space for proxies. Deletes the least recently used proxies of media"
+            " that open scenes don't use when proxies take more space. 0 for no limit"
+        ),
+        default=0.0,
+        min=0.0,
+    )
 
     # Code adapted from Krzysztof Trzciński's work
     ffmpeg_executable: StringProperty(
@@ -31,6 +43,23 @@ class PowerSequencerPreferences(bpy.types.AddonPreferences):
     ffmpeg_status: StringProperty(default="")
     ffmpeg_is_executable_valid: BoolProperty(default=False)
 
+    profile_operators: BoolProperty(
+        name="Profile Operators",
+        description=(
+            "Record how long Power Sequencer's operators take to run, to export them from the"
+            " Profiler panel for performance bug reports. Slows operators down slightly"
+        ),
+        default=False,
+        update=lambda self, context: self.update_profile_operators(context),
+    )
+
+    def update_profile_operators(self, context):
+        profiler = get_profiler()
+        if self.profile_operators:
+            profiler.enable(get_operator_classes())
+        else:
+            profiler.disable()
+
     def update_ffmpeg_executable(self, context):
         error_message, info = self._try_run_ffmpeg(self.ffmpeg_executable)
         self.ffmpeg_is_executable_valid = error_message == ""
@@ -57,6 +86,7 @@ class PowerSequencerPreferences(bpy.types.AddonPreferences):
         row.prop(self, "proxy_50")
         row.prop(self, "proxy_75")
         row.prop(self, "proxy_100")
+        layout.prop(self, "proxy_disk_budget")
 
         text = [
             "(Optional) FFMpeg executable to use for multithread renders and proxy generation. "
@@ -68,6 +98,9 @@ class PowerSequencerPreferences(bpy.types.AddonPreferences):
         icon = "INFO" if self.ffmpeg_is_executable_valid else "ERROR"
         layout.label(text=self.ffmpeg_status, icon=icon)
 
+        layout.label(text="Debugging")
+        layout.prop(self, "profile_operators")
+
 
 register_preferences, unregister_preferences = bpy.utils.register_classes_factory(
     [PowerSequencerPreferences]
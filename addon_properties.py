@@ -18,6 +18,26 @@ class PowerSequencerProperties(bpy.types.PropertyGroup):
         name="Active Tab", description="The name of the active tab in the UI", default="Sequencer"
     )
 
+    snap_to_cuts: bpy.props.BoolProperty(
+        name="Cuts", description="Snap to the start and end of strips", default=True
+    )
+    snap_to_markers: bpy.props.BoolProperty(
+        name="Markers", description="Snap to timeline markers", default=True
+    )
+    snap_to_keyframes: bpy.props.BoolProperty(
+        name="Keyframes", description="Snap to the keyframes of strips", default=False
+    )
+    snap_to_playhead: bpy.props.BoolProperty(
+        name="Time Cursor", description="Snap to the time cursor", default=True
+    )
+    snap_distance: bpy.props.IntProperty(
+        name="Snap Distance",
+        description="Maximum distance to snap from, in pixels",
+        default=20,
+        min=1,
+        subtype="PIXEL",
+    )
+
 
 def register_properties():
     bpy.utils.register_class(PowerSequencerProperties)
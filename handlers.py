@@ -3,6 +3,13 @@
 import bpy
 from bpy.app.handlers import persistent
 
+from .addon_preferences import get_preferences
+from .operators.utils.cache import invalidate
+from .operators.utils.proxy_storage import update_proxy_storage_in_background
+from .operators.utils.tasks import cancel_all_tasks
+
+PROXY_STORAGE_UPDATE_INTERVAL = 600.0
+
 
 @persistent
 def power_sequencer_playback_speed_post(scene):
@@ -31,6 +38,31 @@ def power_sequencer_playback_speed_post(scene):
         bpy.ops.screen.frame_offset(delta=target_frame - scene.frame_current)
 
 
+@persistent
+def power_sequencer_cache_invalidate(*args):
+    """
+    Handler function that clears the add-on's strip caches when Blender updates the scene, for
+    example after a transform, an undo, or loading a file
+    """
+    invalidate()
+
+
+@persistent
+def power_sequencer_proxy_storage_update(*args):
+    """
+    Handler and timer function that records the proxies the open scenes use and evicts old
+    proxies to stay under the disk budget set in the add-on preferences, in a background task
+    """
+    update_proxy_storage_in_background(get_preferences(bpy.context).proxy_disk_budget)
+    return PROXY_STORAGE_UPDATE_INTERVAL
+
+
+@persistent
+def power_sequencer_tasks_cancel(*args):
+    """Cancels background tasks before loading a file, as they hold references to its data"""
+    cancel_all_tasks()
+
+
 def draw_playback_speed(self, context):
     layout = self.layout
     scene = context.scene
@@ -42,6 +74,14 @@ def draw_ui_menu(self, context):
     layout.menu("POWER_SEQUENCER_MT_main")
 
 
+CACHE_INVALIDATE_HANDLERS = (
+    bpy.app.handlers.depsgraph_update_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+
 def register_handlers():
     # Menus
     bpy.types.SEQUENCER_HT_header.append(draw_ui_menu)
@@ -49,6 +89,16 @@ def register_handlers():
 
     # Handlers
     bpy.app.handlers.frame_change_post.append(power_sequencer_playback_speed_post)
+    for handlers in CACHE_INVALIDATE_HANDLERS:
+        handlers.append(power_sequencer_cache_invalidate)
+    bpy.app.handlers.load_post.append(power_sequencer_proxy_storage_update)
+    bpy.app.handlers.save_post.append(power_sequencer_proxy_storage_update)
+    bpy.app.handlers.load_pre.append(power_sequencer_tasks_cancel)
+    bpy.app.timers.register(
+        power_sequencer_proxy_storage_update,
+        first_interval=PROXY_STORAGE_UPDATE_INTERVAL,
+        persistent=True,
+    )
 
 
 def unregister_handlers():
@@ -58,3 +108,11 @@ def unregister_handlers():
 
     # Handlers
     bpy.app.handlers.frame_change_post.remove(power_sequencer_playback_speed_post)
+    for handlers in CACHE_INVALIDATE_HANDLERS:
+        handlers.remove(power_sequencer_cache_invalidate)
+    bpy.app.handlers.load_post.remove(power_sequencer_proxy_storage_update)
+    bpy.app.handlers.save_post.remove(power_sequencer_proxy_storage_update)
+    bpy.app.handlers.load_pre.remove(power_sequencer_tasks_cancel)
+    cancel_all_tasks()
+    if bpy.app.timers.is_registered(power_sequencer_proxy_storage_update):
+        bpy.app.timers.unregister(power_sequencer_proxy_storage_update)
@@ -5,7 +5,10 @@ from operator import attrgetter
 import bpy
 
 from .utils.doc import doc_brief, doc_description, doc_idname, doc_name
-from .utils.functions import find_strips_in_range, move_selection, trim_strips
+from .utils.poll import has_selected_strips
+from .utils.functions import find_strips_in_range, trim_strips
+from .utils.strip_index import get_strip_index
+from .utils.strip_move import move_strips
 
 
 class POWER_SEQUENCER_OT_channel_offset(bpy.types.Operator):
@@ -68,52 +71,70 @@ class POWER_SEQUENCER_OT_channel_offset(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
-
-        channel_offset = -1
-
         selection = [s for s in context.selected_sequences if not s.lock]
-
         if not selection:
             return {"FINISHED"}
 
+        channel_offset = +1 if self.direction == "up" else -1
         sequences = sorted(selection, key=attrgetter("channel", "frame_final_start"))
         if self.direction == "up":
-            channel_offset = +1
             sequences = [s for s in reversed(sequences)]
 
-        head = sequences[0]
-        if not self.keep_selection_offset or (
-            head.channel != 1 and self.keep_selection_offset
-        ):
+        offsets = {}
+        if self.trim_target_channel:
             for s in sequences:
-                if self.trim_target_channel:
-                    channel_trim = s.channel + channel_offset
-                    strips_in_trim_channel = [
-                        sequence
-                        for sequence in context.sequences
-                        if (sequence.channel == channel_trim)
-                    ]
-                    if strips_in_trim_channel:
-                        to_delete, to_trim = find_strips_in_range(
-                            s.frame_final_start, s.frame_final_end, strips_in_trim_channel
-                        )
-                        trim_strips(
-                            context, s.frame_final_start, s.frame_final_end, to_trim, to_delete
-                        )
-
-                s.channel = max(1, s.channel + channel_offset)
-                if s.channel == 1:
-                    move_selection(context, [s], 0, 0)
+                channel_trim = s.channel + channel_offset
+                if channel_trim < 1:
+                    continue
+                strips_in_trim_channel = [
+                    strip
+                    for strip in get_strip_index(context).find_overlapping(
+                        s.frame_final_start, s.frame_final_end, [channel_trim]
+                    )
+                    if strip not in selection
+                ]
+                if strips_in_trim_channel:
+                    to_delete, to_trim = find_strips_in_range(
+                        s.frame_final_start, s.frame_final_end, strips_in_trim_channel
+                    )
+                    trim_strips(context, s.frame_final_start, s.frame_final_end, to_trim, to_delete)
+                offsets[s] = (0, channel_offset)
+        elif self.keep_selection_offset:
+            offset = self.find_free_channel_offset(context, sequences, channel_offset)
+            offsets = {s: (0, offset) for s in sequences}
+        else:
+            for s in sequences:
+                offset = self.find_free_channel_offset(context, [s], channel_offset, offsets)
+                offsets[s] = (0, offset)
 
-            if self.keep_selection_offset and not self.trim_target_channel:
-                start_frame = head.frame_final_start
-                x_difference = 0
-                while not head.channel == 1:
-                    move_selection(context, sequences, -x_difference, channel_offset)
-                    x_difference = head.frame_final_start - start_frame
-                    if x_difference == 0:
-                        break
+        move_strips(context, offsets)
         return {"FINISHED"}
+
+    def find_free_channel_offset(self, context, sequences, direction, offsets=None):
+        """
+        Returns the smallest channel offset in the given direction at which all the sequences fit
+        without overlapping other strips. Ignores the strips in `offsets`, that are about to move.
+        Returns 0 if there is no free space in that direction.
+        """
+        strip_index = get_strip_index(context)
+        ignored = set(offsets or {}) | set(sequences)
+        channel_min = min(s.channel for s in sequences)
+        channel_max = max(s.channel for s in sequences)
+        channel_limit = bpy.types.Sequence.bl_rna.properties["channel"].hard_max
+
+        offset = direction
+        while channel_min + offset >= 1 and channel_max + offset <= channel_limit:
+            is_free = all(
+                strip in ignored
+                for s in sequences
+                for strip in strip_index.find_overlapping(
+                    s.frame_final_start + 1, s.frame_final_end - 1, [s.channel + offset]
+                )
+            )
+            if is_free:
+                return offset
+            offset += direction
+        return 0
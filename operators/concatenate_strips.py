@@ -1,22 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
 import bpy
-from operator import attrgetter
 
 from .utils.global_settings import SequenceTypes
-from .utils.functions import (
-    find_sequences_after,
-    get_mouse_frame_and_channel,
-    ripple_move,
-)
+from .utils.channel_links import get_channel_links
+from .utils.functions import get_mouse_frame_and_channel
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
-
-
-def find_sequences_before(context, strip):
-    """
-    Returns a list of sequences that are before the strip in the current context
-    """
-    return [s for s in context.sequences if s.frame_final_end <= strip.frame_final_start]
+from .utils.poll import has_strips
+from .utils.strip_move import move_strips
 
 
 class POWER_SEQUENCER_OT_concatenate_strips(bpy.types.Operator):
@@ -79,7 +70,7 @@ class POWER_SEQUENCER_OT_concatenate_strips(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         if not context.selected_sequences:
@@ -90,69 +81,88 @@ class POWER_SEQUENCER_OT_concatenate_strips(bpy.types.Operator):
     def execute(self, context):
         selection = context.selected_sequences
         channels = {s.channel for s in selection}
+        links = get_channel_links(context)
+        # Channels don't affect each other: we plan the moves of all channels and apply them once
+        offsets = {}
 
         is_one_strip_per_channel = len(selection) == len(channels)
         if is_one_strip_per_channel:
             for s in selection:
+                index = links.get_index(s)
                 candidates = (
-                    find_sequences_before(context, s)
-                    if not self.is_towards_left
-                    else find_sequences_after(context, s)
+                    links.iter_after(index) if self.is_towards_left else links.iter_before(index)
                 )
-                to_concatenate = [
-                    strip
-                    for strip in candidates
-                    if strip.channel == s.channel
-                    and not strip.lock
-                    and strip.type in SequenceTypes.CUTABLE
-                ]
+                to_concatenate = []
+                for i in candidates:
+                    if (
+                        links.snapshot.lock[i]
+                        or links.snapshot.type[i] not in SequenceTypes.CUTABLE
+                    ):
+                        continue
+                    to_concatenate.append(i)
+                    if not self.concatenate_all:
+                        break
                 if not to_concatenate:
                     continue
-                self.concatenate(context, s, to_concatenate)
+                self.concatenate(links, index, to_concatenate, offsets)
 
         else:
             for channel in channels:
-                to_concatenate = [s for s in selection if s.channel == channel]
-                strip_target = (
-                    min(to_concatenate, key=lambda s: s.frame_final_start)
+                to_concatenate = [links.get_index(s) for s in selection if s.channel == channel]
+                target = (
+                    min(to_concatenate, key=lambda i: links.frame_final_start[i])
                     if self.is_towards_left
-                    else max(to_concatenate, key=lambda s: s.frame_final_start)
+                    else max(to_concatenate, key=lambda i: links.frame_final_start[i])
                 )
-                to_concatenate.remove(strip_target)
-                self.concatenate(context, strip_target, to_concatenate, force_all=True)
+                to_concatenate.remove(target)
+                self.concatenate(links, target, to_concatenate, offsets, force_all=True)
 
+        move_strips(context, offsets)
         return {"FINISHED"}
 
-    def concatenate(self, context, strip_target, sequences, force_all=False):
-        to_concatenate = sorted(sequences, key=attrgetter("frame_final_start"))
-        to_concatenate = (
-            list(reversed(to_concatenate)) if not self.is_towards_left else to_concatenate
-        )
+    def concatenate(self, links, target, indices, offsets, force_all=False):
+        """
+        Adds the frame offsets to concatenate the strips at `indices` to the strip at `target` to
+        the `offsets` dictionary, where indices are positions in the ChannelLinks' snapshot
+        """
+        starts, ends = links.frame_final_start, links.frame_final_end
+        to_concatenate = sorted(indices, key=lambda i: starts[i], reverse=not self.is_towards_left)
         to_concatenate = (
             [to_concatenate[0]] if not (self.concatenate_all or force_all) else to_concatenate
         )
+        strips = links.snapshot.strips
 
-        attribute_target = "frame_final_end" if self.is_towards_left else "frame_final_start"
-        attribute_concat = "frame_final_start" if self.is_towards_left else "frame_final_end"
-        concatenate_start = getattr(strip_target, attribute_target)
+        concatenate_start = ends[target] if self.is_towards_left else starts[target]
         last_gap = 0
-        for s in to_concatenate:
-            if isinstance(s, bpy.types.EffectSequence):
+        # With ripple edits, strips after each concatenated strip move along with it
+        do_ripple = self.do_ripple and self.is_towards_left
+        ripple_offsets = {}
+        ripple_offset = 0
+        for i in to_concatenate:
+            if isinstance(strips[i], bpy.types.EffectSequence):
                 concatenate_start = (
-                    s.frame_final_end - last_gap
+                    ends[i] + ripple_offset - last_gap
                     if self.is_towards_left
-                    else s.frame_final_start - last_gap
+                    else starts[i] - last_gap
                 )
                 continue
-            concat_strip_frame = getattr(s, attribute_concat)
-            gap = concat_strip_frame - concatenate_start
-            if self.do_ripple and self.is_towards_left:
-                ripple_move(context, [s], -gap)
-            else:
-                s.frame_start -= gap
-            concatenate_start = s.frame_final_end if self.is_towards_left else s.frame_final_start
+            concat_strip_frame = starts[i] if self.is_towards_left else ends[i]
+            gap = concat_strip_frame + ripple_offset - concatenate_start
+            offset = ripple_offset - gap
+            offsets[strips[i]] = (int(offset), 0)
+            if do_ripple:
+                ripple_offset = offset
+                ripple_offsets[i] = offset
+            concatenate_start = (ends[i] if self.is_towards_left else starts[i]) + offset
             last_gap = gap
 
+        if do_ripple:
+            ripple_offset = 0
+            for i in links.iter_after(target):
+                ripple_offset = ripple_offsets.get(i, ripple_offset)
+                if ripple_offset and i not in ripple_offsets:
+                    offsets[strips[i]] = (int(ripple_offset), 0)
+
         if not (self.concatenate_all or force_all):
-            strip_target.select = False
-            to_concatenate[0].select = True
+            strips[target].select = False
+            strips[to_concatenate[0]].select = True
@@ -4,6 +4,7 @@ import bpy
 from operator import attrgetter
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_copy_selected_sequences(bpy.types.Operator):
@@ -48,7 +49,7 @@ class POWER_SEQUENCER_OT_copy_selected_sequences(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         cursor_start_frame = context.scene.frame_current
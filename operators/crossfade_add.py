@@ -6,6 +6,8 @@ from .utils.functions import find_sequences_after
 from .utils.functions import convert_duration_to_frames
 from .utils.global_settings import SequenceTypes
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
+from .utils.strip_move import move_strips
 
 
 class POWER_SEQUENCER_OT_crossfade_add(bpy.types.Operator):
@@ -45,18 +47,27 @@ class POWER_SEQUENCER_OT_crossfade_add(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         sorted_selection = sorted(context.selected_sequences, key=lambda s: s.frame_final_start)
+        pairs = []
         for s in sorted_selection:
             s_next = self.get_next_sequence_after(context, s)
             s_to_offset = s_next.input_1 if hasattr(s_next, "input_1") else s_next
-
-            if self.auto_move_strip:
-                offset = s_to_offset.frame_final_start - s.frame_final_end
-                s_to_offset.frame_start -= offset
-
+            pairs.append((s, s_next, s_to_offset))
+
+        if self.auto_move_strip:
+            # Plans the moves with the planned positions of the strips moved before, and moves
+            # all the strips with one call
+            frame_offsets = {}
+            for s, _, s_to_offset in pairs:
+                frame_offsets[s_to_offset] = (
+                    s.frame_final_end + frame_offsets.get(s, 0) - s_to_offset.frame_final_start
+                )
+            move_strips(context, {s: (offset, 0) for s, offset in frame_offsets.items()})
+
+        for s, s_next, s_to_offset in pairs:
             if s_to_offset.frame_final_start == s.frame_final_end:
                 self.offset_sequence_handles(context, s, s_to_offset)
 
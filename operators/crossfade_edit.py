@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
 import bpy
+from operator import attrgetter
 
 from .utils.global_settings import SequenceTypes
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import get_active_strip_type, has_selected_strips
+from .utils.effect_graph import get_effect_graph
 
 
 class POWER_SEQUENCER_OT_crossfade_edit(bpy.types.Operator):
@@ -32,7 +35,7 @@ class POWER_SEQUENCER_OT_crossfade_edit(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor.active_strip and context.selected_sequences
+        return get_active_strip_type(context) is not None and has_selected_strips(context)
 
     def execute(self, context):
         active = context.scene.sequence_editor.active_strip
@@ -51,24 +54,20 @@ class POWER_SEQUENCER_OT_crossfade_edit(bpy.types.Operator):
         bpy.ops.transform.seq_slide("INVOKE_DEFAULT")
         return {"FINISHED"}
 
-    def find_cross_effect(self, sequence):
+    def find_cross_effect(self, context, sequence):
         """
-        Takes a single strip and finds effect strips that use it as input
-        Returns the effect strip(s) found as a list, ordered by starting frame
+        Takes a single strip and finds the crossfade effect strips that use it as input
+        Returns the first crossfade found, ordered by starting frame
         Returns None if no effect was found
         """
         if sequence.type not in SequenceTypes.VIDEO + SequenceTypes.IMAGE:
             return
 
-        effect_sequences = (s for s in context.sequences if s.type in SequenceTypes.EFFECT)
-        found_effect_strips = []
-        for s in effect_sequences:
-            if s.input_1.name == sequence.name:
-                found_effect_strips.append(s)
-            if s.input_count == 2:
-                if s.input_2.name == sequence.name:
-                    found_effect_strips.append(s)
-        for e in found_effect_strips:
-            if e.type not in self.crossfade_types:
-                continue
-            return e
+        found_effect_strips = [
+            e
+            for e in get_effect_graph(context).get_effects(sequence)
+            if e.type in self.crossfade_types
+        ]
+        if not found_effect_strips:
+            return
+        return min(found_effect_strips, key=attrgetter("frame_final_start"))
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 from .utils.functions import get_mouse_frame_and_channel
 
 
@@ -33,7 +34,7 @@ class POWER_SEQUENCER_OT_split_strips_under_cursor(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         frame, channel = get_mouse_frame_and_channel(context, event)
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_deselect_all_strips_left_or_right(bpy.types.Operator):
@@ -51,7 +52,7 @@ class POWER_SEQUENCER_OT_deselect_all_strips_left_or_right(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def invoke(self, context, event):
         frame_current = context.scene.frame_current
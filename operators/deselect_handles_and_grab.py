@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_deselect_handles_and_grab(bpy.types.Operator):
@@ -24,7 +25,7 @@ class POWER_SEQUENCER_OT_deselect_handles_and_grab(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         for s in context.selected_sequences:
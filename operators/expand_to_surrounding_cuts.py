@@ -3,7 +3,9 @@
 import bpy
 
 from .utils.functions import slice_selection
+from .utils.strip_index import get_strip_index
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_expand_to_surrounding_cuts(bpy.types.Operator):
@@ -46,7 +48,7 @@ class POWER_SEQUENCER_OT_expand_to_surrounding_cuts(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def invoke(self, context, event):
         sequence_blocks = slice_selection(context, context.selected_sequences)
@@ -77,12 +79,14 @@ class POWER_SEQUENCER_OT_expand_to_surrounding_cuts(bpy.types.Operator):
 
 
 def find_closest_cuts(context, frame_min, frame_max):
-    frame_left = max(
-        context.sequences,
-        key=lambda s: s.frame_final_end if s.frame_final_end <= frame_min else -1,
-    ).frame_final_end
-    frame_right = min(
-        context.sequences,
-        key=lambda s: s.frame_final_start if s.frame_final_start >= frame_max else 1000000,
-    ).frame_final_start
-    return frame_left, frame_right
+    """
+    Returns the closest strip end before `frame_min` and the closest strip start after `frame_max`.
+    Returns the frame itself on either side if there is no cut to expand to.
+    """
+    strip_index = get_strip_index(context)
+    frame_left = strip_index.find_end_before(frame_min)
+    frame_right = strip_index.find_start_after(frame_max)
+    return (
+        frame_min if frame_left is None else frame_left,
+        frame_max if frame_right is None else frame_right,
+    )
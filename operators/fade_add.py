@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
 import bpy
+import numpy as np
 from mathutils import Vector
 from math import floor
 
+from .utils.cache import invalidate
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
+from .utils.keyframes import get_fcurve_index, read_keyframes
 
 
 class POWER_SEQUENCER_OT_fade_add(bpy.types.Operator):
@@ -14,8 +18,10 @@ class POWER_SEQUENCER_OT_fade_add(bpy.types.Operator):
 
     - In, Out, In and Out create a fade animation of the given duration from
     the start of the sequence, to the end of the sequence, or on boths sides
-    - From playhead: the fade animation goes from the start of sequences under the playhead to the playhead
-    - To playhead: the fade animation goes from the playhead to the end of sequences under the playhead
+    - From playhead: the fade animation goes from the start of sequences under the playhead to the
+    playhead
+    - To playhead: the fade animation goes from the playhead to the end of sequences under the
+    playhead
 
     By default, the duration of the fade is 1 second
     """
@@ -65,7 +71,7 @@ class POWER_SEQUENCER_OT_fade_add(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         # We must create a scene action first if there's none
@@ -97,10 +103,12 @@ class POWER_SEQUENCER_OT_fade_add(bpy.types.Operator):
 
             animated_property = "volume" if hasattr(sequence, "volume") else "blend_alpha"
             fade_fcurve = fade_find_or_create_fcurve(context, sequence, animated_property)
-            fades = self.calculate_fades(sequence, fade_fcurve, animated_property, duration)
-            fade_animation_clear(context, fade_fcurve, fades)
-            fade_animation_create(fade_fcurve, fades)
+            keyframes = read_keyframes(fade_fcurve)
+            fades = self.calculate_fades(sequence, keyframes["co"], animated_property, duration)
+            fade_animation_create(fade_fcurve, keyframes, fades)
             faded_sequences.append(sequence)
+        # The keyframe caches don't see keyframes added to existing fcurves
+        invalidate()
 
         sequence_string = "sequence" if len(faded_sequences) == 1 else "sequences"
         self.report(
@@ -124,64 +132,67 @@ class POWER_SEQUENCER_OT_fade_add(bpy.types.Operator):
         minimum_duration = duration * 2 if self.type == "IN_OUT" else duration
         return sequence.frame_final_duration >= minimum_duration
 
-    def calculate_fades(self, sequence, fade_fcurve, animated_property, duration):
+    def calculate_fades(self, sequence, keyframes_co, animated_property, duration):
         """
         Returns a list of Fade objects
         """
         fades = []
         if self.type in ["IN", "IN_OUT", "CURSOR_TO"]:
-            fade = Fade(sequence, fade_fcurve, "IN", animated_property, duration)
+            fade = Fade(sequence, keyframes_co, "IN", animated_property, duration)
             fades.append(fade)
         if self.type in ["OUT", "IN_OUT", "CURSOR_FROM"]:
-            fade = Fade(sequence, fade_fcurve, "OUT", animated_property, duration)
+            fade = Fade(sequence, keyframes_co, "OUT", animated_property, duration)
             fades.append(fade)
         return fades
 
 
 def fade_find_or_create_fcurve(context, sequence, animated_property):
     """
-    Iterates over all the fcurves until it finds an fcurve with a data path
-    that corresponds to the sequence.
+    Looks up the fcurve with a data path that corresponds to the sequence in the action's
+    FCurveIndex.
     Returns the matching FCurve or creates a new one if the function can't find a match.
     """
-    fade_fcurve = None
-    fcurves = context.scene.animation_data.action.fcurves
-    searched_data_path = sequence.path_from_id(animated_property)
-    for fcurve in fcurves:
-        if fcurve.data_path == searched_data_path:
-            fade_fcurve = fcurve
-            break
+    fcurve_index = get_fcurve_index(context)
+    fade_fcurve = fcurve_index.find(sequence, animated_property)
     if not fade_fcurve:
-        fade_fcurve = fcurves.new(data_path=searched_data_path)
+        fcurves = context.scene.animation_data.action.fcurves
+        fade_fcurve = fcurves.new(data_path=sequence.path_from_id(animated_property))
+        fcurve_index.add(fade_fcurve)
     return fade_fcurve
 
 
-def fade_animation_clear(context, fade_fcurve, fades):
+def fade_animation_create(fade_fcurve, keyframes, fades):
     """
-    Removes existing keyframes in the fades' time range, in fast mode, without
-    updating the fcurve
+    Replaces the existing keyframes in the fades' time range with the fades' keyframes.
+    Removes the replaced keyframes, then adds the fade keyframes at the end and writes the
+    coordinates of all the keyframes with one foreach_set per coordinate. The other keyframes keep
+    their order, so fcurve.update() sorts them along with their interpolation and handle settings.
+    Args:
+    - keyframes: the dictionary of (frame, value) arrays returned by read_keyframes()
     """
-    keyframe_points = fade_fcurve.keyframe_points
-    for keyframe in keyframe_points:
-        for fade in fades:
-            # The keyframe points list doesn't seem to always update as the
-            # operator re-runs Leading to trying to remove nonexistent keyframes
-            try:
-                if fade.start.x < keyframe.co[0] < fade.end.x:
-                    keyframe_points.remove(keyframe, fast=True)
-            except ReferenceError:
-                pass
-
-
-def fade_animation_create(fade_fcurve, fades):
-    """
-    Inserts keyframes in the fade_fcurve in fast mode using the Fade objects.
-    Updates the fcurve after having inserted all keyframes to finish the animation.
-    """
-    keyframe_points = fade_fcurve.keyframe_points
+    # An IN fade can end on the frame where the OUT fade starts: like keyframe_points.insert(),
+    # keep a single keyframe per frame with the last value
+    fade_points = {}
     for fade in fades:
         for point in (fade.start, fade.end):
-            keyframe_points.insert(frame=point.x, value=point.y, options={"FAST"})
+            fade_points[point.x] = point.y
+    fade_points = np.array(sorted(fade_points.items()), dtype=np.float32)
+
+    frames = keyframes["co"][:, 0]
+    is_removed = np.isin(frames, fade_points[:, 0])
+    for fade in fades:
+        is_removed |= (fade.start.x < frames) & (frames < fade.end.x)
+
+    keyframe_points = fade_fcurve.keyframe_points
+    # Removing the last keyframes first keeps the indices of the others valid
+    for index in reversed(np.flatnonzero(is_removed).tolist()):
+        keyframe_points.remove(keyframe_points[index], fast=True)
+    keyframe_points.add(len(fade_points))
+
+    # The new keyframes start with their handles on the keyframe, fcurve.update() sets them
+    for attribute, coordinates in keyframes.items():
+        coordinates = np.concatenate((coordinates[~is_removed], fade_points))
+        keyframe_points.foreach_set(attribute, coordinates.ravel())
     fade_fcurve.update()
     # The graph editor and the audio waveforms only redraw upon "moving" a keyframe
     keyframe_points[-1].co = keyframe_points[-1].co
@@ -198,11 +209,11 @@ class Fade:
     max_value = 1.0
     start, end = Vector((0, 0)), Vector((0, 0))
 
-    def __init__(self, sequence, fade_fcurve, type, animated_property, duration):
+    def __init__(self, sequence, keyframes_co, type, animated_property, duration):
         self.type = type
         self.animated_property = animated_property
         self.duration = duration
-        self.max_value = self.calculate_max_value(sequence, fade_fcurve)
+        self.max_value = self.calculate_max_value(sequence, keyframes_co)
 
         if type == "IN":
             self.start = Vector((sequence.frame_final_start, 0.0))
@@ -211,30 +222,30 @@ class Fade:
             self.start = Vector((sequence.frame_final_end - self.duration, self.max_value))
             self.end = Vector((sequence.frame_final_end, 0.0))
 
-    def calculate_max_value(self, sequence, fade_fcurve):
+    def calculate_max_value(self, sequence, keyframes_co):
         """
         Returns the maximum Y coordinate the fade animation should use for a given sequence
-        Uses either the sequence's value for the animated property, or the next keyframe after the fade
+        Uses either the sequence's value for the animated property, or the next keyframe after the
+        fade
+        Args:
+        - keyframes_co: array of the (frame, value) coordinates of the fcurve's keyframes
         """
         max_value = 0.0
 
-        if not fade_fcurve.keyframe_points:
+        if not len(keyframes_co):
             max_value = getattr(sequence, self.animated_property, 1.0)
         else:
+            frames = keyframes_co[:, 0]
             if self.type == "IN":
                 fade_end = sequence.frame_final_start + self.duration
-                keyframes = (k for k in fade_fcurve.keyframe_points if k.co[0] >= fade_end)
+                values = keyframes_co[frames >= fade_end, 1]
+                max_value = values[0] if len(values) else max_value
             if self.type == "OUT":
                 fade_start = sequence.frame_final_end - self.duration
-                keyframes = (
-                    k for k in reversed(fade_fcurve.keyframe_points) if k.co[0] <= fade_start
-                )
-            try:
-                max_value = next(keyframes).co[1]
-            except StopIteration:
-                pass
-
-        return max_value if max_value > 0.0 else 1.0
+                values = keyframes_co[frames <= fade_start, 1]
+                max_value = values[-1] if len(values) else max_value
+
+        return float(max_value) if max_value > 0.0 else 1.0
 
     def __repr__(self):
         return "Fade {}: {} to {}".format(self.type, self.start, self.end)
@@ -3,6 +3,8 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
+from .utils.keyframes import get_fcurve_index
 
 
 class POWER_SEQUENCER_OT_fade_clear(bpy.types.Operator):
@@ -33,22 +35,17 @@ class POWER_SEQUENCER_OT_fade_clear(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
-        fcurves = context.scene.animation_data.action.fcurves
+        fcurve_index = get_fcurve_index(context)
 
         for sequence in context.selected_sequences:
             animated_property = "volume" if hasattr(sequence, "volume") else "blend_alpha"
-            data_path = sequence.path_from_id() + "." + animated_property
-            fcurve_map = {
-                curve.data_path: curve
-                for curve in fcurves
-                if curve.data_path.startswith("sequence_editor.sequences_all")
-            }
-            curve = fcurve_map.get(data_path)
+            curve = fcurve_index.find(sequence, animated_property) if fcurve_index else None
             if curve:
-                fcurves.remove(curve)
+                fcurve_index.remove(curve)
+                context.scene.animation_data.action.fcurves.remove(curve)
             setattr(sequence, animated_property, 1.0)
 
         return {"FINISHED"}
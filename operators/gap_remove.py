@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
 import bpy
-from operator import attrgetter
+import numpy as np
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
-from .utils.functions import slice_selection
+from .utils.poll import has_strips
+from .utils.strip_move import move_strips
+from .utils.strip_snapshot import get_strip_snapshot
 
 
 class POWER_SEQUENCER_OT_gap_remove(bpy.types.Operator):
@@ -44,85 +46,117 @@ class POWER_SEQUENCER_OT_gap_remove(bpy.types.Operator):
         description="Move the time cursor when closing the gap",
         default=False,
     )
+    per_channel: bpy.props.BoolProperty(
+        name="Per Channel",
+        description="Remove the gaps in each channel independently. Doesn't move markers",
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         frame = self.frame if self.frame >= 0 else context.scene.frame_current
-        sequences = (
-            [s for s in context.sequences if not s.lock]
-            if self.ignore_locked
-            else context.sequences
-        )
-        sequences = [
-            s for s in sequences if s.frame_final_start >= frame or s.frame_final_end > frame
-        ]
-        sequence_blocks = slice_selection(context, sequences)
-        if not sequence_blocks:
-            return {"FINISHED"}
-
-        gap_frame = self.find_gap_frame(context, frame, sequence_blocks[0])
-        if gap_frame == -1:
+        snapshot = get_strip_snapshot(context)
+        mask = (snapshot.frame_final_start >= frame) | (snapshot.frame_final_end > frame)
+        if self.ignore_locked:
+            mask &= snapshot.mask_unlocked()
+        if not mask.any():
             return {"FINISHED"}
 
-        first_block_start = min(
-            sequence_blocks[0], key=attrgetter("frame_final_start")
-        ).frame_final_start
-        blocks_after_gap = (
-            sequence_blocks[1:] if first_block_start <= gap_frame else sequence_blocks
-        )
+        if self.per_channel:
+            channel_masks = [snapshot.channel == c for c in np.unique(snapshot.channel[mask])]
+        else:
+            channel_masks = [snapshot.mask_all()]
 
-        self.gaps_remove(context, blocks_after_gap, gap_frame)
+        offsets, first_gap_frame = {}, None
+        for channel_mask in channel_masks:
+            group = mask & channel_mask
+            gap_starts, gap_sizes = self.find_gaps(snapshot, frame, group, channel_mask)
+            if gap_starts.size == 0:
+                continue
+            if first_gap_frame is None or gap_starts[0] < first_gap_frame:
+                first_gap_frame = int(gap_starts[0])
+
+            strips_offsets = self.calculate_offsets(
+                snapshot.frame_final_start[group], gap_starts + gap_sizes, gap_sizes
+            )
+            for s, offset in zip(snapshot.get_strips(group), strips_offsets):
+                if offset:
+                    offsets[s] = (-int(offset), 0)
+            if not self.per_channel:
+                markers_gaps = slice(None) if self.all else slice(1)
+                self.move_markers(context, gap_starts[markers_gaps], gap_sizes[markers_gaps])
+
+        if first_gap_frame is None:
+            return {"FINISHED"}
+        move_strips(context, offsets)
         if self.move_time_cursor:
-            context.scene.frame_current = gap_frame
+            context.scene.frame_current = first_gap_frame
         return {"FINISHED"}
 
-    def find_gap_frame(self, context, frame, sorted_sequences):
+    def find_gaps(self, snapshot, frame, mask, channel_mask):
         """
-        Finds and returns the frame at which the gap starts.
-        Takes a list sequences sorted by frame_final_start.
+        Finds the gaps between the strips in `mask` after `frame` in a single sweep.
+        Returns two arrays: the frame at which each gap starts and the size of each gap.
+        Like slice_selection(), strips one frame apart belong to the same block, so gaps between
+        blocks are at least two frames long.
+        Args:
+        - channel_mask: the strips in the channels to remove gaps from, used to find where the
+        first gap starts
         """
-        strips_start = min(sorted_sequences, key=attrgetter("frame_final_start")).frame_final_start
-        strips_end = max(sorted_sequences, key=attrgetter("frame_final_end")).frame_final_end
-
-        gap_frame = -1
-        if strips_start > frame:
-            strips_before_frame_start = [s for s in context.sequences if s.frame_final_end <= frame]
-            frame_target = 0
-            if strips_before_frame_start:
-                frame_target = max(
-                    strips_before_frame_start, key=attrgetter("frame_final_end")
-                ).frame_final_end
-            gap_frame = frame_target if frame_target < strips_start else frame
-        else:
-            gap_frame = strips_end
-        return gap_frame
-
-    def gaps_remove(self, context, sequence_blocks, gap_frame_start):
+        order = np.argsort(snapshot.frame_final_start[mask], kind="stable")
+        starts = snapshot.frame_final_start[mask][order]
+        blocks_end = np.maximum.accumulate(snapshot.frame_final_end[mask][order])
+
+        is_gap = starts[1:] > blocks_end[:-1] + 1
+        gap_starts = blocks_end[:-1][is_gap]
+        gap_ends = starts[1:][is_gap]
+
+        # If the first strip starts after the frame, the first gap starts at the end of the last
+        # strip before the frame
+        if starts[0] > frame:
+            ends = snapshot.frame_final_end[channel_mask]
+            ends_before_frame = ends[ends <= frame]
+            gap_frame = int(ends_before_frame.max()) if ends_before_frame.size else 0
+            if gap_frame < starts[0]:
+                gap_starts = np.insert(gap_starts, 0, gap_frame)
+                gap_ends = np.insert(gap_ends, 0, starts[0])
+
+        return gap_starts.astype(np.int64), (gap_ends - gap_starts).astype(np.int64)
+
+    def calculate_offsets(self, frames, gap_ends, gap_sizes):
         """
-        Recursively removes gaps between blocks of sequences.
+        Returns the number of frames to move each of the `frames` to the left: the total size of
+        the gaps that end before it. If the operator's `all` option is False, only the block of
+        strips right after the first gap moves, by the size of that gap.
         """
+        indices = np.searchsorted(gap_ends, frames, side="right")
+        if not self.all:
+            return np.where(indices == 1, gap_sizes[0], 0)
+        cumulative_sizes = np.concatenate(([0], np.cumsum(gap_sizes)))
+        return cumulative_sizes[indices]
 
-        gap_frame = gap_frame_start
-        for block in sequence_blocks:
-            gap_size = block[0].frame_final_start - gap_frame
-            if gap_size < 1:
-                continue
-
-            for s in block:
-                try:
-                    s.frame_start -= gap_size
-                except AttributeError:
-                    continue
-
-            self.move_markers(context, gap_frame, gap_size)
-            if not self.all:
-                break
-            gap_frame = block[-1].frame_final_end
-
-    def move_markers(self, context, gap_frame, gap_size):
-        markers = (m for m in context.scene.timeline_markers if m.frame > gap_frame)
-        for m in markers:
-            m.frame -= min({gap_size, m.frame - gap_frame})
+    def move_markers(self, context, gap_starts, gap_sizes):
+        """
+        Moves the markers after each gap by the size of the gaps before them in one pass.
+        Markers inside a gap move to the start of the gap.
+        """
+        markers = context.scene.timeline_markers
+        if not markers:
+            return
+
+        frames = np.empty(len(markers), dtype=np.int32)
+        markers.foreach_get("frame", frames)
+        # Index of the last gap that starts before each marker
+        indices = np.searchsorted(gap_starts, frames, side="left") - 1
+        is_after_gap = indices >= 0
+        indices = indices[is_after_gap]
+
+        cumulative_sizes = np.concatenate(([0], np.cumsum(gap_sizes)))
+        offsets = cumulative_sizes[indices] + np.minimum(
+            gap_sizes[indices], frames[is_after_gap] - gap_starts[indices]
+        )
+        frames[is_after_gap] -= offsets.astype(np.int32)
+        markers.foreach_set("frame", frames)
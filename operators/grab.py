@@ -5,6 +5,7 @@ import bpy
 from .utils.functions import get_mouse_frame_and_channel
 from .utils.global_settings import SequenceTypes
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_grab(bpy.types.Operator):
@@ -32,7 +33,7 @@ class POWER_SEQUENCER_OT_grab(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def invoke(self, context, event):
         frame, channel = get_mouse_frame_and_channel(context, event)
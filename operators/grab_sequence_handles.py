@@ -4,6 +4,7 @@ import bpy
 
 from .utils.global_settings import SequenceTypes
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_grab_sequence_handles(bpy.types.Operator):
@@ -36,7 +37,7 @@ class POWER_SEQUENCER_OT_grab_sequence_handles(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         self.frame, self.channel = context.region.view2d.region_to_view(
@@ -1,13 +1,15 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
-import json
 import os
-import re
 
 import bpy
 
 from .utils.functions import convert_duration_to_frames
 from .utils.doc import doc_brief, doc_description, doc_idname, doc_name
+from .utils.footage_scan import find_footage_files, parse_ignore_patterns
+from .utils.import_manifest import ImportManifest
+from .utils.media_probe import probe_files
+from .utils.strip_import import create_strips, plan_import
 from ..addon_preferences import get_preferences
 from .utils.global_settings import (
     Extensions,
@@ -22,7 +24,11 @@ class POWER_SEQUENCER_OT_import_local_footage(bpy.types.Operator):
     """*brief* Imports video, images, and audio from the project folder
 
     Finds and imports all valid video, audio files, and pictures in the blend file's folder and
-    sub-folders, ignoring folders named BL_proxy.
+    sub-folders, ignoring folders named BL_proxy. Imports numbered images with consecutive
+    frame numbers as image sequences.
+
+    Remembers the size and modification date of imported files, so it only imports new files, and
+    optionally files that changed since the last import.
 
     If you set it in the add-on preferences, it also sets imported sequences to use proxies. See
     `Preferences -> Add-ons -> Blender Power Sequencer -> Proxy`
@@ -63,192 +69,147 @@ class POWER_SEQUENCER_OT_import_local_footage(bpy.types.Operator):
         default=1.0,
         min=0.0,
     )
+    ignore_patterns: bpy.props.StringProperty(
+        name="Ignore Patterns",
+        description=(
+            "Comma-separated patterns of file and folder names to ignore, like *.tmp, cache*."
+            " Folders named BL_proxy are always ignored"
+        ),
+        default="",
+    )
+    detect_image_sequences: bpy.props.BoolProperty(
+        name="Detect Image Sequences",
+        description="Import runs of images with consecutive frame numbers as a single strip",
+        default=True,
+    )
+    import_changed: bpy.props.BoolProperty(
+        name="Import Changed Files",
+        description="Also import files that changed on the disk since the last import",
+        default=False,
+    )
 
-    sequencer_area = None
     directory = ""
+    media_info = {}
 
     @classmethod
     def poll(cls, context):
         return bpy.data.is_saved
 
     def execute(self, context):
-        self.sequencer_area = self.get_sequencer_area(context)
         self.directory = os.path.split(bpy.data.filepath)[0]
 
-        filepaths = self.find_local_footage_files()
-        files_to_import = [
-            os.path.join(self.directory, f) for f in self.find_new_files_to_import(filepaths)
-        ]
+        files = find_footage_files(
+            self.directory, EXTENSIONS_ALL, parse_ignore_patterns(self.ignore_patterns)
+        )
+        text_file = self.get_import_text_block("POWER_SEQUENCER_IMPORTS")
+        manifest = ImportManifest.from_string(text_file.as_string())
+        new_files, changed_files, deleted_files = manifest.compare(files)
+
+        skipped_files = [] if self.import_changed else changed_files
+        files_to_import = new_files + changed_files if self.import_changed else new_files
+        files_to_import = [os.path.join(self.directory, f) for f in files_to_import]
+
+        # Probing the files with ffprobe skips files Blender can't open either
+        self.media_info = probe_files(
+            context,
+            [f for f in files_to_import if f.lower().endswith(EXTENSIONS_AUDIO + EXTENSIONS_VIDEO)],
+        )
+        unreadable_files = {f for f, info in self.media_info.items() if info is None}
+        files_to_import = [f for f in files_to_import if f not in unreadable_files]
+        # Leave unreadable files out of the manifest to try again next time
+        for f in unreadable_files:
+            files.pop(os.path.relpath(f, self.directory))
         if not files_to_import:
+            manifest.update(files, skipped_files)
+            text_file.from_string(manifest.to_string())
             self.report({"INFO"}, "No new files to import found")
             return {"FINISHED"}
 
         bpy.ops.screen.animation_cancel(restore_frame=True)
 
-        audio = self.import_audios(
-            context, [f for f in files_to_import if f.lower().endswith(EXTENSIONS_AUDIO)]
-        )
-        video = self.import_videos(
-            context, [f for f in files_to_import if f.lower().endswith(EXTENSIONS_VIDEO)]
-        )
-        img = self.import_imgs(
-            context, [f for f in files_to_import if f.lower().endswith(EXTENSIONS_IMG)]
-        )
+        videos = [f for f in files_to_import if f.lower().endswith(EXTENSIONS_VIDEO)]
+        if videos:
+            self.set_scene_framerate(context, videos[0])
 
-        bpy.data.texts["POWER_SEQUENCER_IMPORTS"].from_string(json.dumps(filepaths))
+        if not context.scene.sequence_editor:
+            context.scene.sequence_editor_create()
+        for s in context.selected_sequences:
+            s.select = False
 
-        for s in audio:
-            s.show_waveform = True
+        frame = context.scene.frame_current
+        plan = plan_import(
+            context,
+            frame,
+            videos,
+            [f for f in files_to_import if f.lower().endswith(EXTENSIONS_AUDIO)],
+            [f for f in files_to_import if f.lower().endswith(EXTENSIONS_IMG)],
+            self.keep_audio,
+            self.media_info,
+            self.detect_image_sequences,
+        )
+        prefs = get_preferences(context)
+        imported = create_strips(
+            context,
+            plan,
+            frame,
+            convert_duration_to_frames(context, self.img_length),
+            convert_duration_to_frames(context, self.img_padding),
+            lambda s: self.set_strip_options(s, prefs),
+        )
 
-        imported = audio + video + img
-        for s in imported:
-            s.select = True
-        self.set_selected_strips_proxies(context)
-        self.report({"INFO"}, "Imported {!s} strips from newly found files.".format(len(imported)))
+        manifest.update(files, skipped_files)
+        text_file.from_string(manifest.to_string())
+        self.report(
+            {"INFO"},
+            "Imported {!s} strips from newly found files. {!s} files changed and {!s} files got "
+            "deleted since the last import.".format(
+                len(imported), len(changed_files), len(deleted_files)
+            ),
+        )
         return {"FINISHED"}
 
-    def get_sequencer_area(self, context):
-        """
-        Returns the sequencer area to use as a context override in
-        some operators
-        """
-        sequencer_area = None
-        for window in context.window_manager.windows:
-            for area in window.screen.areas:
-                if not area.type == "SEQUENCE_EDITOR":
-                    continue
-                sequencer_area = {
-                    "window": window,
-                    "screen": window.screen,
-                    "area": area,
-                    "scene": context.scene,
-                }
-        return sequencer_area
-
-    def find_local_footage_files(self, ignored_directories=["BL_proxy"]):
+    def set_scene_framerate(self, context, filepath):
         """
-        Returns a list of relative filepaths in all subdirectories of the `self.directory`
-        for all valid files that can be imported in the Sequencer
+        Sets the scene's frame rate to the frame rate of the video file, like the add movie strip
+        operator does for the first video it imports
         """
-        files_list = []
-        for root, dirs, files in os.walk(self.directory):
-            for directory in ignored_directories:
-                if directory in dirs:
-                    dirs.remove(directory)
-
-            files = [f for f in sorted(files) if f.lower().endswith(EXTENSIONS_ALL)]
-            files = map(lambda name: os.path.join(root, name), files)
-            files = map(lambda path: os.path.relpath(path, self.directory), files)
-            files_list.extend(list(files))
+        info = self.media_info.get(filepath)
+        fps = info.fps if info else 0.0
+        if not fps:
+            clip = bpy.data.movieclips.load(filepath)
+            fps = clip.fps
+            bpy.data.movieclips.remove(clip)
+        if fps <= 0:
+            return
 
-        return files_list
+        render = context.scene.render
+        render.fps = round(fps)
+        render.fps_base = round(fps) / fps
 
-    def create_import_text_block(self, name):
+    def get_import_text_block(self, name):
         """
-        Creates a new text data block that contains an empty json list, renames it to `name` and
-        returns it
+        Returns the text data block that stores the ImportManifest, creating it if it doesn't exist
         """
-        re.compile(r"^Text.[0-9]{3}$")
-
-        bpy.ops.text.new()
-
-        # Find the newly created text file's identifier
-        ids = [text.name for text in bpy.data.texts if text.name.startswith("Text")]
-        id = max(ids)
-
-        text_file = bpy.data.texts[id]
-        text_file.name = name
-        text_file.from_string("[]")
+        text_file = bpy.data.texts.get(name)
+        if not text_file:
+            text_file = bpy.data.texts.new(name)
+            text_file.from_string(ImportManifest().to_string())
         return text_file
 
-    def find_new_files_to_import(self, filepaths):
+    def set_strip_options(self, strip, prefs):
         """
-        Gets and optionally creates the list of already imported files in this project
-        Returns a list of paths from filepaths that are not in the imported text file
+        Selects a newly imported strip, shows the waveform of sound strips, and sets movie and
+        image strips to use proxies if it's set in the add-on preferences
         """
-        text_file = (
-            bpy.data.texts.get("POWER_SEQUENCER_IMPORTS")
-            if "POWER_SEQUENCER_IMPORTS" in bpy.data.texts.keys()
-            else self.create_import_text_block("POWER_SEQUENCER_IMPORTS")
-        )
-        imported_files = json.loads(text_file.as_string())
-        files_to_import = [p for p in filepaths if p not in imported_files]
-        return files_to_import
-
-    def import_videos(self, context, videos_filepaths):
-        """
-        Imports a list of files using movie_strip_add
-        Returns the list of imported sequences
-        """
-        frame = context.scene.frame_current
-
-        context.window_manager.progress_begin(0, len(videos_filepaths))
-        imported = []
-        for index, f in enumerate(videos_filepaths):
-            is_first_import = index == 0
-            bpy.ops.sequencer.movie_strip_add(
-                self.sequencer_area,
-                filepath=f,
-                frame_start=frame,
-                sound=self.keep_audio,
-                use_framerate=is_first_import,
-            )
-            imported.extend(context.selected_sequences)
-            frame = context.selected_sequences[0].frame_final_end
-            context.window_manager.progress_update(index)
-
-        context.window_manager.progress_end()
-        return imported
-
-    def import_audios(self, context, audio_filepaths):
-        """
-        Imports audio files as sound strips from a list of absolute file paths
-        Returns the list of newly imported audio files
-        """
-        frame = context.scene.frame_current
-        imported = []
-        for f in audio_filepaths:
-            bpy.ops.sequencer.sound_strip_add(self.sequencer_area, filepath=f, frame_start=frame)
-            imported.extend(context.selected_sequences)
-            frame = context.selected_sequences[0].frame_final_end
-        return imported
-
-    def import_imgs(self, context, img_filepaths):
-        frame = context.scene.frame_current
-        strip_length = convert_duration_to_frames(context, self.img_length)
-        strip_padding = convert_duration_to_frames(context, self.img_padding)
-
-        new_sequences = []
-        for f in img_filepaths:
-            head, tail = os.path.split(f)
-            bpy.ops.sequencer.image_strip_add(
-                self.sequencer_area,
-                directory=head,
-                files=[{"name": tail}],
-                frame_start=frame,
-                frame_end=frame + strip_length,
-            )
-            frame += strip_length + strip_padding
-            new_sequences.extend(context.selected_sequences)
-
-        return new_sequences
-
-    def set_selected_strips_proxies(self, context):
-        proxy_sizes = ["25", "50", "75", "100"]
-
-        use_proxy = False
-        prefs = get_preferences(context)
-        for size in proxy_sizes:
-            if hasattr(prefs, "proxy_" + size):
-                use_proxy = True
-                break
-
-        if not use_proxy:
-            return
-
-        for s in [s for s in context.selected_sequences if s.type in ["MOVIE", "IMAGE"]]:
-            s.use_proxy = True
-            s.proxy.build_25 = prefs.proxy_25
-            s.proxy.build_50 = prefs.proxy_50
-            s.proxy.build_75 = prefs.proxy_75
-            s.proxy.build_100 = prefs.proxy_100
+        strip.select = True
+        if strip.type == "SOUND":
+            strip.show_waveform = True
+        elif strip.type in ["MOVIE", "IMAGE"]:
+            proxy_sizes = ["25", "50", "75", "100"]
+            if not any(getattr(prefs, "proxy_" + size) for size in proxy_sizes):
+                return
+            strip.use_proxy = True
+            strip.proxy.build_25 = prefs.proxy_25
+            strip.proxy.build_50 = prefs.proxy_50
+            strip.proxy.build_75 = prefs.proxy_75
+            strip.proxy.build_100 = prefs.proxy_100
@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
 import bpy
-from operator import attrgetter
 
+from .utils.cut_index import get_cut_index, get_marker_frames
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_jump_to_cut(bpy.types.Operator):
@@ -12,7 +13,7 @@ class POWER_SEQUENCER_OT_jump_to_cut(bpy.types.Operator):
 
 
     Jump to the next or the previous cut in the edit.  Unlike Blender's default tool, also
-    works during playback.
+    works during playback. Also jumps to the keyframes of strips and, optionally, to markers
     """
 
     doc = {
@@ -46,67 +47,42 @@ class POWER_SEQUENCER_OT_jump_to_cut(bpy.types.Operator):
             ("LEFT", "Left", "Jump backward in time"),
         ],
     )
+    count: bpy.props.IntProperty(
+        name="Count", description="Number of cuts to jump over", default=1, min=1
+    )
+    include_markers: bpy.props.BoolProperty(
+        name="Include Markers", description="Also jump to timeline markers", default=False
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only jump to the cuts and keyframes of selected strips",
+        default=False,
+    )
+    channel: bpy.props.IntProperty(
+        name="Channel",
+        description="Only jump to the cuts and keyframes of strips in this channel, 0 for all",
+        default=0,
+        min=0,
+    )
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
-        frame_current = context.scene.frame_current
-
-        fcurves = []
-        animation_data = context.scene.animation_data
-        if animation_data and animation_data.action:
-            fcurves = animation_data.action.fcurves
-
-        frame_target = -1
-
-        # First find the closest cut, then if that sequence has an associated
-        # fcurve, loop through the curve's keyframes.
-        if self.direction == "RIGHT":
-            frame_target = 100_000_000
-            for s in context.sequences:
-                if s.frame_final_end <= frame_current:
-                    continue
-
-                candidates = [frame_target, s.frame_final_end]
-                if s.frame_final_start > frame_current:
-                    candidates.append(s.frame_final_start)
-
-                frame_target = min(candidates)
-
-                for f in fcurves:
-                    if s.name not in f.data_path:
-                        continue
-
-                    for k in f.keyframe_points:
-                        frame = k.co[0]
-                        if frame <= frame_current:
-                            continue
-                        frame_target = min(frame_target, frame)
-
-        elif self.direction == "LEFT":
-            for s in context.sequences:
-                if s.frame_final_start >= frame_current:
-                    continue
-
-                candidates = [frame_target, s.frame_final_start]
-                if s.frame_final_end < frame_current:
-                    candidates.append(s.frame_final_end)
-
-                frame_target = max(candidates)
-
-                for f in fcurves:
-                    if s.name not in f.data_path:
-                        continue
-
-                    for k in f.keyframe_points:
-                        frame = k.co[0]
-                        if frame >= frame_current:
-                            continue
-                        frame_target = max(frame_target, frame)
-
-        if frame_target > 0 and frame_target != 100_000_000:
-            context.scene.frame_current = int(frame_target)
-
+        cut_index = get_cut_index(context)
+        snapshot = cut_index.snapshot
+        strips_mask = None
+        if self.selected_only or self.channel > 0:
+            snapshot.update_selection()
+            strips_mask = snapshot.select.copy() if self.selected_only else snapshot.mask_all()
+            if self.channel > 0:
+                strips_mask &= snapshot.channel == self.channel
+        markers = get_marker_frames(context) if self.include_markers else None
+
+        frame_target = cut_index.find(
+            context.scene.frame_current, self.direction, self.count, strips_mask, markers
+        )
+        if frame_target is not None:
+            context.scene.frame_current = frame_target
         return {"FINISHED"}
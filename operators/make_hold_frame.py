@@ -6,6 +6,7 @@ import operator
 from .utils.global_settings import SequenceTypes
 from .utils.functions import convert_duration_to_frames
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import get_active_strip_type
 
 
 class POWER_SEQUENCER_OT_make_hold_frame(bpy.types.Operator):
@@ -37,7 +38,7 @@ class POWER_SEQUENCER_OT_make_hold_frame(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor.active_strip.type in SequenceTypes.VIDEO if context.scene.sequence_editor.active_strip is not None else None
+        return get_active_strip_type(context) in SequenceTypes.VIDEO
 
     def invoke(self, context, event):
         window_manager = context.window_manager
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_markers_create_from_selected_strips(bpy.types.Operator):
@@ -25,7 +26,7 @@ class POWER_SEQUENCER_OT_markers_create_from_selected_strips(bpy.types.Operator)
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         cursor_frame_start = context.scene.frame_current
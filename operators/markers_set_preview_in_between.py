@@ -4,6 +4,7 @@ import bpy
 
 from .utils.functions import find_neighboring_markers
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_sequence_editor
 
 
 class POWER_SEQUENCER_OT_set_preview_between_markers(bpy.types.Operator):
@@ -25,7 +26,7 @@ class POWER_SEQUENCER_OT_set_preview_between_markers(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor
+        return has_sequence_editor(context)
 
     def invoke(self, context, event):
         if not context.scene.timeline_markers:
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.strip_move import move_strips
 
 
 class POWER_SEQUENCER_OT_markers_snap_matching_strips(bpy.types.Operator):
@@ -29,8 +30,10 @@ class POWER_SEQUENCER_OT_markers_snap_matching_strips(bpy.types.Operator):
     def execute(self, context):
         timeline_markers = context.scene.timeline_markers
 
+        offsets = {}
         for strip in context.selected_sequences:
             for marker in timeline_markers:
                 if marker.name in strip.name:
-                    strip.frame_start = marker.frame - strip.frame_offset_start
+                    offsets[strip] = (marker.frame - strip.frame_final_start, 0)
+        move_strips(context, offsets)
         return {"FINISHED"}
@@ -4,6 +4,7 @@ import bpy
 from .utils.functions import get_frame_range
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_meta_resize_to_content(bpy.types.Operator):
@@ -28,7 +29,7 @@ class POWER_SEQUENCER_OT_meta_resize_to_content(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         selected_meta_strips = (s for s in context.selected_sequences if s.type == "META")
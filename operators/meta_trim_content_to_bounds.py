@@ -4,6 +4,7 @@ import bpy
 from .utils.global_settings import SequenceTypes
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_meta_trim_content_to_bounds(bpy.types.Operator):
@@ -25,7 +26,7 @@ class POWER_SEQUENCER_OT_meta_trim_content_to_bounds(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         to_delete = []
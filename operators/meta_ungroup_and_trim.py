@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_meta_ungroup_and_trim(bpy.types.Operator):
@@ -30,7 +31,7 @@ class POWER_SEQUENCER_OT_meta_ungroup_and_trim(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         meta_strips = [s for s in context.selected_sequences if s.type == "META"]
@@ -6,6 +6,7 @@ from math import floor
 
 from .utils.functions import find_strips_mouse
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_mouse_toggle_mute(bpy.types.Operator):
@@ -29,7 +30,7 @@ class POWER_SEQUENCER_OT_mouse_toggle_mute(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         sequencer = bpy.ops.sequencer
@@ -7,6 +7,7 @@ from .utils.functions import find_strips_mouse
 from .utils.functions import trim_strips
 from .utils.functions import get_frame_range
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_mouse_trim_instantly(bpy.types.Operator):
@@ -66,7 +67,7 @@ class POWER_SEQUENCER_OT_mouse_trim_instantly(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         to_trim = []
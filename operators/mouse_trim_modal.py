@@ -12,16 +12,12 @@ from .utils.functions import (
     find_snap_candidate,
     find_closest_surrounding_cuts,
 )
+from .utils.strip_cut import apply_cuts
+from .utils.strip_index import get_strip_index
 
-from .utils.draw import (
-    draw_line,
-    draw_rectangle,
-    draw_triangle_equilateral,
-    draw_arrow_head,
-    get_color_gizmo_primary,
-    get_color_gizmo_secondary,
-)
+from .utils.draw import DrawList, get_color_gizmo_primary
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 if not bpy.app.background:
     SHADER = gpu.shader.from_builtin("2D_UNIFORM_COLOR")
@@ -116,8 +112,9 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
     trim_side = "end"
 
     mouse_start_y = -1.0
+    playhead = 0
 
-    draw_handler = None
+    overlay = None
 
     use_audio_scrub = False
 
@@ -130,7 +127,7 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         if context.screen.is_animation_playing:
@@ -140,17 +137,20 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
         context.scene.use_audio_scrub = False
 
         self.mouse_start_y = event.mouse_region_y
+        # The operator moves the time cursor, so we snap to where it was when it started
+        self.playhead = context.scene.frame_current
 
         self.trim_initialize(context, event)
         self.update_frame(context, event)
-        self.draw_start(context, event)
+        self.overlay = TrimOverlay(self)
+        self.overlay.start()
+        self.overlay.update(context)
         self.update_header_text(context, event)
 
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
     def modal(self, context, event):
-
         if event.type == self.event_change_side and event.value == "PRESS":
             self.trim_side = "start" if self.trim_side == "end" else "end"
 
@@ -161,54 +161,42 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
             self.select_mode = "CONTEXT" if self.select_mode == "CURSOR" else "CURSOR"
 
         if event.type in {"ESC"}:
-            self.draw_stop()
+            self.overlay.stop()
             context.scene.use_audio_scrub = self.use_audio_scrub
             return {"FINISHED"}
 
         # Start and end trim
         if event.type == "LEFTMOUSE" or (event.type in ["RET", "T"] and event.value == "PRESS"):
             self.trim_apply(context, event)
-            self.draw_stop()
+            self.overlay.stop()
             context.scene.use_audio_scrub = self.use_audio_scrub
             return {"FINISHED"}
 
         # Update trim
         if event.type == "MOUSEMOVE":
-            self.draw_stop()
             self.update_frame(context, event)
-            self.draw_start(context, event)
+            self.overlay.update(context)
             self.update_header_text(context, event)
             return {"PASS_THROUGH"}
 
+        self.overlay.update(context)
         return {"RUNNING_MODAL"}
 
     def trim_initialize(self, context, event):
         frame, self.channel_start = get_frame_and_channel(event)
-        self.trim_start = find_snap_candidate(context, frame) if event.ctrl else frame
+        self.trim_start = (
+            find_snap_candidate(context, frame, self.playhead) if event.ctrl else frame
+        )
         self.trim_end, self.channel_end = self.trim_start, self.channel_start
         self.is_trimming = True
 
     def update_frame(self, context, event):
         frame, channel = get_frame_and_channel(event)
-        frame_trim = find_snap_candidate(context, frame) if event.ctrl else frame
+        frame_trim = find_snap_candidate(context, frame, self.playhead) if event.ctrl else frame
         setattr(self, "channel_" + self.trim_side, channel)
         setattr(self, "trim_" + self.trim_side, frame_trim)
         context.scene.frame_current = getattr(self, "trim_" + self.trim_side)
 
-    def draw_start(self, context, event):
-        """Initializes the drawing handler, see draw()"""
-        to_trim, to_delete = self.find_strips_to_trim(context)
-        target_strips = to_trim + to_delete
-
-        draw_args = (self, context, self.trim_start, self.trim_end, target_strips, self.gap_remove)
-        self.draw_handler = bpy.types.SpaceSequenceEditor.draw_handler_add(
-            draw, draw_args, "WINDOW", "POST_PIXEL"
-        )
-
-    def draw_stop(self):
-        if self.draw_handler:
-            bpy.types.SpaceSequenceEditor.draw_handler_remove(self.draw_handler, "WINDOW")
-
     def update_header_text(self, context, event):
         text = (
             "Trim from {} to {}".format(self.trim_start, self.trim_end)
@@ -251,10 +239,8 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
         if len(to_cut) == 0:
             bpy.ops.power_sequencer.gap_remove()
         else:
-            frame_current = context.scene.frame_current
-            context.scene.frame_current = self.trim_start
-            bpy.ops.sequencer.split(frame=context.scene.frame_current, type="SOFT", side="BOTH")
-            context.scene.frame_current = frame_current
+            for s in apply_cuts(context, cuts=[(self.trim_start, None)], sequences=to_cut):
+                s.select = True
 
     def find_strips_to_cut(self, context):
         """
@@ -272,8 +258,8 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
         ):
             to_cut = [
                 s
-                for s in context.sequences
-                if not s.lock and s.frame_final_start <= self.trim_start <= s.frame_final_end
+                for s in get_strip_index(context).find_at_frame(self.trim_start)
+                if not s.lock
             ]
         return to_cut
 
@@ -297,85 +283,127 @@ class POWER_SEQUENCER_OT_mouse_trim(bpy.types.Operator):
         trim_start = min(self.trim_start, self.trim_end)
         trim_end = max(self.trim_start, self.trim_end)
 
-        channel_min = min(self.channel_start, self.channel_end)
-        channel_max = max(self.channel_start, self.channel_end)
-        channels = set(range(channel_min, channel_max + 1))
+        channels = None
+        if self.select_mode == "CONTEXT":
+            channel_min = min(self.channel_start, self.channel_end)
+            channel_max = max(self.channel_start, self.channel_end)
+            channels = range(channel_min, channel_max + 1)
 
-        for s in context.sequences:
+        # Strips that overlap the range either lie inside it or contain one of its ends
+        for s in get_strip_index(context).find_overlapping(trim_start, trim_end, channels):
             if s.lock:
                 continue
-            if self.select_mode == "CONTEXT" and s.channel not in channels:
-                continue
-
             if trim_start <= s.frame_final_start and trim_end >= s.frame_final_end:
                 to_delete.append(s)
-                continue
-            if (
-                s.frame_final_start <= trim_start <= s.frame_final_end
-                or s.frame_final_start <= trim_end <= s.frame_final_end
-            ):
+            else:
                 to_trim.append(s)
 
         return to_trim, to_delete
 
 
-def draw(self, context, frame_start=-1, frame_end=-1, target_strips=[], draw_arrows=False):
+class TrimOverlay:
     """
-    Draws the line and arrows that represent the trim
-
-    Params:
-    - start_x and end_x are Vector(), the start_x and end_x of the drawn trim line's vertices in region coordinates
+    Draws the trim range and the strips it affects with a single draw handler for the whole
+    operation. Finds the strips to trim only when the trim range, channels, or options change, and
+    its DrawList reuses the GPU batches until the drawn rectangle moves on screen.
     """
-    view_to_region = context.region.view2d.view_to_region
-
-    # Detect and draw the gap's limits if not trimming any strips
-    if not target_strips:
-        strip_before, strip_after = find_closest_surrounding_cuts(context, frame_end)
-        frame_start = strip_before.frame_final_end
-        frame_end = strip_after.frame_final_start
-        channels = [strip_before.channel, strip_after.channel]
-    else:
-        channels = {s.channel for s in target_strips}
-
-    start_x, start_y = view_to_region(
-        min(frame_start, frame_end), math.floor(min(channels)), clip=False
-    )
-    end_x, end_y = view_to_region(
-        max(frame_start, frame_end), math.floor(max(channels) + 1), clip=False
-    )
 
-    start_x = max(start_x, context.region.x)
-    start_y = max(start_y, context.region.y)
-
-    end_x = min(end_x, context.region.x + context.region.width)
-    end_y = min(end_y, context.region.y + context.region.height)
-
-    # Draw
-    color_line = get_color_gizmo_primary(context)
-    color_fill = color_line.copy()
-    color_fill[-1] = 0.3
-
-    rect_origin = Vector((start_x, start_y))
-    rect_size = Vector((end_x - start_x, abs(start_y - end_y)))
-
-    bgl.glEnable(bgl.GL_BLEND)
-    bgl.glLineWidth(3)
-    draw_rectangle(SHADER, rect_origin, rect_size, color_fill)
-    # Vertical lines
-    draw_line(SHADER, Vector((start_x, start_y)), Vector((start_x, end_y)), color_line)
-    draw_line(SHADER, Vector((end_x, start_y)), Vector((end_x, end_y)), color_line)
-
-    offset = 20.0
-    radius = 12.0
-    if draw_arrows and end_x - start_x > 2 * offset + radius:
-        center_y = (end_y + start_y) / 2.0
-        center_1 = Vector((start_x + offset, center_y))
-        center_2 = Vector((end_x - offset, center_y))
-        draw_triangle_equilateral(SHADER, center_1, radius, color=color_line)
-        draw_triangle_equilateral(SHADER, center_2, radius, math.pi, color=color_line)
-
-    bgl.glLineWidth(1)
-    bgl.glDisable(bgl.GL_BLEND)
+    ARROW_OFFSET = 20.0
+    ARROW_RADIUS = 12.0
+
+    def __init__(self, operator):
+        self.operator = operator
+        self.handler = None
+        self.state = None
+        # Trim rectangle in view space: frame_start, channel_start, frame_end, channel_end
+        self.view_rect = None
+        self.draw_arrows = False
+        self.color_line = None
+        self.color_fill = None
+        self.draw_list = DrawList()
+
+    def start(self):
+        self.handler = bpy.types.SpaceSequenceEditor.draw_handler_add(
+            self.draw, (), "WINDOW", "POST_PIXEL"
+        )
+
+    def stop(self):
+        if self.handler:
+            bpy.types.SpaceSequenceEditor.draw_handler_remove(self.handler, "WINDOW")
+            self.handler = None
+
+    def update(self, context):
+        """Finds the strips to trim and the rectangle to draw if the operator's state changed"""
+        op = self.operator
+        state = (
+            op.trim_start,
+            op.trim_end,
+            op.channel_start,
+            op.channel_end,
+            op.select_mode,
+            op.gap_remove,
+        )
+        if state == self.state:
+            return
+        self.state = state
+
+        to_trim, to_delete = op.find_strips_to_trim(context)
+        target_strips = to_trim + to_delete
+        frame_start, frame_end = op.trim_start, op.trim_end
+        # Detect and draw the gap's limits if not trimming any strips
+        if not target_strips:
+            strip_before, strip_after = find_closest_surrounding_cuts(context, frame_end)
+            frame_start = strip_before.frame_final_end
+            frame_end = strip_after.frame_final_start
+            channels = [strip_before.channel, strip_after.channel]
+        else:
+            channels = [s.channel for s in target_strips]
+
+        self.view_rect = (
+            min(frame_start, frame_end),
+            math.floor(min(channels)),
+            max(frame_start, frame_end),
+            math.floor(max(channels) + 1),
+        )
+        self.draw_arrows = op.gap_remove
+        self.color_line = get_color_gizmo_primary(context)
+        self.color_fill = self.color_line.copy()
+        self.color_fill[-1] = 0.3
+        context.area.tag_redraw()
+
+    def draw(self):
+        region = bpy.context.region
+        view_to_region = region.view2d.view_to_region
+        frame_start, channel_start, frame_end, channel_end = self.view_rect
+        start_x, start_y = view_to_region(frame_start, channel_start, clip=False)
+        end_x, end_y = view_to_region(frame_end, channel_end, clip=False)
+
+        start_x = max(start_x, region.x)
+        start_y = max(start_y, region.y)
+        end_x = min(end_x, region.x + region.width)
+        end_y = min(end_y, region.y + region.height)
+
+        draw_list = self.draw_list
+        draw_list.add_rectangle(
+            (start_x, start_y), (end_x - start_x, abs(end_y - start_y)), self.color_fill
+        )
+        # Vertical lines
+        draw_list.add_line((start_x, start_y), (start_x, end_y), self.color_line)
+        draw_list.add_line((end_x, start_y), (end_x, end_y), self.color_line)
+
+        offset, radius = self.ARROW_OFFSET, self.ARROW_RADIUS
+        if self.draw_arrows and end_x - start_x > 2 * offset + radius:
+            center_y = (end_y + start_y) / 2.0
+            center_1 = Vector((start_x + offset, center_y))
+            center_2 = Vector((end_x - offset, center_y))
+            draw_list.add_triangle_equilateral(center_1, radius, color=self.color_line)
+            draw_list.add_triangle_equilateral(center_2, radius, math.pi, self.color_line)
+
+        bgl.glEnable(bgl.GL_BLEND)
+        bgl.glLineWidth(3)
+        draw_list.flush(SHADER)
+        bgl.glLineWidth(1)
+        bgl.glDisable(bgl.GL_BLEND)
 
 
 def get_frame_and_channel(event):
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_playback_speed_set(bpy.types.Operator):
@@ -39,7 +40,7 @@ class POWER_SEQUENCER_OT_playback_speed_set(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         context.scene.power_sequencer.playback_speed = self.speed
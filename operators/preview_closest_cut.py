@@ -6,6 +6,7 @@ from .utils.functions import get_frame_range
 from .utils.functions import set_preview_range
 from .utils.functions import convert_duration_to_frames
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_preview_closest_cut(bpy.types.Operator):
@@ -45,7 +46,7 @@ class POWER_SEQUENCER_OT_preview_closest_cut(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         scene = context.scene
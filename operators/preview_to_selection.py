@@ -5,6 +5,7 @@ import bpy
 from .utils.functions import get_frame_range
 from .utils.functions import set_preview_range
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_preview_to_selection(bpy.types.Operator):
@@ -32,7 +33,7 @@ class POWER_SEQUENCER_OT_preview_to_selection(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         sequences = (
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.profiler import get_profiler
+
+
+class POWER_SEQUENCER_OT_profiler_clear(bpy.types.Operator):
+    """
+    *brief* Deletes the operator calls the profiler recorded
+
+    Empties the profiler's buffer, to measure a new series of operations from scratch.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    @classmethod
+    def poll(cls, context):
+        return len(get_profiler().events) > 0
+
+    def execute(self, context):
+        get_profiler().clear()
+        return {"FINISHED"}
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import os
+
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.profiler import get_profiler
+
+
+class POWER_SEQUENCER_OT_profiler_export(bpy.types.Operator):
+    """
+    *brief* Saves the operator calls the profiler recorded as a Chrome trace file
+
+    Writes the profiler's events to a JSON file in the Chrome trace event format. Open it in
+    chrome://tracing or https://ui.perfetto.dev to see the duration of each operator call and the
+    calls nested in it, or attach it to a performance bug report. Turn on Profile Operators in the
+    add-on's preferences to record calls.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"REGISTER"}
+
+    filepath: bpy.props.StringProperty(
+        name="File Path", description="Path of the trace file to write", subtype="FILE_PATH"
+    )
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        return len(get_profiler().events) > 0
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            directory = os.path.dirname(bpy.data.filepath) if bpy.data.is_saved else ""
+            self.filepath = os.path.join(directory, "power_sequencer_trace.json")
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        filepath = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+        profiler = get_profiler()
+        try:
+            profiler.export_chrome_trace(filepath)
+        except OSError as error:
+            self.report({"ERROR"}, "Couldn't write the trace file: {}".format(error))
+            return {"CANCELLED"}
+        self.report({"INFO"}, "Saved {} events to {}".format(len(profiler.events), filepath))
+        return {"FINISHED"}
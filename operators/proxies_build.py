@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
+from .utils.proxy_builder import build_proxies
+
+
+class POWER_SEQUENCER_OT_proxies_build(bpy.types.Operator):
+    """
+    *brief* Builds proxies of movie strips with ffmpeg, in parallel
+
+    Encodes the proxies of the selected movie strips, or of all movie strips if none is selected,
+    for the proxy sizes set in the add-on preferences. Uses the ffmpeg executable from the
+    preferences or from your system's PATH, and runs several encodes at once.
+
+    The build runs in the background: you can keep editing, and follow or cancel it from the status
+    bar or the Background Tasks panel. It skips proxies that are more recent than their source
+    file, so you can run it again later to resume a cancelled build.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"REGISTER"}
+
+    max_workers: bpy.props.IntProperty(
+        name="Parallel Encodes",
+        description="Maximum number of ffmpeg processes to run at once, 0 to use half the CPUs",
+        default=0,
+        min=0,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return has_strips(context)
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        strips = [s for s in context.selected_sequences or context.sequences if s.type == "MOVIE"]
+        report_type, message = build_proxies(context, strips, self.max_workers)
+        self.report({report_type}, message)
+        return {"CANCELLED"} if report_type == "ERROR" else {"FINISHED"}
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import sqlite3
+
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_sequence_editor
+from .utils.proxy_builder import build_proxies
+from .utils.proxy_storage import find_missing_proxies, update_proxy_storage
+from ..addon_preferences import get_preferences
+
+
+class POWER_SEQUENCER_OT_proxies_manage(bpy.types.Operator):
+    """
+    *brief* Frees disk space used by old proxies and rebuilds missing ones
+
+    Records the proxies the open scenes use, then deletes the least recently used proxies of
+    media that no open scene references, until proxies fit in the disk budget set in the add-on
+    preferences. The add-on also does this when you open or save a file.
+
+    With Rebuild Missing, builds the proxies of strips in the current scene that got deleted.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"REGISTER"}
+
+    rebuild_missing: bpy.props.BoolProperty(
+        name="Rebuild Missing",
+        description="Build the missing proxies of strips in the current scene",
+        default=True,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return has_sequence_editor(context)
+
+    def execute(self, context):
+        budget_gb = get_preferences(context).proxy_disk_budget
+        try:
+            evicted, total_size = update_proxy_storage(budget_gb)
+        except sqlite3.OperationalError:
+            self.report({"WARNING"}, "The proxy database is busy, please try again in a moment")
+            return {"CANCELLED"}
+        self.report(
+            {"INFO"},
+            "Deleted {} proxies, proxies use {:.2f} GB".format(
+                len(evicted), total_size / 1024**3
+            ),
+        )
+
+        missing = find_missing_proxies(context) if self.rebuild_missing else []
+        if missing:
+            report_type, message = build_proxies(context, missing)
+            self.report({report_type}, message)
+        return {"FINISHED"}
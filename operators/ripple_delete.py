@@ -3,11 +3,12 @@
 import bpy
 
 from .utils.doc import doc_brief, doc_description, doc_idname, doc_name
+from .utils.poll import has_strips
 from .utils.functions import (
     get_frame_range,
     get_mouse_frame_and_channel,
     slice_selection,
-    ripple_move,
+    ripple_move_blocks,
 )
 
 
@@ -30,7 +31,7 @@ class POWER_SEQUENCER_OT_ripple_delete(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         # Auto select if no strip selected
@@ -55,11 +56,11 @@ class POWER_SEQUENCER_OT_ripple_delete(bpy.types.Operator):
 
         is_single_channel = len(channels) == 1
         if is_single_channel:
-            for block in selection_blocks:
-                delete_start = block[0].frame_final_start
-                delete_end = block[-1].frame_final_end
-                ripple_duration = abs(delete_end - delete_start)
-                ripple_move(context, block, -ripple_duration, delete=True)
+            blocks = [
+                (block, -abs(block[-1].frame_final_end - block[0].frame_final_start))
+                for block in selection_blocks
+            ]
+            ripple_move_blocks(context, blocks, delete=True)
 
         else:
             cursor_frame = scene.frame_current
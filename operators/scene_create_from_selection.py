@@ -4,6 +4,7 @@ import bpy
 from operator import attrgetter
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_scene_create_from_selection(bpy.types.Operator):
@@ -35,7 +36,7 @@ class POWER_SEQUENCER_OT_scene_create_from_selection(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         start_scene_name = context.scene.name
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import get_active_strip_type
 
 
 class POWER_SEQUENCER_OT_merge_from_scene_strip(bpy.types.Operator):
@@ -34,7 +35,7 @@ class POWER_SEQUENCER_OT_merge_from_scene_strip(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor.active_strip
+        return get_active_strip_type(context) is not None
 
     def invoke(self, context, event):
         window_manager = context.window_manager
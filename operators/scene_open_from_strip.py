@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import get_active_strip_type
 
 
 class POWER_SEQUENCER_OT_open_scene_strip(bpy.types.Operator):
@@ -27,7 +28,7 @@ class POWER_SEQUENCER_OT_open_scene_strip(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor.active_strip
+        return get_active_strip_type(context) is not None
 
     def execute(self, context):
         active_strip = context.scene.sequence_editor.active_strip
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_scene_rename_with_strip(bpy.types.Operator):
@@ -31,7 +32,7 @@ class POWER_SEQUENCER_OT_scene_rename_with_strip(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def invoke(self, context, event):
         window_manager = context.window_manager
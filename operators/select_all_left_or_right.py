@@ -3,6 +3,8 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
+from .utils.strip_snapshot import get_strip_snapshot
 
 
 class POWER_SEQUENCER_OT_select_all_left_or_right(bpy.types.Operator):
@@ -45,13 +47,12 @@ class POWER_SEQUENCER_OT_select_all_left_or_right(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
+        snapshot = get_strip_snapshot(context)
         if self.side == "LEFT":
-            for s in context.sequences:
-                s.select = s.frame_final_end < context.scene.frame_current
+            snapshot.set_selection(snapshot.mask_ends_before(context.scene.frame_current))
         else:
-            for s in context.sequences:
-                s.select = s.frame_final_start > context.scene.frame_current
+            snapshot.set_selection(snapshot.mask_starts_after(context.scene.frame_current))
         return {"FINISHED"}
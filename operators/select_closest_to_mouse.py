@@ -3,8 +3,9 @@
 import bpy
 
 from .utils.functions import find_strips_mouse
-from .utils.functions import get_mouse_frame_and_channel
+from .utils.hit_test import ViewTransform
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_select_closest_to_mouse(bpy.types.Operator):
@@ -29,10 +30,12 @@ class POWER_SEQUENCER_OT_select_closest_to_mouse(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
-        self.frame, self.channel = get_mouse_frame_and_channel(context, event)
+        self.frame, self.channel = ViewTransform(context.region).to_frame_and_channel(
+            event.mouse_region_x, event.mouse_region_y
+        )
         return self.execute(context)
 
     def execute(self, context):
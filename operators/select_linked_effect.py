@@ -4,6 +4,7 @@ import bpy
 
 from .utils.functions import find_linked
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_select_linked_effect(bpy.types.Operator):
@@ -25,7 +26,7 @@ class POWER_SEQUENCER_OT_select_linked_effect(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         for s in find_linked(context, context.sequences, context.selected_sequences):
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_sequence_editor
 
 
 class POWER_SEQUENCER_OT_select_linked_strips(bpy.types.Operator):
@@ -25,7 +26,7 @@ class POWER_SEQUENCER_OT_select_linked_strips(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor
+        return has_sequence_editor(context)
 
     def execute(self, context):
         # save current selection first
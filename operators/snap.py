@@ -4,6 +4,7 @@ import bpy
 
 from .utils.functions import get_sequences_under_cursor
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_snap(bpy.types.Operator):
@@ -33,7 +34,7 @@ class POWER_SEQUENCER_OT_snap(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         sequences = (
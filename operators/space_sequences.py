@@ -4,7 +4,9 @@ import bpy
 
 from .utils.functions import convert_duration_to_frames
 from .utils.global_settings import SequenceTypes
+from .utils.strip_move import move_strips
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_space_sequences(bpy.types.Operator):
@@ -30,7 +32,7 @@ class POWER_SEQUENCER_OT_space_sequences(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         sequences = [
@@ -42,9 +44,7 @@ class POWER_SEQUENCER_OT_space_sequences(bpy.types.Operator):
         ]
 
         gap_frames = convert_duration_to_frames(context, self.gap_to_insert)
-        sorted_sequences = sorted(sequences, key=lambda s: s.frame_final_start, reverse=True)
-        for s in sorted_sequences:
-            s.frame_start += gap_frames
+        move_strips(context, {s: (gap_frames, 0) for s in sequences})
 
         markers = context.scene.timeline_markers
         for m in [m for m in markers if m.frame >= context.scene.frame_current]:
@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import get_active_strip_type
 
 
 class POWER_SEQUENCER_OT_speed_remove_effect(bpy.types.Operator):
@@ -28,7 +29,7 @@ class POWER_SEQUENCER_OT_speed_remove_effect(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor.active_strip.type == "META" if context.scene.sequence_editor.active_strip is not None else None
+        return get_active_strip_type(context) == "META"
 
     def execute(self, context):
         active = context.scene.sequence_editor.active_strip
@@ -6,6 +6,7 @@ from math import ceil
 from .utils.global_settings import SequenceTypes
 from .utils.functions import slice_selection
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_speed_up_movie_strip(bpy.types.Operator):
@@ -55,7 +56,7 @@ class POWER_SEQUENCER_OT_speed_up_movie_strip(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         sequences = [s for s in context.selected_sequences if s.type in SequenceTypes.VIDEO]
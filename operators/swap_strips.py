@@ -4,6 +4,8 @@ import bpy
 from operator import attrgetter
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
+from .utils.effect_graph import get_effect_graph
 
 
 class POWER_SEQUENCER_OT_swap_strips(bpy.types.Operator):
@@ -40,7 +42,7 @@ class POWER_SEQUENCER_OT_swap_strips(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         if len(context.selected_sequences) != 2:
@@ -56,7 +58,7 @@ class POWER_SEQUENCER_OT_swap_strips(bpy.types.Operator):
 
         # Swap a strip and one of its effects
         if hasattr(strip_1, "input_1") or hasattr(strip_2, "input_1"):
-            if not self.are_linked(strip_1, strip_2):
+            if not self.are_linked(context, strip_1, strip_2):
                 return {"CANCELLED"}
             self.swap_with_effect(strip_1, strip_2)
             return {"FINISHED"}
@@ -218,11 +220,11 @@ class POWER_SEQUENCER_OT_swap_strips(bpy.types.Operator):
                 return
             return max(strips_below, key=attrgetter("channel"))
 
-    def are_linked(self, strip_1, strip_2):
-        return (
-            strip_1.frame_final_start == strip_2.frame_final_start
-            and strip_1.frame_final_end == strip_2.frame_final_end
-        )
+    def are_linked(self, context, strip_1, strip_2):
+        """
+        Returns True if one of the strips is an effect applied to the other
+        """
+        return get_effect_graph(context).are_linked(strip_1, strip_2)
 
     def swap_with_effect(self, strip_1, strip_2):
         effect_strip = strip_1 if hasattr(strip_1, "input_1") else strip_2
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.tasks import cancel_all_tasks, find_task
+
+
+class POWER_SEQUENCER_OT_task_cancel(bpy.types.Operator):
+    """
+    *brief* Cancels a background task, like a proxy build
+
+    Stops the task with the given id, or all running tasks if the id is 0.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    task_id: bpy.props.IntProperty(
+        name="Task ID", description="Id of the task to cancel, 0 to cancel all tasks", default=0
+    )
+
+    def execute(self, context):
+        if self.task_id == 0:
+            cancel_all_tasks()
+            return {"FINISHED"}
+
+        task = find_task(self.task_id)
+        if not task:
+            return {"CANCELLED"}
+        task.cancel()
+        self.report({"WARNING"}, "Cancelled {}".format(task.name))
+        return {"FINISHED"}
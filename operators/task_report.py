@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+
+
+class POWER_SEQUENCER_OT_task_report(bpy.types.Operator):
+    """
+    *brief* Shows the result of a background task in the status bar
+
+    Background tasks, like proxy builds, end in a timer, which can't report messages to the user.
+    They call this operator to report them instead.
+    """
+
+    doc = {
+        "name": doc_name(__qualname__),
+        "demo": "",
+        "description": doc_description(__doc__),
+        "shortcuts": [],
+        "keymap": "Sequencer",
+    }
+    bl_idname = doc_idname(__qualname__)
+    bl_label = doc["name"]
+    bl_description = doc_brief(doc["description"])
+    bl_options = {"INTERNAL"}
+
+    report_type: bpy.props.EnumProperty(
+        items=[("INFO", "Info", ""), ("WARNING", "Warning", "")], name="Type", default="INFO"
+    )
+    message: bpy.props.StringProperty(name="Message", default="")
+
+    def execute(self, context):
+        self.report({self.report_type}, self.message)
+        return {"FINISHED"}
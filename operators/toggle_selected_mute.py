@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_toggle_selected_mute(bpy.types.Operator):
@@ -39,7 +40,7 @@ class POWER_SEQUENCER_OT_toggle_selected_mute(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         selection = context.selected_sequences
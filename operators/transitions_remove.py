@@ -5,6 +5,7 @@ from operator import attrgetter
 
 from .utils.global_settings import SequenceTypes
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_selected_strips
 
 
 class POWER_SEQUENCER_OT_transitions_remove(bpy.types.Operator):
@@ -28,7 +29,7 @@ class POWER_SEQUENCER_OT_transitions_remove(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def execute(self, context):
         to_process = (
@@ -5,6 +5,7 @@ from operator import attrgetter
 import bpy
 
 from .utils.doc import doc_brief, doc_description, doc_idname, doc_name
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_trim_left_or_right_handles(bpy.types.Operator):
@@ -58,7 +59,7 @@ class POWER_SEQUENCER_OT_trim_left_or_right_handles(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def execute(self, context):
         frame_current = context.scene.frame_current
@@ -4,6 +4,7 @@ import bpy
 
 from .utils.functions import get_mouse_frame_and_channel
 from .utils.doc import doc_name, doc_idname, doc_brief, doc_description
+from .utils.poll import has_strips
 
 
 class POWER_SEQUENCER_OT_trim_three_point_edit(bpy.types.Operator):
@@ -35,7 +36,7 @@ class POWER_SEQUENCER_OT_trim_three_point_edit(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.sequences
+        return has_strips(context)
 
     def invoke(self, context, event):
         frame, channel = get_mouse_frame_and_channel(context, event)
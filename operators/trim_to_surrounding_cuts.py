@@ -73,9 +73,7 @@ class POWER_SEQUENCER_OT_trim_to_surrounding_cuts(bpy.types.Operator):
             )
             return {"CANCELLED"}
 
-        to_delete, to_trim = find_strips_in_range(
-            left_cut_frame, right_cut_frame, context.sequences
-        )
+        to_delete, to_trim = find_strips_in_range(left_cut_frame, right_cut_frame)
         trim_start, trim_end = (left_cut_frame + margin_frame, right_cut_frame - margin_frame)
 
         trim_strips(context, trim_start, trim_end, to_trim, to_delete)
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Caches for data computed from the strips in the Sequencer and from their animation.
+
+The add-on's handlers call invalidate() when Blender updates the scene, and helpers that edit
+strips directly call it too. Cached values get rebuilt lazily the next time an operator needs them.
+"""
+_caches = []
+
+
+def invalidate():
+    """Clears all the caches. Call it after editing strips directly, without Blender's operators"""
+    for cache in _caches:
+        cache.clear()
+
+
+def get_sequences_collection(context):
+    """
+    Returns the collection of strips that backs `context.sequences`: the sequences of the meta strip
+    being edited or the top-level sequences of the scene.
+    Returns None if the scene has no sequence editor.
+    """
+    sequence_editor = context.scene.sequence_editor
+    if not sequence_editor:
+        return None
+    meta_stack = sequence_editor.meta_stack
+    return meta_stack[-1].sequences if meta_stack else sequence_editor.sequences
+
+
+def get_editing_level_key(context):
+    """
+    Returns a hashable key identifying the scene and the meta strip the user is editing
+    """
+    scene = context.scene
+    sequence_editor = scene.sequence_editor
+    meta_path = tuple(m.as_pointer() for m in sequence_editor.meta_stack) if sequence_editor else ()
+    return scene.as_pointer(), meta_path
+
+
+class SequencerCache:
+    """
+    Stores one value per scene and editing level, computed by calling `build(context)`.
+    The value is rebuilt after a call to invalidate() or if the number of strips changed.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self._entries = {}
+        _caches.append(self)
+
+    def get(self, context):
+        key = get_editing_level_key(context)
+        collection = get_sequences_collection(context)
+        strips_count = len(collection) if collection is not None else 0
+
+        entry = self._entries.get(key)
+        if entry and entry[0] == strips_count:
+            return entry[1]
+
+        value = self.build(context)
+        self._entries[key] = (strips_count, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+class ActionCache:
+    """
+    Stores one value per action, computed by calling `build(action)`.
+    The value is rebuilt after a call to invalidate() or if the number of fcurves changed.
+    Values that stay up to date as fcurves get created or removed can have a `fcurves_count`
+    attribute: the cache then compares it to the action's instead of the count at build time.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self._entries = {}
+        _caches.append(self)
+
+    def get(self, action):
+        key = action.as_pointer()
+        fcurves_count = len(action.fcurves)
+
+        entry = self._entries.get(key)
+        if entry and getattr(entry[1], "fcurves_count", entry[0]) == fcurves_count:
+            return entry[1]
+
+        value = self.build(action)
+        self._entries[key] = (fcurves_count, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Ordered lists of the strips in each channel, stored as links between the strips' indices in a
+StripSnapshot. Going from a strip to the next or previous strip in its channel costs O(1), so
+operators that ripple or concatenate strips only visit the strips they move.
+See get_channel_links().
+"""
+import numpy as np
+
+from .cache import SequencerCache
+from .strip_snapshot import get_strip_snapshot
+
+
+class ChannelLinks:
+    """
+    Successor and predecessor of each strip of `snapshot` in its channel, by frame_final_start.
+    `next[i]` and `previous[i]` are snapshot indices, or -1 at the ends of a channel.
+    Ripples and concatenations don't change the order of strips in a channel: during a batch edit,
+    call offset() with the planned moves and unlink() with the strips to delete to keep the links
+    up to date before writing the changes, see ripple_move_blocks(). Do it on a copy(), as the
+    cached links must keep matching the strips until the edit invalidates the cache.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.frame_final_start = snapshot.frame_final_start.astype(np.int64)
+        self.frame_final_end = snapshot.frame_final_end.astype(np.int64)
+        self.next = np.full(snapshot.count, -1, dtype=np.int64)
+        self.previous = np.full(snapshot.count, -1, dtype=np.int64)
+        # Maps each channel to the index of its first strip
+        self.heads = {}
+        if not snapshot.count:
+            return
+
+        order = np.lexsort((self.frame_final_start, snapshot.channel))
+        channels = snapshot.channel[order]
+        is_same_channel = channels[1:] == channels[:-1]
+        self.next[order[:-1][is_same_channel]] = order[1:][is_same_channel]
+        self.previous[order[1:][is_same_channel]] = order[:-1][is_same_channel]
+
+        is_head = np.ones(snapshot.count, dtype=bool)
+        is_head[1:] = ~is_same_channel
+        self.heads = dict(zip(channels[is_head].tolist(), order[is_head].tolist()))
+
+    def copy(self):
+        """Returns a copy of the links that shares the snapshot"""
+        links = ChannelLinks.__new__(ChannelLinks)
+        links.snapshot = self.snapshot
+        links.heads = dict(self.heads)
+        for name in ("frame_final_start", "frame_final_end", "next", "previous"):
+            setattr(links, name, getattr(self, name).copy())
+        return links
+
+    def get_index(self, strip):
+        return self.snapshot.get_index(strip)
+
+    def iter_after(self, index):
+        """Yields the indices of the strips after the strip at `index` in its channel, in order"""
+        index = self.next[index]
+        while index != -1:
+            yield int(index)
+            index = self.next[index]
+
+    def iter_before(self, index):
+        """
+        Yields the indices of the strips before the strip at `index` in its channel, closest first
+        """
+        index = self.previous[index]
+        while index != -1:
+            yield int(index)
+            index = self.previous[index]
+
+    def iter_channel(self, channel):
+        """Yields the indices of the strips in `channel`, in order"""
+        head = self.heads.get(channel)
+        if head is None:
+            return
+        yield head
+        yield from self.iter_after(head)
+
+    def find_first_starting_from(self, index, frame):
+        """
+        Returns the index of the first strip in the channel of the strip at `index` that starts at
+        or after `frame`, walking back from `index`. The strip at `index` must start after `frame`.
+        """
+        previous = self.previous[index]
+        while previous != -1 and self.frame_final_start[previous] >= frame:
+            index, previous = previous, self.previous[previous]
+        return int(index)
+
+    def unlink(self, index):
+        """Removes the strip at `index` from its channel, for strips that get deleted"""
+        index = int(index)
+        previous, next_index = int(self.previous[index]), int(self.next[index])
+        if previous != -1:
+            self.next[previous] = next_index
+        else:
+            channel = int(self.snapshot.channel[index])
+            if self.heads.get(channel) == index:
+                if next_index != -1:
+                    self.heads[channel] = next_index
+                else:
+                    del self.heads[channel]
+        if next_index != -1:
+            self.previous[next_index] = previous
+        self.next[index] = self.previous[index] = -1
+
+    def offset(self, indices, frame_offset):
+        """Records that the strips at `indices` move by `frame_offset` frames"""
+        indices = np.asarray(list(indices), dtype=np.int64)
+        self.frame_final_start[indices] += frame_offset
+        self.frame_final_end[indices] += frame_offset
+
+
+def build_channel_links(context):
+    return ChannelLinks(get_strip_snapshot(context))
+
+
+_channel_links_cache = SequencerCache(build_channel_links)
+
+
+def get_channel_links(context):
+    """
+    Returns the ChannelLinks of `context.sequences`, rebuilding them if the strips changed
+    """
+    return _channel_links_cache.get(context)
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Sorted index of the frames to navigate to in the edit: the start and end of strips and the
+keyframes of their animation, with timeline markers added on demand.
+Finding the next or previous cut is a binary search. See get_cut_index().
+
+The index doesn't update in place: it's rebuilt in full, with NumPy, the first time an operator
+needs it after the strips or their keyframes changed. Blender's depsgraph_update_post handler
+invalidates it when the user edits strips or moves keyframes, see handlers.py, and operators that
+edit keyframes directly call invalidate().
+"""
+import numpy as np
+
+from .cache import ActionCache, SequencerCache
+from .keyframes import get_strip_data_path
+from .strip_snapshot import get_strip_snapshot
+
+
+class CutIndex:
+    """
+    Sorted array of the cut frames of the strips in `snapshot` and of the keyframes in
+    `keyframe_frames`, along with the index of the strip each frame belongs to in the snapshot.
+    Args:
+    - keyframe_frames: a dictionary mapping the names of animated strips to the array of their
+    keyframes' frames
+    """
+
+    def __init__(self, snapshot, keyframe_frames):
+        self.snapshot = snapshot
+        self.keyframe_frames = keyframe_frames
+        strip_indices = np.arange(snapshot.count)
+        frames = [snapshot.frame_final_start, snapshot.frame_final_end]
+        owners = [strip_indices, strip_indices]
+        for name, keyframes in keyframe_frames.items():
+            index = snapshot.collection.find(name) if snapshot.count else -1
+            if index == -1:
+                continue
+            frames.append(keyframes)
+            owners.append(np.full(len(keyframes), index))
+
+        frames = np.concatenate(frames).astype(np.int64)
+        order = np.argsort(frames, kind="stable")
+        self.frames = frames[order]
+        self.owners = np.concatenate(owners)[order]
+        self.unique_frames = np.unique(self.frames)
+
+    def find(self, frame, direction, count=1, strips_mask=None, markers=None):
+        """
+        Returns the `count`-th cut after `frame` if `direction` is "RIGHT", or before it if
+        `direction` is "LEFT". If there are fewer cuts in that direction, returns the last one.
+        Returns None if there is no cut in that direction.
+        Args:
+        - strips_mask (optional): a mask over the snapshot's strips to only use their cuts
+        - markers (optional): an array of marker frames to jump to as well
+        """
+        frames = self.unique_frames
+        if strips_mask is not None:
+            frames = np.unique(self.frames[strips_mask[self.owners]])
+        if markers is not None and len(markers):
+            frames = np.union1d(frames, markers)
+
+        if direction == "RIGHT":
+            index = np.searchsorted(frames, frame, side="right")
+            if index == len(frames):
+                return None
+            return int(frames[min(index + count - 1, len(frames) - 1)])
+        else:
+            index = np.searchsorted(frames, frame, side="left")
+            if index == 0:
+                return None
+            return int(frames[max(index - count, 0)])
+
+
+def get_strip_name(strip_data_path):
+    """Returns the name of the strip from a data path like sequence_editor.sequences_all["name"]"""
+    name = strip_data_path[len('sequence_editor.sequences_all["') : -len('"]')]
+    return name.replace('\\"', '"').replace("\\\\", "\\")
+
+
+def build_keyframe_frames(action):
+    """
+    Returns a dictionary mapping the name of each animated strip to the array of the frames of
+    its keyframes, read with one call to foreach_get per fcurve
+    """
+    keyframe_frames = {}
+    for fcurve in action.fcurves:
+        path = get_strip_data_path(fcurve.data_path)
+        count = len(fcurve.keyframe_points)
+        if not (path and count):
+            continue
+        coordinates = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", coordinates)
+        frames = np.round(coordinates[0::2]).astype(np.int64)
+        name = get_strip_name(path)
+        if name in keyframe_frames:
+            frames = np.concatenate((keyframe_frames[name], frames))
+        keyframe_frames[name] = frames
+    return keyframe_frames
+
+
+_keyframe_frames_cache = ActionCache(build_keyframe_frames)
+
+
+NO_KEYFRAME_FRAMES = {}
+
+
+def get_keyframe_frames(context):
+    animation_data = context.scene.animation_data
+    if not (animation_data and animation_data.action):
+        return NO_KEYFRAME_FRAMES
+    return _keyframe_frames_cache.get(animation_data.action)
+
+
+def build_cut_index(context):
+    return CutIndex(get_strip_snapshot(context), get_keyframe_frames(context))
+
+
+_cut_index_cache = SequencerCache(build_cut_index)
+
+
+def get_cut_index(context):
+    """
+    Returns the CutIndex of `context.sequences`, rebuilding it if the strips or their keyframes
+    changed
+    """
+    cut_index = _cut_index_cache.get(context)
+    # The keyframe frames cache returns a new dictionary when it rebuilds it
+    if cut_index.keyframe_frames is not get_keyframe_frames(context):
+        _cut_index_cache.clear()
+        cut_index = _cut_index_cache.get(context)
+    return cut_index
+
+
+def get_marker_frames(context):
+    """Returns the frames of the scene's timeline markers as an array"""
+    markers = context.scene.timeline_markers
+    frames = np.empty(len(markers), dtype=np.int32)
+    if len(markers):
+        markers.foreach_get("frame", frames)
+    return frames
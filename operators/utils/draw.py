@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
-"""Drawing utilities. A list of functions to draw common elements"""
+"""
+Drawing utilities. A list of functions to draw common elements, and the DrawList to draw many
+shapes with few batches
+"""
 # import bgl
 import blf
-from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
 import math
 
@@ -33,45 +35,47 @@ def get_color_axis_z(context):
     return _color_to_list(color)
 
 
-def draw_line(shader, start, end, color=(1.0, 1.0, 1.0, 1.0)):
-    """Draws a line using two Vector-based points"""
-    batch = batch_for_shader(shader, "LINES", {"pos": (start, end)})
+def draw_line(shader, start, end, color=(1.0, 1.0, 1.0, 1.0), draw_list=None):
+    """
+    Draws a line using two Vector-based points.
+    If `draw_list` is set, adds the line to this DrawList instead, to draw it with the list's
+    other shapes on its next flush. The same goes for the other draw functions.
+    """
+    _draw_shape(shader, draw_list, "add_line", start, end, color)
+
 
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
+def draw_rectangle(shader, origin, size, color=(1.0, 1.0, 1.0, 1.0), draw_list=None):
+    _draw_shape(shader, draw_list, "add_rectangle", origin, size, color)
 
 
-def draw_rectangle(shader, origin, size, color=(1.0, 1.0, 1.0, 1.0)):
-    vertices = (
-        (origin.x, origin.y),
-        (origin.x + size.x, origin.y),
-        (origin.x, origin.y + size.y),
-        (origin.x + size.x, origin.y + size.y),
-    )
-    indices = ((0, 1, 2), (2, 1, 3))
-    batch = batch_for_shader(shader, "TRIS", {"pos": vertices}, indices=indices)
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
+def draw_triangle(shader, point_1, point_2, point_3, color=(1.0, 1.0, 1.0, 1.0), draw_list=None):
+    _draw_shape(shader, draw_list, "add_triangle", point_1, point_2, point_3, color)
 
 
-def draw_triangle(shader, point_1, point_2, point_3, color=(1.0, 1.0, 1.0, 1.0)):
-    vertices = (point_1, point_2, point_3)
-    indices = ((0, 1, 2),)
-    batch = batch_for_shader(shader, "TRIS", {"pos": vertices}, indices=indices)
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
+def draw_triangle_equilateral(
+    shader, center, radius, rotation=0.0, color=(1.0, 1.0, 1.0, 1.0), draw_list=None
+):
+    _draw_shape(shader, draw_list, "add_triangle_equilateral", center, radius, rotation, color)
 
 
-def draw_triangle_equilateral(shader, center, radius, rotation=0.0, color=(1.0, 1.0, 1.0, 1.0)):
+def _draw_shape(shader, draw_list, add_function, *args):
+    """Adds a shape to `draw_list`, or draws it right away if `draw_list` is None"""
+    if draw_list is not None:
+        getattr(draw_list, add_function)(*args)
+        return
+    draw_list = DrawList()
+    getattr(draw_list, add_function)(*args)
+    draw_list.flush(shader)
+
+
+def get_triangle_equilateral_points(center, radius, rotation=0.0):
+    """Returns the 3 corners of an equilateral triangle as Vectors"""
     points = []
     for i in range(3):
         angle = i * math.pi * 2 / 3 + rotation
         offset = Vector((radius * math.cos(angle), radius * math.sin(angle)))
         points.append(center + offset)
-    draw_triangle(shader, *points, color)
+    return points
 
 
 def draw_text(x, y, size, text, justify="left", color=(1.0, 1.0, 1.0, 1.0)):
@@ -86,20 +90,130 @@ def draw_text(x, y, size, text, justify="left", color=(1.0, 1.0, 1.0, 1.0)):
     blf.draw(font_id, text)
 
 
-def draw_arrow_head(shader, center, size, points_right=True, color=(1.0, 1.0, 1.0, 1.0)):
+def draw_arrow_head(
+    shader, center, size, points_right=True, color=(1.0, 1.0, 1.0, 1.0), draw_list=None
+):
     """
     Draws a triangular arrow using two Vectors:
     - the triangle's center
     - the triangle's size
     """
-    direction = 1 if points_right else -1
+    _draw_shape(shader, draw_list, "add_arrow_head", center, size, points_right, color)
+
+
+class GPUBackend:
+    """
+    Creates and draws GPU batches. Imports the gpu modules on first use, so the rest of this module
+    works without a GPU context, like in background mode
+    """
+
+    def create_batch(self, shader, primitive, vertices):
+        from gpu_extras.batch import batch_for_shader
+
+        return batch_for_shader(shader, primitive, {"pos": vertices})
+
+    def draw(self, shader, batch, color):
+        shader.bind()
+        shader.uniform_float("color", color)
+        batch.draw(shader)
+
+
+class RecordingBackend:
+    """
+    Records the batches and draw calls instead of using the GPU, to check the geometry of a
+    DrawList in tests or in background mode.
+    `batches` is the list of created batches, as (primitive, vertices) tuples, and `draw_calls` the
+    list of (primitive, vertices, color) tuples in drawing order.
+
+    >>> backend = RecordingBackend()
+    >>> draw_list = DrawList(backend)
+    >>> draw_list.add_line((0, 0), (10, 0), (1.0, 0.0, 0.0, 1.0))
+    >>> draw_list.add_line((0, 5), (10, 5), (1.0, 0.0, 0.0, 1.0))
+    >>> draw_list.flush(shader=None)
+    >>> backend.draw_calls
+    [('LINES', ((0, 0), (10, 0), (0, 5), (10, 5)), (1.0, 0.0, 0.0, 1.0))]
+    >>> draw_list.add_line((0, 0), (10, 0), (1.0, 0.0, 0.0, 1.0))
+    >>> draw_list.add_line((0, 5), (10, 5), (1.0, 0.0, 0.0, 1.0))
+    >>> draw_list.flush(shader=None)
+    >>> len(backend.batches), len(backend.draw_calls)
+    (1, 2)
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.draw_calls = []
 
-    point_upper = Vector([center.x - size.x / 2 * direction, center.y + size.y / 2])
-    point_tip = Vector([center.x + size.x / 2 * direction, center.y])
-    point_lower = Vector([center.x - size.x / 2 * direction, center.y - size.y / 2])
+    def create_batch(self, shader, primitive, vertices):
+        batch = (primitive, tuple(vertices))
+        self.batches.append(batch)
+        return batch
+
+    def draw(self, shader, batch, color):
+        primitive, vertices = batch
+        self.draw_calls.append((primitive, vertices, tuple(color)))
+
+
+class DrawList:
+    """
+    Accumulates shapes drawn with the same shader during a redraw, grouped by primitive type and
+    color. flush() draws each group with a single batch.
+    Keeps the batches of the last flush and reuses them if the next redraw adds the same shapes
+    and flushes them with the same shader, so static overlays don't create batches on every
+    redraw. Keep one DrawList per draw handler to benefit from it.
+    Args:
+    - backend (optional): GPUBackend by default, or RecordingBackend to draw without a GPU
+    """
 
-    draw_line(shader, point_upper, point_tip, color)
-    draw_line(shader, point_tip, point_lower, color)
+    def __init__(self, backend=None):
+        self.backend = backend or GPUBackend()
+        # Maps (primitive, color) to the list of vertices, in the order shapes got added
+        self.groups = {}
+        self._cached_shader = None
+        self._cached_groups = None
+        self._cached_batches = []
+
+    def add_line(self, start, end, color=(1.0, 1.0, 1.0, 1.0)):
+        self._add("LINES", color, (start, end))
+
+    def add_rectangle(self, origin, size, color=(1.0, 1.0, 1.0, 1.0)):
+        corner_1 = (origin[0], origin[1])
+        corner_2 = (origin[0] + size[0], origin[1])
+        corner_3 = (origin[0], origin[1] + size[1])
+        corner_4 = (origin[0] + size[0], origin[1] + size[1])
+        self._add("TRIS", color, (corner_1, corner_2, corner_3, corner_3, corner_2, corner_4))
+
+    def add_triangle(self, point_1, point_2, point_3, color=(1.0, 1.0, 1.0, 1.0)):
+        self._add("TRIS", color, (point_1, point_2, point_3))
+
+    def add_triangle_equilateral(self, center, radius, rotation=0.0, color=(1.0, 1.0, 1.0, 1.0)):
+        self._add("TRIS", color, get_triangle_equilateral_points(center, radius, rotation))
+
+    def add_arrow_head(self, center, size, points_right=True, color=(1.0, 1.0, 1.0, 1.0)):
+        """Adds the two lines of an arrow head, see draw_arrow_head()"""
+        direction = 1 if points_right else -1
+        point_upper = (center[0] - size[0] / 2 * direction, center[1] + size[1] / 2)
+        point_tip = (center[0] + size[0] / 2 * direction, center[1])
+        point_lower = (center[0] - size[0] / 2 * direction, center[1] - size[1] / 2)
+        self._add("LINES", color, (point_upper, point_tip, point_tip, point_lower))
+
+    def _add(self, primitive, color, points):
+        vertices = self.groups.setdefault((primitive, tuple(color)), [])
+        vertices.extend((point[0], point[1]) for point in points)
+
+    def flush(self, shader):
+        """Draws the shapes added since the last flush and clears the list"""
+        groups = {key: tuple(vertices) for key, vertices in self.groups.items()}
+        self.groups = {}
+        # Batches are bound to the shader's vertex format, so they can't be reused with another
+        if shader is not self._cached_shader or groups != self._cached_groups:
+            self._cached_shader = shader
+            self._cached_groups = groups
+            self._cached_batches = [
+                (self.backend.create_batch(shader, primitive, vertices), color)
+                for (primitive, color), vertices in groups.items()
+            ]
+        for batch, color in self._cached_batches:
+            self.backend.draw(shader, batch, color)
 
 
 def _color_to_list(color):
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Graph of the links between effect strips and their inputs.
+Strips are the nodes and each effect has an edge to its input_1 and input_2. Use
+get_effect_graph() to find the effects and inputs related to strips without looping over all
+sequences.
+"""
+from collections import defaultdict, deque
+
+from .cache import SequencerCache
+from .global_settings import SequenceTypes
+from .strip_snapshot import get_strip_snapshot
+
+
+class EffectGraph:
+    """
+    Stores, for every strip, the effects that use it as an input and, for every effect, its inputs.
+    """
+
+    def __init__(self, effects):
+        self.inputs = {}
+        self.effects = defaultdict(list)
+        for effect in effects:
+            input_count = getattr(effect, "input_count", 0)
+            inputs = [effect.input_1] if input_count >= 1 else []
+            if input_count == 2:
+                inputs.append(effect.input_2)
+            inputs = [s for s in inputs if s]
+            self.inputs[effect] = inputs
+            for s in inputs:
+                self.effects[s].append(effect)
+
+    def get_inputs(self, strip):
+        """Returns the input strips of `strip` if it's an effect, an empty list otherwise"""
+        return self.inputs.get(strip, [])
+
+    def get_effects(self, strip):
+        """Returns the effects that use `strip` as one of their inputs"""
+        return self.effects.get(strip, [])
+
+    def get_neighbours(self, strip):
+        return self.get_inputs(strip) + self.get_effects(strip)
+
+    def are_linked(self, strip_1, strip_2):
+        """Returns True if one of the strips is an effect that uses the other as an input"""
+        return strip_2 in self.get_inputs(strip_1) or strip_1 in self.get_inputs(strip_2)
+
+    def find_related(self, strips):
+        """
+        Performs a breadth first search from `strips` and returns the set of all the strips
+        connected to them through effects, including the source strips
+        """
+        return self._traverse(strips, self.get_neighbours)
+
+    def find_effects_recursive(self, strips):
+        """
+        Returns the set of effects applied to `strips`, the effects applied to these effects, and
+        so on. Doesn't include the source strips
+        """
+        found = self._traverse(strips, self.get_effects)
+        return found.difference(strips)
+
+    def _traverse(self, strips, get_next):
+        visited = set(strips)
+        queue = deque(visited)
+        while queue:
+            for s in get_next(queue.popleft()):
+                if s not in visited:
+                    visited.add(s)
+                    queue.append(s)
+        return visited
+
+
+def build_effect_graph(context):
+    snapshot = get_strip_snapshot(context)
+    return EffectGraph(snapshot.get_strips(snapshot.mask_types(SequenceTypes.EFFECT)))
+
+
+_effect_graph_cache = SequencerCache(build_effect_graph)
+
+
+def get_effect_graph(context):
+    """
+    Returns the EffectGraph of `context.sequences`, rebuilding it if the strips changed
+    """
+    return _effect_graph_cache.get(context)
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Finds the footage files in a project folder, walking sub-folders in parallel.
+Remembers the names in each folder along with its modification time, so the next scan only lists
+the folders that changed. Rewriting a file doesn't change its folder's modification time, so the
+files' stats are read on every scan. See find_footage_files().
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+
+ALWAYS_IGNORED = ("BL_proxy",)
+MAX_WORKERS = 8
+
+# Maps folder paths to (mtime_ns, footage file paths, sub-folders) from the last scan
+_folder_cache = {}
+
+
+def find_footage_files(directory, extensions, ignore_patterns=()):
+    """
+    Returns a dictionary mapping the path relative to `directory` of every file with one of the
+    `extensions` in `directory` and its sub-folders to a (size, mtime_ns) tuple, sorted by path.
+    Args:
+    - extensions: a tuple of lowercase file extensions, like EXTENSIONS_ALL
+    - ignore_patterns (optional): glob patterns of file and folder names to skip. Folders named
+    BL_proxy are always skipped
+    """
+    ignore_patterns = tuple(ignore_patterns) + ALWAYS_IGNORED
+    files = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        pending = {pool.submit(scan_folder, directory, extensions, ignore_patterns)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder_files, sub_folders = future.result()
+                files.update(folder_files)
+                pending.update(
+                    pool.submit(scan_folder, path, extensions, ignore_patterns)
+                    for path in sub_folders
+                )
+
+    return {os.path.relpath(path, directory): stats for path, stats in sorted(files.items())}
+
+
+def scan_folder(path, extensions, ignore_patterns):
+    """
+    Returns a tuple of (files, sub_folders) for the folder at `path`: a dictionary mapping
+    the absolute path of footage files to their (size, mtime_ns) and the list of sub-folders to
+    scan. Uses the cached list of names if the folder didn't change since the last scan.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}, []
+
+    key = (path, extensions, ignore_patterns)
+    cached = _folder_cache.get(key)
+    if cached and cached[0] == mtime:
+        file_paths, sub_folders = cached[1], cached[2]
+    else:
+        file_paths, sub_folders = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if is_ignored(entry.name, ignore_patterns):
+                        continue
+                    # Not following links to folders avoids looping on links to a parent folder
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_folders.append(entry.path)
+                    elif entry.is_file() and entry.name.lower().endswith(extensions):
+                        file_paths.append(entry.path)
+        except OSError:
+            return {}, []
+        _folder_cache[key] = (mtime, file_paths, sub_folders)
+
+    files = {}
+    for file_path in file_paths:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        files[file_path] = (stat.st_size, stat.st_mtime_ns)
+    return files, sub_folders
+
+
+def is_ignored(name, ignore_patterns):
+    return any(fnmatch(name, pattern) for pattern in ignore_patterns)
+
+
+def parse_ignore_patterns(string):
+    """Returns the list of patterns in a comma-separated string"""
+    return [pattern.strip() for pattern in string.split(",") if pattern.strip()]
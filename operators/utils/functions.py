@@ -1,11 +1,28 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import os
 from math import floor, sqrt
 from operator import attrgetter
 
 import bpy
 
-from .global_settings import SequenceTypes
+from .channel_links import get_channel_links
+from .effect_graph import get_effect_graph
+from .snapping import find_snap_frame, get_snap_distance, get_snap_sources
+from .strip_cut import apply_cuts, delete_strips
+from .strip_index import get_strip_index
+from .strip_move import move_strips
+from .strip_snapshot import get_strip_snapshot
+
+
+def get_config_directory():
+    """
+    Returns the add-on's folder in Blender's user configuration folder, creating it if needed
+    """
+    # user_resource()'s keyword to create folders changed name in Blender 3.0
+    directory = os.path.join(bpy.utils.user_resource("CONFIG"), "power_sequencer")
+    os.makedirs(directory, exist_ok=True)
+    return directory
 
 
 def calculate_distance(x1, y1, x2, y2):
@@ -25,39 +42,26 @@ def find_linked(context, sequences, selected_sequences):
     Returns a list of all the linked sequences, but not the sequences passed to the function
     """
     start, end = get_frame_range(sequences, selected_sequences)
-    sequences_in_range = [s for s in sequences if is_in_range(context, s, start, end)]
-    effects = (s for s in sequences_in_range if s.type in SequenceTypes.EFFECT)
-    selected_effects = (s for s in sequences if s.type in SequenceTypes.EFFECT)
+    effect_graph = get_effect_graph(context)
+    source_sequences = set(sequences)
 
     linked_sequences = []
 
-    # Filter down to effects that have at least one of seq as input and
-    # Append input sequences that aren't in the source list to linked_sequences
-    for e in effects:
-        if not hasattr(e, "input_2"):
-            continue
-        for s in sequences:
-            if e.input_2 == s:
-                linked_sequences.append(e)
-                if e.input_1 not in sequences:
-                    linked_sequences.append(e.input_1)
-            elif e.input_1 == s:
-                linked_sequences.append(e)
-                if e.input_2 not in sequences:
-                    linked_sequences.append(e.input_2)
-
-    # Find inputs of selected effects that are not selected
-    for e in selected_effects:
-        try:
-            if e.input_1 not in sequences:
-                linked_sequences.append(e.input_1)
-            if e.input_count == 2:
-                if e.input_2 not in sequences:
-                    linked_sequences.append(e.input_2)
-        except AttributeError:
-            continue
+    # Append effects that have at least one of the sequences as input, and their other inputs
+    for s in sequences:
+        for e in effect_graph.get_effects(s):
+            if not is_in_range(context, e, start, end):
+                continue
+            linked_sequences.append(e)
+            linked_sequences.extend(
+                i for i in effect_graph.get_inputs(e) if i not in source_sequences
+            )
+
+    # Find inputs of effects in the list that are not in the list
+    for s in sequences:
+        linked_sequences.extend(i for i in effect_graph.get_inputs(s) if i not in source_sequences)
 
-    return linked_sequences
+    return list(dict.fromkeys(linked_sequences))
 
 
 def find_neighboring_markers(context, frame=None):
@@ -86,32 +90,19 @@ def find_sequences_after(context, sequence):
         - Sequences, the sequences to check
     Returns all the strips after the sequence in the current context
     """
-    return [s for s in context.sequences if s.frame_final_start > sequence.frame_final_start]
+    return get_strip_index(context).find_starting_after(sequence.frame_final_start)
 
 
-def find_snap_candidate(context, frame=0):
+def find_snap_candidate(context, frame=0, playhead=None):
     """
-    Returns the cut frame closest to the `frame` argument
+    Returns the snap target closest to the `frame` argument, using the sources and the distance
+    set in the scene's snapping settings. See find_snap_frame()
+    Returns `frame` if there is nothing to snap to
     """
-    snap_candidate = 1000000
-
-    for s in context.sequences:
-        start_to_frame = frame - s.frame_final_start
-        end_to_frame = frame - s.frame_final_end
-
-        distance_to_start = abs(start_to_frame)
-        distance_to_end = abs(end_to_frame)
-
-        candidate = (
-            frame - start_to_frame
-            if min(distance_to_start, distance_to_end) == distance_to_start
-            else frame - end_to_frame
-        )
-
-        if abs(frame - candidate) < abs(frame - snap_candidate):
-            snap_candidate = candidate
-
-    return snap_candidate
+    snap_frame, _ = find_snap_frame(
+        context, frame, get_snap_sources(context), playhead, get_snap_distance(context)
+    )
+    return snap_frame
 
 
 def find_strips_mouse(context, frame, channel, select_linked=False):
@@ -124,17 +115,13 @@ def find_strips_mouse(context, frame, channel, select_linked=False):
     Returns the sequence(s) under the mouse cursor as a list
     Returns an empty list if nothing found
     """
-    sequences = [
-        s
-        for s in context.sequences
-        if not s.lock and s.channel == channel and s.frame_final_start <= frame <= s.frame_final_end
-    ]
-    if select_linked:
+    strip_index = get_strip_index(context)
+    sequences = [s for s in strip_index.find_at_frame(frame, [channel]) if not s.lock]
+    if select_linked and sequences:
         linked_strips = [
             s
-            for s in context.sequences
-            if s.frame_final_start == sequences[0].frame_final_start
-            and s.frame_final_end == sequences[0].frame_final_end
+            for s in strip_index.strips_starting_at[sequences[0].frame_final_start]
+            if s.frame_final_end == sequences[0].frame_final_end
         ]
         sequences.extend(linked_strips)
     return sequences
@@ -243,39 +230,13 @@ def trim_strips(context, frame_start, frame_end, to_trim, to_delete=[]):
     trim_start = min(frame_start, frame_end)
     trim_end = max(frame_start, frame_end)
 
-    to_trim = [s for s in to_trim if s.type in SequenceTypes.CUTABLE]
-    initial_selection = context.selected_sequences
-
-    for s in to_trim:
-        strips_in_target_channel = []
-        # Cut strip longer than the trim range in three
-        is_strip_longer_than_trim_range = (
-            s.frame_final_start < trim_start and s.frame_final_end > trim_end
-        )
-        if is_strip_longer_than_trim_range:
-            bpy.ops.sequencer.select_all(action="DESELECT")
-            s.select = True
-            bpy.ops.sequencer.split(frame=trim_start, type="SOFT", side="RIGHT")
-            bpy.ops.sequencer.split(frame=trim_end, type="SOFT", side="LEFT")
-            to_delete.append(context.selected_sequences[0])
-
-            for c in context.sequences:
-                if c.channel == s.channel:
-                    strips_in_target_channel.append(c)
-
-            if s in initial_selection:
-                initial_selection.append(strips_in_target_channel[0])
-            continue
-
-        # Resize strips that overlap the trim range
-        elif s.frame_final_start < trim_end and s.frame_final_end > trim_end:
-            s.frame_final_start = trim_end
-        elif s.frame_final_end > trim_start and s.frame_final_start < trim_start:
-            s.frame_final_end = trim_start
-
-    delete_strips(to_delete)
-    for s in initial_selection:
-        s.select = True
+    # Strips inside the trim range are only deleted if they're in to_delete
+    to_trim = [
+        s for s in to_trim if s.frame_final_start < trim_start or s.frame_final_end > trim_end
+    ]
+    apply_cuts(
+        context, trims=[(trim_start, trim_end, None)], sequences=to_trim, to_delete=to_delete
+    )
     return {"FINISHED"}
 
 
@@ -284,22 +245,25 @@ def find_closest_surrounding_cuts(context, frame):
     Returns a tuple of (strip_before, strip_after), the two closest sequences around a gap.
     If the frame is in the middle of a strip, both strips may be the same.
     """
-    strip_before = max(
-        context.sequences,
-        key=lambda s: s.frame_final_end
-        if s.frame_final_end <= frame
-        else s.frame_final_start
-        if s.frame_final_start <= frame
-        else 0,
-    )
-    strip_after = min(
-        context.sequences,
-        key=lambda s: s.frame_final_start
-        if s.frame_final_start >= frame
-        else s.frame_final_end
-        if s.frame_final_end >= frame
-        else 1000000,
-    )
+    strip_index = get_strip_index(context)
+
+    # Strips that overlap the frame come first so both strips are the same in the middle of a strip
+    cut_before = strip_index.find_cut_before(frame)
+    if cut_before is None:
+        cut_before = strip_index.find_cut_after(frame)
+    candidates_before = [
+        s for s in strip_index.strips_starting_at[cut_before] if s.frame_final_end > frame
+    ] + [s for s in strip_index.strips_ending_at[cut_before] if s.frame_final_start <= frame]
+
+    cut_after = strip_index.find_cut_after(frame)
+    if cut_after is None:
+        cut_after = strip_index.find_cut_before(frame)
+    candidates_after = [
+        s for s in strip_index.strips_ending_at[cut_after] if s.frame_final_start < frame
+    ] + [s for s in strip_index.strips_starting_at[cut_after] if s.frame_final_end >= frame]
+
+    strip_before = (candidates_before or strip_index.strips_ending_at[cut_before])[0]
+    strip_after = (candidates_after or strip_index.strips_starting_at[cut_after])[0]
     return strip_before, strip_after
 
 
@@ -314,37 +278,67 @@ def find_closest_surrounding_cuts_frames(context, frame):
 
 def get_sequences_under_cursor(context):
     frame = context.scene.frame_current
-    under_cursor = [
-        s
-        for s in context.sequences
-        if s.frame_final_start <= frame and s.frame_final_end >= frame and not s.lock
-    ]
+    under_cursor = [s for s in get_strip_index(context).find_at_frame(frame) if not s.lock]
     return under_cursor
 
 
 def ripple_move(context, sequences, duration_frames, delete=False):
     """
-    Moves sequences in the list and ripples the change to all sequences after them, in the corresponding channels
+    Moves sequences in the list and ripples the change to all sequences after them, in the
+    corresponding channels
     The `duration_frames` can be positive or negative.
     If `delete` is True, deletes every sequence in `sequences`.
     """
-    channels = {s.channel for s in sequences}
-    first_strip = min(sequences, key=lambda s: s.frame_final_start)
-    to_ripple = [
-        s
-        for s in context.sequences
-        if s.channel in channels and s.frame_final_start >= first_strip.frame_final_start
-    ]
-
-    if delete:
-        delete_strips(sequences)
-    else:
-        to_ripple = set(to_ripple + sequences)
-
-    move_selection(context, to_ripple, duration_frames, 0)
+    ripple_move_blocks(context, [(sequences, duration_frames)], delete)
 
 
-def find_strips_in_range(frame_start, frame_end, sequences, find_overlapping=True):
+def ripple_move_blocks(context, blocks, delete=False):
+    """
+    Calls ripple_move() for each (sequences, duration_frames) tuple in `blocks`, in order, but
+    deletes strips and moves them once for all the blocks.
+    Walks each channel from its first strip in a block, only visiting the strips to move. Between
+    blocks, deleted strips get unlinked from a copy of the ChannelLinks and the planned moves
+    recorded in it, so the links stay valid without reading the strips again.
+    """
+    links = get_channel_links(context).copy()
+    frame_offsets = {}
+    to_delete, deleted_indices = [], set()
+    for sequences, duration_frames in blocks:
+        indices = [links.get_index(s) for s in sequences]
+        first_start = min(links.frame_final_start[i] for i in indices)
+        firsts_per_channel = {}
+        for index in indices:
+            channel = links.snapshot.channel[index]
+            first = firsts_per_channel.get(channel)
+            if first is None or links.frame_final_start[index] < links.frame_final_start[first]:
+                firsts_per_channel[channel] = index
+
+        to_ripple = set()
+        for index in firsts_per_channel.values():
+            index = links.find_first_starting_from(index, first_start)
+            to_ripple.add(index)
+            to_ripple.update(links.iter_after(index))
+
+        if delete:
+            to_ripple.difference_update(indices)
+            for index in indices:
+                links.unlink(index)
+            to_delete.extend(sequences)
+            deleted_indices.update(indices)
+        links.offset(to_ripple, duration_frames)
+        for index in to_ripple:
+            frame_offsets[index] = frame_offsets.get(index, 0) + duration_frames
+
+    strips = links.snapshot.strips
+    offsets = {
+        strips[i]: (offset, 0) for i, offset in frame_offsets.items() if i not in deleted_indices
+    }
+    if to_delete:
+        delete_strips(to_delete)
+    move_strips(context, offsets)
+
+
+def find_strips_in_range(frame_start, frame_end, sequences=None, find_overlapping=True):
     """
     Returns a tuple of two lists: (strips_inside_range, strips_overlapping_range)
     strips_inside_range are strips entirely contained in the frame range.
@@ -357,10 +351,11 @@ def find_strips_in_range(frame_start, frame_end, sequences, find_overlapping=Tru
         - find_overlapping (optional): find and return a list of strips that overlap the
         frame range
     """
+    if not sequences:
+        return find_strips_in_range_snapshot(frame_start, frame_end, find_overlapping)
+
     strips_inside_range = []
     strips_overlapping_range = []
-    if not sequences:
-        sequences = bpy.context.sequences
     for s in sequences:
         if (
             frame_start <= s.frame_final_start <= frame_end
@@ -380,15 +375,25 @@ def find_strips_in_range(frame_start, frame_end, sequences, find_overlapping=Tru
     return strips_inside_range, strips_overlapping_range
 
 
-def delete_strips(to_delete):
+def find_strips_in_range_snapshot(frame_start, frame_end, find_overlapping=True):
     """
-    Deletes the list of sequences `to_delete`
+    Same as find_strips_in_range but computes the ranges of all the strips in the current context at
+    once, using the cached StripSnapshot
     """
-    # Effect strips get deleted with their source so we skip them to avoid errors.
-    to_delete = [s for s in to_delete if s.type in SequenceTypes.CUTABLE]
-    sequences = bpy.context.scene.sequence_editor.sequences
-    for s in to_delete:
-        sequences.remove(s)
+    snapshot = get_strip_snapshot(bpy.context)
+    starts, ends = snapshot.frame_final_start, snapshot.frame_final_end
+
+    is_inside = snapshot.mask_inside(frame_start, frame_end)
+    strips_inside_range = snapshot.get_strips(is_inside)
+    if not find_overlapping:
+        return strips_inside_range, []
+
+    is_overlapping = ~is_inside & (
+        ((frame_start < ends) & (ends <= frame_end))
+        | ((frame_start <= starts) & (starts < frame_end))
+    )
+    is_overlapping |= (starts < frame_start) & (ends > frame_end)
+    return strips_inside_range, snapshot.get_strips(is_overlapping)
 
 
 def move_selection(context, sequences, frame_offset, channel_offset=0):
@@ -398,11 +403,4 @@ def move_selection(context, sequences, frame_offset, channel_offset=0):
     """
     if not sequences:
         return
-    initial_selection = context.selected_sequences
-    bpy.ops.sequencer.select_all(action="DESELECT")
-    for s in sequences:
-        s.select = True
-    bpy.ops.transform.seq_slide(value=(frame_offset, channel_offset))
-    bpy.ops.sequencer.select_all(action="DESELECT")
-    for s in initial_selection:
-        s.select = True
+    move_strips(context, {s: (frame_offset, channel_offset) for s in sequences})
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Finds the strips and handles under or near the mouse cursor.
+Converting each strip's position with view2d.view_to_region costs one call per point: instead,
+ViewTransform reads the view's scale and offset once and converts all the points of a
+StripSnapshot at once with NumPy.
+"""
+from math import floor
+
+import numpy as np
+
+from .strip_snapshot import get_strip_snapshot
+
+
+class ViewTransform:
+    """
+    Affine transform between the view space of a View2D, in frames and channels, and region
+    space, in pixels. Create one per event: it's only valid until the view pans or zooms.
+    """
+
+    # Distance in pixels between the two points used to measure the scale
+    SAMPLE_DISTANCE = 1000.0
+
+    def __init__(self, region):
+        self.width, self.height = region.width, region.height
+        view2d = region.view2d
+        self.frame_offset, self.channel_offset = view2d.region_to_view(0.0, 0.0)
+        frame, channel = view2d.region_to_view(self.SAMPLE_DISTANCE, self.SAMPLE_DISTANCE)
+        self.frames_per_pixel = (frame - self.frame_offset) / self.SAMPLE_DISTANCE
+        self.channels_per_pixel = (channel - self.channel_offset) / self.SAMPLE_DISTANCE
+
+    def to_region(self, frames, channels):
+        """Converts scalars or arrays of frames and channels to region coordinates"""
+        x = (np.asarray(frames, dtype=float) - self.frame_offset) / self.frames_per_pixel
+        y = (np.asarray(channels, dtype=float) - self.channel_offset) / self.channels_per_pixel
+        return x, y
+
+    def to_view(self, x, y):
+        """Converts region coordinates to a (frame, channel) tuple of floats"""
+        return (
+            self.frame_offset + x * self.frames_per_pixel,
+            self.channel_offset + y * self.channels_per_pixel,
+        )
+
+    def to_frame_and_channel(self, x, y):
+        """Converts region coordinates to the (frame, channel) integers they fall on"""
+        frame, channel = self.to_view(x, y)
+        return round(frame), floor(channel)
+
+    def get_visible_range(self):
+        """Returns the (frame_min, frame_max, channel_min, channel_max) the region displays"""
+        frame_min, channel_min = self.to_view(0.0, 0.0)
+        frame_max, channel_max = self.to_view(self.width, self.height)
+        return frame_min, frame_max, channel_min, channel_max
+
+
+class HandleHit:
+    """
+    Data structure to represent the handle closest to the mouse
+    Args:
+    - side: "START" or "END"
+    - distance: distance to the mouse cursor in pixels
+    """
+
+    def __init__(self, strip, side, frame, channel, distance):
+        self.strip = strip
+        self.side = side
+        self.frame = frame
+        self.channel = channel
+        self.distance = distance
+
+    def __repr__(self):
+        return "HandleHit {} of {} at frame {}".format(self.side, self.strip.name, self.frame)
+
+
+def mask_visible(snapshot, transform):
+    """Returns the mask of strips that the region displays, even partially"""
+    frame_min, frame_max, channel_min, channel_max = transform.get_visible_range()
+    return (
+        snapshot.mask_overlapping(floor(frame_min), frame_max)
+        & (snapshot.channel + 1 >= channel_min)
+        & (snapshot.channel <= channel_max)
+    )
+
+
+def find_closest_handle(context, mouse_x, mouse_y, transform=None, strips_mask=None):
+    """
+    Returns a HandleHit for the strip start or end closest to the mouse in region space, measured
+    from the middle of the strip's channel, or None if no strip is visible.
+    Args:
+    - transform (optional): the ViewTransform of the region, to reuse it between calls
+    - strips_mask (optional): a StripSnapshot mask of the strips to consider
+    """
+    transform = transform or ViewTransform(context.region)
+    snapshot = get_strip_snapshot(context)
+    mask = mask_visible(snapshot, transform)
+    if strips_mask is not None:
+        mask &= strips_mask
+    indices = np.flatnonzero(mask)
+    if not indices.size:
+        return None
+
+    frames = np.concatenate(
+        (snapshot.frame_final_start[indices], snapshot.frame_final_end[indices])
+    )
+    channels = np.tile(snapshot.channel[indices], 2)
+    x, y = transform.to_region(frames, channels + 0.5)
+    distances = np.hypot(x - mouse_x, y - mouse_y)
+
+    closest = int(np.argmin(distances))
+    index = indices[closest % indices.size]
+    return HandleHit(
+        snapshot.strips[index],
+        "START" if closest < indices.size else "END",
+        int(frames[closest]),
+        int(channels[closest]),
+        float(distances[closest]),
+    )
+
+
+def find_strip_under_mouse(context, mouse_x, mouse_y, transform=None):
+    """Returns the unlocked strip under the mouse cursor, or None"""
+    transform = transform or ViewTransform(context.region)
+    frame, channel = transform.to_view(mouse_x, mouse_y)
+    snapshot = get_strip_snapshot(context)
+    mask = (
+        (snapshot.frame_final_start <= frame)
+        & (snapshot.frame_final_end > frame)
+        & (snapshot.channel == floor(channel))
+        & snapshot.mask_unlocked()
+    )
+    indices = np.flatnonzero(mask)
+    return snapshot.strips[indices[0]] if indices.size else None
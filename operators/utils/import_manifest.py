@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Record of the files import_local_footage already imported, stored in a text data block.
+Files are keyed by their path relative to the blend file with their size and modification time,
+so finding new, changed, and deleted files only takes dictionary lookups.
+"""
+import json
+
+MANIFEST_VERSION = 2
+
+
+class ImportManifest:
+    """
+    Maps relative file paths to a (size, mtime_ns) tuple.
+    Files imported with older versions of the add-on have no stats: they count as unchanged
+    until the next import stores their stats.
+    """
+
+    def __init__(self, files=None):
+        self.files = files or {}
+
+    @classmethod
+    def from_string(cls, string):
+        """
+        Loads a manifest saved with to_string(), or the JSON list of paths older versions of the
+        add-on stored
+        """
+        data = json.loads(string) if string.strip() else {}
+        if isinstance(data, list):
+            return cls({path: None for path in data})
+        files = data.get("files", {})
+        return cls({path: tuple(stats) if stats else None for path, stats in files.items()})
+
+    def to_string(self):
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": {path: list(stats) if stats else None for path, stats in self.files.items()},
+        }
+        return json.dumps(data, separators=(",", ":"))
+
+    def compare(self, files):
+        """
+        Compares the manifest with the files found on the disk.
+        Args:
+        - files: a dictionary mapping relative paths to a (size, mtime_ns) tuple
+        Returns a tuple of three lists of paths: (new_files, changed_files, deleted_files)
+        """
+        new_files, changed_files = [], []
+        for path, stats in files.items():
+            if path not in self.files:
+                new_files.append(path)
+                continue
+            imported_stats = self.files[path]
+            if imported_stats is not None and imported_stats != stats:
+                changed_files.append(path)
+        deleted_files = [path for path in self.files if path not in files]
+        return new_files, changed_files, deleted_files
+
+    def update(self, files, skipped_paths=()):
+        """
+        Replaces the manifest's content with `files`, the files found on the disk.
+        Keeps the stored stats of the `skipped_paths`, changed files the user didn't import again,
+        so they still count as changed next time.
+        """
+        skipped_stats = {path: self.files[path] for path in skipped_paths if path in self.files}
+        self.files = dict(files)
+        self.files.update(skipped_stats)
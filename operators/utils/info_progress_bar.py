@@ -5,41 +5,37 @@ import bpy
 
 class InfoProgressBar:
     """
-    Draws a progress bar in the info header area
+    Draws the progress and estimated time left of running tasks in the status bar
+    Args:
+    - get_tasks: a function that returns the list of tasks to draw
     """
 
-    def __init__(self, progress_min=0, progress_max=100):
-        assert progress_min < progress_max
-
-        self.progress_min = progress_min
-        self.progress_max = progress_max
-
-        self._progress = bpy.props.FloatProperty(
-            default=self.progress_min,
-            min=self.progress_min,
-            max=self.progress_max,
-            subtype="PERCENTAGE",
-        )
+    def __init__(self, get_tasks):
+        self.get_tasks = get_tasks
         self._visible = False
 
-    def update(self, context):
-        for area in context.screen.areas:
-            if area.type == "INFO":
-                area.tag_redraw()
-
-    def draw(self):
-        if self.progress >= self.progress_max:
-            self.visible = False
-        else:
-            self.layout.prop(self, "_progress", text="Progress", slider=True)
-
-    @property
-    def progress(self):
-        return self._progress
+    def update(self):
+        """Redraws the status bar and the sequencer, where the task panel is"""
+        window_manager = bpy.context.window_manager
+        if not window_manager:
+            return
+        for window in window_manager.windows:
+            for area in window.screen.areas:
+                if area.type in ["STATUSBAR", "SEQUENCE_EDITOR"]:
+                    area.tag_redraw()
 
-    @progress.setter
-    def progress(self, value):
-        self._progress = min(max(self.progress_min, value), self.progress_max)
+    def draw(self, header, context):
+        layout = header.layout
+        for task in self.get_tasks():
+            if not task.is_running:
+                continue
+            row = layout.row(align=True)
+            text = format_task_progress(task)
+            if hasattr(row, "progress"):
+                row.progress(factor=task.get_progress(), type="BAR", text=text)
+            else:
+                row.label(text=text)
+            row.operator("power_sequencer.task_cancel", text="", icon="X").task_id = task.id
 
     @property
     def visible(self):
@@ -47,11 +43,24 @@ class InfoProgressBar:
 
     @visible.setter
     def visible(self, value):
+        if value == self._visible:
+            return
         self._visible = value
 
         if self._visible:
-            bpy.types.INFO_HT_header.append(self.draw)
-            bpy.app.handlers.scene_update_post.add(self.update)
+            bpy.types.STATUSBAR_HT_header.append(self.draw)
         else:
-            bpy.types.INFO_HT_header.remove(self.draw)
-            bpy.app.handlers.scene_update_post.remove(self.update)
+            bpy.types.STATUSBAR_HT_header.remove(self.draw)
+        self.update()
+
+
+def format_task_progress(task):
+    """Returns a text like "Build Proxies: 3/8 (37%), 1 failed, 1:05 left" for the task"""
+    text = "{}: {}/{} ({:.0%})".format(task.name, task.done_count, task.total, task.get_progress())
+    if task.failed_count:
+        text += ", {} failed".format(task.failed_count)
+    eta = task.get_eta()
+    if eta is not None:
+        minutes, seconds = divmod(int(eta), 60)
+        text += ", {}:{:02d} left".format(minutes, seconds)
+    return text
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Moves the animation of strips along with them, like fades on volume and blend_alpha.
+Strips store their animation in the scene's action, so moving a strip's frame_start leaves its
+keyframes behind. offset_keyframes() shifts the keyframes of many strips with one foreach_get and
+one foreach_set per keyframe coordinate array.
+"""
+from collections import defaultdict
+
+import numpy as np
+
+from .cache import ActionCache
+
+KEYFRAME_COORDINATES = ("co", "handle_left", "handle_right")
+
+
+def get_strip_data_path(data_path):
+    """
+    Returns the part of an fcurve's `data_path` that points to a strip, or an empty string if the
+    fcurve doesn't animate a strip
+    """
+    if not data_path.startswith("sequence_editor.sequences_all["):
+        return ""
+    return data_path[: data_path.find('"]') + 2]
+
+
+class FCurveIndex:
+    """
+    Maps the exact data paths of an action's fcurves to the fcurves, and the data path of each
+    animated strip to the list of its fcurves.
+    Call add() and remove() when creating or removing fcurves to keep the index up to date, and
+    valid in the ActionCache.
+    """
+
+    def __init__(self, action):
+        self.fcurves = {}
+        self.strip_fcurves = defaultdict(list)
+        # Number of fcurves in the action, compared by the ActionCache
+        self.fcurves_count = 0
+        for fcurve in action.fcurves:
+            self.add(fcurve)
+
+    def add(self, fcurve):
+        self.fcurves_count += 1
+        self.fcurves[fcurve.data_path] = fcurve
+        path = get_strip_data_path(fcurve.data_path)
+        if path:
+            self.strip_fcurves[path].append(fcurve)
+
+    def remove(self, fcurve):
+        """Removes `fcurve` from the index. Call it before removing the fcurve from the action"""
+        self.fcurves_count -= 1
+        data_path = fcurve.data_path
+        self.fcurves.pop(data_path, None)
+        fcurves = self.strip_fcurves.get(get_strip_data_path(data_path), [])
+        if fcurve in fcurves:
+            fcurves.remove(fcurve)
+
+    def find(self, strip, animated_property):
+        """Returns the fcurve animating the strip's `animated_property`, or None"""
+        return self.fcurves.get(strip.path_from_id(animated_property))
+
+    def find_strip_fcurves(self, strip):
+        """Returns the list of fcurves animating the strip's properties"""
+        return self.strip_fcurves.get(strip.path_from_id(), [])
+
+
+_fcurve_index_cache = ActionCache(FCurveIndex)
+
+
+def get_fcurve_index(context):
+    """
+    Returns the FCurveIndex of the scene's action, rebuilding it if the fcurves changed.
+    Returns None if the scene has no action.
+    """
+    animation_data = context.scene.animation_data
+    if not (animation_data and animation_data.action):
+        return None
+    return _fcurve_index_cache.get(animation_data.action)
+
+
+def get_strip_fcurves(context, strips):
+    """
+    Returns a dictionary mapping each strip in `strips` that has animation to its list of fcurves
+    """
+    fcurve_index = get_fcurve_index(context)
+    if not fcurve_index:
+        return {}
+
+    strip_fcurves = {}
+    for s in strips:
+        fcurves = fcurve_index.find_strip_fcurves(s)
+        if fcurves:
+            strip_fcurves[s] = fcurves
+    return strip_fcurves
+
+
+def offset_keyframes(context, offsets):
+    """
+    Moves the keyframes of strips in time
+    Args:
+    - offsets: a dictionary mapping strips to the number of frames to move their keyframes by
+    """
+    offsets = {s: offset for s, offset in offsets.items() if offset != 0}
+    if not offsets:
+        return
+
+    for s, fcurves in get_strip_fcurves(context, offsets).items():
+        for fcurve in fcurves:
+            offset_fcurve(fcurve, offsets[s])
+
+
+def offset_fcurve(fcurve, offset):
+    """
+    Moves all the keyframes of `fcurve` and their handles by `offset` frames
+    """
+    keyframe_points = fcurve.keyframe_points
+    count = len(keyframe_points)
+    if count == 0:
+        return
+
+    coordinates = np.empty(count * 2, dtype=np.float32)
+    for attribute in KEYFRAME_COORDINATES:
+        keyframe_points.foreach_get(attribute, coordinates)
+        coordinates[0::2] += offset
+        keyframe_points.foreach_set(attribute, coordinates)
+    fcurve.update()
+
+
+def read_keyframes(fcurve):
+    """
+    Returns a dictionary mapping each of the KEYFRAME_COORDINATES to an array of shape (count, 2)
+    with the (frame, value) coordinates of all the fcurve's keyframes
+    """
+    keyframe_points = fcurve.keyframe_points
+    count = len(keyframe_points)
+    keyframes = {}
+    for attribute in KEYFRAME_COORDINATES:
+        coordinates = np.empty(count * 2, dtype=np.float32)
+        if count:
+            keyframe_points.foreach_get(attribute, coordinates)
+        keyframes[attribute] = coordinates.reshape(count, 2)
+    return keyframes
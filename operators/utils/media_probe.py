@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Reads the duration, frame rate, and streams of media files with ffprobe and remembers them.
+Results are stored in a SQLite database in Blender's configuration folder, keyed by file path,
+size, and modification time, so files only get probed again when they change. See probe_files().
+"""
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import bpy
+
+from ...addon_preferences import get_preferences
+from .functions import get_config_directory
+
+DATABASE_NAME = "media_probe.sqlite3"
+MAX_WORKERS = 8
+
+
+class MediaInfo:
+    """
+    Data structure with the properties of a media file that ffprobe found
+    """
+
+    def __init__(self, data):
+        streams = data.get("streams", [])
+        video = next((s for s in streams if s.get("codec_type") == "video"), {})
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), {})
+
+        self.duration = float(data.get("format", {}).get("duration", 0.0) or 0.0)
+        self.has_video = bool(video)
+        self.has_audio = bool(audio)
+        self.video_codec = video.get("codec_name", "")
+        self.width = video.get("width", 0)
+        self.height = video.get("height", 0)
+        self.fps = float(Fraction(video.get("avg_frame_rate", "0/1") or "0/1")) if video else 0.0
+        self.frame_count = int(video.get("nb_frames", 0) or 0)
+        if not self.frame_count and self.fps:
+            self.frame_count = round(self.duration * self.fps)
+        self.audio_codec = audio.get("codec_name", "")
+        self.audio_channels = audio.get("channels", 0)
+        self.sample_rate = int(audio.get("sample_rate", 0) or 0)
+
+    def __repr__(self):
+        return "MediaInfo: {:.2f}s, video: {}, audio: {}".format(
+            self.duration, self.video_codec or None, self.audio_codec or None
+        )
+
+
+def find_ffprobe(context):
+    """
+    Returns the path to the ffprobe executable next to the ffmpeg executable set in the add-on's
+    preferences, or the one on the system's PATH. Returns None if there is none.
+    """
+    ffmpeg = get_preferences(context).ffmpeg_executable
+    if ffmpeg:
+        directory, name = os.path.split(bpy.path.abspath(ffmpeg))
+        ffprobe = os.path.join(directory, name.replace("ffmpeg", "ffprobe"))
+        if os.path.isfile(ffprobe):
+            return ffprobe
+    return shutil.which("ffprobe")
+
+
+def get_database_path():
+    return os.path.join(get_config_directory(), DATABASE_NAME)
+
+
+def run_ffprobe(ffprobe, filepath):
+    """
+    Runs ffprobe on `filepath` and returns its output as a JSON string, or None if ffprobe can't
+    read the file
+    """
+    command = [
+        ffprobe,
+        "-v",
+        "error",
+        "-show_format",
+        "-show_streams",
+        "-of",
+        "json",
+        filepath,
+    ]
+    try:
+        return subprocess.check_output(command, stderr=subprocess.DEVNULL).decode("utf-8")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class ProbeDatabase:
+    """
+    SQLite table of ffprobe's JSON output for each file, along with the file's size and mtime
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS probes "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, data TEXT)"
+        )
+
+    def get(self, filepaths):
+        """
+        Returns a dictionary mapping each file in `filepaths` that's in the database and didn't
+        change since it was probed to its ffprobe data
+        """
+        stats = get_stats(filepaths)
+        found = {}
+        query = "SELECT size, mtime_ns, data FROM probes WHERE path = ?"
+        for path, file_stats in stats.items():
+            row = self.connection.execute(query, (path,)).fetchone()
+            if row and tuple(row[:2]) == file_stats:
+                found[path] = row[2]
+        return found
+
+    def put(self, probes):
+        """Stores a dictionary mapping file paths to ffprobe's JSON output"""
+        stats = get_stats(probes)
+        rows = [(path, *stats[path], data) for path, data in probes.items() if path in stats]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?)", rows)
+
+    def close(self):
+        self.connection.close()
+
+
+def get_stats(filepaths):
+    stats = {}
+    for path in filepaths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stats[path] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def probe_files(context, filepaths):
+    """
+    Returns a dictionary mapping each of the absolute `filepaths` to a MediaInfo object.
+    Files ffprobe can't read map to None. Returns an empty dictionary if ffprobe isn't available.
+    Reads the results from the database and only runs ffprobe on new or changed files, in
+    parallel.
+    """
+    ffprobe = find_ffprobe(context)
+    if not (ffprobe and filepaths):
+        return {}
+
+    database = ProbeDatabase(get_database_path())
+    try:
+        probes = database.get(filepaths)
+        to_probe = [f for f in filepaths if f not in probes]
+        # Each probe is a separate ffprobe process: the threads only wait for them
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            outputs = pool.map(lambda f: run_ffprobe(ffprobe, f), to_probe)
+            new_probes = {f: output for f, output in zip(to_probe, outputs) if output}
+        database.put(new_probes)
+        probes.update(new_probes)
+    finally:
+        database.close()
+
+    return {f: MediaInfo(json.loads(probes[f])) if f in probes else None for f in filepaths}
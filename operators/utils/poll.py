@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Shared poll functions for the add-on's operators.
+Blender polls every operator of a menu or keymap on each redraw. Evaluating context.sequences or
+context.selected_sequences creates a Python object per strip each time: these functions count
+strips without listing them and read the select flags of the cached StripSnapshot with one
+foreach_get call. They read the current state on every call, so they stay right when an operator
+selects strips or changes the active strip and then calls another operator.
+"""
+from .cache import get_sequences_collection
+from .strip_snapshot import get_strip_snapshot
+
+
+def has_sequence_editor(context):
+    return context.scene is not None and context.scene.sequence_editor is not None
+
+
+def has_strips(context):
+    """Returns True if there are strips in the current editing level, like context.sequences"""
+    if context.scene is None:
+        return False
+    collection = get_sequences_collection(context)
+    return collection is not None and len(collection) > 0
+
+
+def has_selected_strips(context):
+    """Returns True if strips are selected in the current editing level"""
+    return has_strips(context) and bool(get_strip_snapshot(context).select.any())
+
+
+def get_active_strip_type(context):
+    """Returns the type of the active strip, or None if there is none"""
+    sequence_editor = context.scene.sequence_editor if context.scene is not None else None
+    active_strip = sequence_editor.active_strip if sequence_editor else None
+    return active_strip.type if active_strip else None
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Opt-in profiler for the add-on's operators.
+When enabled, it wraps the invoke, execute, and modal methods of the operator classes and records
+each call's duration, the number of strips before and after it, and the bpy.ops calls it makes
+into a ring buffer. The buffer exports to the Chrome trace format, which chrome://tracing and
+https://ui.perfetto.dev open. See get_profiler().
+"""
+import functools
+import json
+import sys
+import time
+from collections import deque
+
+import bpy
+
+from .cache import get_sequences_collection
+
+PROFILER_BUFFER_SIZE = 10000
+PROFILED_METHODS = ("invoke", "execute", "modal")
+
+
+class ProfileEvent:
+    """
+    One timed call, to an operator method or to bpy.ops from inside a profiled operator
+    Args:
+    - category: the operator method, like "execute", or "bpy.ops" for nested operator calls
+    - start, duration: in seconds, from time.perf_counter()
+    - depth: the number of profiled calls this one is nested in
+    - strips_before, strips_after: strips in the edited level around the call, or -1
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "start",
+        "duration",
+        "depth",
+        "strips_before",
+        "strips_after",
+        "nested_calls",
+        "result",
+    )
+
+    def __init__(self, name, category, start, depth, strips_before):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = 0.0
+        self.depth = depth
+        self.strips_before = strips_before
+        self.strips_after = -1
+        self.nested_calls = 0
+        self.result = ""
+
+    def __repr__(self):
+        return "ProfileEvent {} {}: {:.3f} ms".format(
+            self.name, self.category, self.duration * 1000.0
+        )
+
+
+def count_strips(context):
+    """Returns the number of strips in the edited level, or -1 if there is no sequence editor"""
+    if context is None or context.scene is None:
+        return -1
+    collection = get_sequences_collection(context)
+    return len(collection) if collection is not None else -1
+
+
+def format_result(result):
+    """Returns an operator's return value, like {'FINISHED'}, as a string"""
+    if isinstance(result, (set, frozenset)):
+        return ", ".join(sorted(result))
+    return "" if result is None else str(result)
+
+
+class OperatorProfiler:
+    """
+    Records the calls to the operator methods it wraps in a ring buffer of `size` events.
+    Wrapping happens on the registered classes, so it can be turned on and off at any time.
+    """
+
+    def __init__(self, size=PROFILER_BUFFER_SIZE):
+        self.events = deque(maxlen=size)
+        self.origin = time.perf_counter()
+        # Events of the calls in progress, innermost last
+        self._stack = []
+        # Maps (class, method name) to the original function
+        self._originals = {}
+        self._ops_call = None
+
+    @property
+    def is_enabled(self):
+        return bool(self._originals)
+
+    def enable(self, classes):
+        """Wraps the profiled methods of the operator `classes` and the bpy.ops call function"""
+        for cls in classes:
+            for method in PROFILED_METHODS:
+                function = vars(cls).get(method)
+                if function is None or (cls, method) in self._originals:
+                    continue
+                self._originals[(cls, method)] = function
+                setattr(cls, method, self.wrap_method(cls.bl_idname, method, function))
+
+        operator_type = get_bpy_ops_operator_type()
+        if operator_type is not None and self._ops_call is None:
+            self._ops_call = operator_type.__call__
+            operator_type.__call__ = self.wrap_ops_call(self._ops_call)
+
+    def disable(self):
+        """Restores the original methods"""
+        for (cls, method), function in self._originals.items():
+            setattr(cls, method, function)
+        self._originals.clear()
+
+        operator_type = get_bpy_ops_operator_type()
+        if operator_type is not None and self._ops_call is not None:
+            operator_type.__call__ = self._ops_call
+        self._ops_call = None
+        self._stack.clear()
+
+    def clear(self):
+        self.events.clear()
+
+    def measure(self, name, category, context, function, *args):
+        """Calls `function(*args)` and records the call"""
+        if self._stack:
+            self._stack[-1].nested_calls += 1
+        event = ProfileEvent(
+            name, category, time.perf_counter(), len(self._stack), count_strips(context)
+        )
+        self._stack.append(event)
+        try:
+            result = function(*args)
+            event.result = format_result(result)
+            return result
+        except Exception:
+            event.result = "ERROR"
+            raise
+        finally:
+            event.duration = time.perf_counter() - event.start
+            self._stack.pop()
+            # The context can be invalid after an operator that loads a file
+            try:
+                event.strips_after = count_strips(context)
+            except (ReferenceError, AttributeError):
+                pass
+            self.events.append(event)
+
+    def wrap_method(self, name, method, function):
+        """
+        Returns a wrapper of the operator method `function` that records its calls.
+        Blender checks the number of arguments of operator methods, so the wrappers can't
+        take *args.
+        """
+        if method == "execute":
+
+            def wrapper(operator, context):
+                return self.measure(name, method, context, function, operator, context)
+
+        else:
+
+            def wrapper(operator, context, event):
+                return self.measure(name, method, context, function, operator, context, event)
+
+        return functools.update_wrapper(wrapper, function)
+
+    def wrap_ops_call(self, ops_call):
+        """Returns a wrapper of the bpy.ops call function that records calls inside profiled ones"""
+
+        def __call__(operator, *args, **kwargs):
+            if not self._stack:
+                return ops_call(operator, *args, **kwargs)
+            # Operator properties can have any name, so they can't go through measure()'s arguments
+            call = functools.partial(ops_call, operator, *args, **kwargs)
+            return self.measure(operator.idname_py(), "bpy.ops", bpy.context, call)
+
+        return functools.update_wrapper(__call__, ops_call)
+
+    def get_summary(self):
+        """
+        Returns a list of (name, category, calls, total, mean, max) tuples, with durations in
+        seconds, sorted by total time, slowest first
+        """
+        durations = {}
+        for event in self.events:
+            durations.setdefault((event.name, event.category), []).append(event.duration)
+        summary = [
+            (name, category, len(values), sum(values), sum(values) / len(values), max(values))
+            for (name, category), values in durations.items()
+        ]
+        summary.sort(key=lambda entry: entry[3], reverse=True)
+        return summary
+
+    def to_chrome_trace(self):
+        """Returns the recorded events as a dictionary in the Chrome trace event format"""
+        trace_events = []
+        for event in self.events:
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": (event.start - self.origin) * 1e6,
+                    "dur": event.duration * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {
+                        "strips_before": event.strips_before,
+                        "strips_after": event.strips_after,
+                        "nested_calls": event.nested_calls,
+                        "depth": event.depth,
+                        "result": event.result,
+                    },
+                }
+            )
+        trace_events.sort(key=lambda trace_event: trace_event["ts"])
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"source": "Power Sequencer"},
+        }
+
+    def export_chrome_trace(self, filepath):
+        """Writes the recorded events to `filepath` as Chrome trace JSON"""
+        with open(filepath, "w") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+def get_bpy_ops_operator_type():
+    """
+    Returns the class of bpy.ops.module.operator objects, whose __call__ runs operators, or None
+    if this version of Blender doesn't define it in Python
+    """
+    module = sys.modules.get("bpy.ops")
+    operator_type = getattr(module, "_BPyOpsSubModOp", None)
+    return operator_type if hasattr(operator_type, "idname_py") else None
+
+
+_profiler = OperatorProfiler()
+
+
+def get_profiler():
+    return _profiler
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Builds proxies of movie strips with ffmpeg.
+Proxies go where Blender looks for them, in BL_proxy folders next to the source files. Each
+proxy is encoded to a temporary file and renamed once complete, so an interrupted build resumes
+where it stopped and skips the proxies that are up to date. build_proxies() runs the encodes in a
+background Task, several at a time.
+"""
+import os
+import shutil
+import subprocess
+import threading
+
+import bpy
+
+from ...addon_preferences import get_preferences
+from .tasks import Task, submit_task
+
+PROXY_SIZES = (25, 50, 75, 100)
+
+
+class ProxyJob:
+    """
+    Data structure to represent a proxy to encode
+    """
+
+    def __init__(self, source, size, output):
+        self.source = source
+        self.size = size
+        self.output = output
+
+    def is_up_to_date(self):
+        """Returns True if the proxy exists and is more recent than its source file"""
+        try:
+            return os.path.getmtime(self.output) >= os.path.getmtime(self.source)
+        except OSError:
+            return False
+
+    def __repr__(self):
+        return "ProxyJob {}%: {} -> {}".format(self.size, self.source, self.output)
+
+
+def find_ffmpeg(context):
+    """
+    Returns the ffmpeg executable set in the add-on's preferences, or the one on the system's
+    PATH. Returns None if there is none.
+    """
+    prefs = get_preferences(context)
+    if prefs.ffmpeg_executable and prefs.ffmpeg_is_executable_valid:
+        return bpy.path.abspath(prefs.ffmpeg_executable)
+    return shutil.which("ffmpeg")
+
+
+def get_proxy_sizes(context):
+    """Returns the proxy sizes enabled in the add-on's preferences"""
+    prefs = get_preferences(context)
+    return [size for size in PROXY_SIZES if getattr(prefs, "proxy_{}".format(size))]
+
+
+def get_proxy_directory(strip):
+    """
+    Returns the folder where Blender looks for the proxies of the movie `strip`
+    """
+    source = bpy.path.abspath(strip.filepath)
+    directory, name = os.path.split(source)
+    if strip.proxy.use_proxy_custom_directory:
+        directory = bpy.path.abspath(strip.proxy.directory)
+    else:
+        directory = os.path.join(directory, "BL_proxy")
+    return os.path.join(directory, name)
+
+
+def find_proxy_jobs(strips, sizes):
+    """
+    Returns the list of ProxyJob to build the proxies of the given `sizes` for the movie `strips`.
+    Movies used by several strips only get one job per size.
+    """
+    jobs = {}
+    for s in strips:
+        if s.type != "MOVIE":
+            continue
+        source = bpy.path.abspath(s.filepath)
+        directory = get_proxy_directory(s)
+        for size in sizes:
+            output = os.path.join(directory, "proxy_{}.avi".format(size))
+            jobs.setdefault(output, ProxyJob(source, size, output))
+    return list(jobs.values())
+
+
+def get_ffmpeg_command(ffmpeg, job, output):
+    """
+    Returns the command to encode the proxy of `job` to `output` as intra-frame MJPEG video,
+    which is fast to seek and to decode during playback
+    """
+    scale = "scale=trunc(iw*{0}/200)*2:trunc(ih*{0}/200)*2".format(job.size)
+    return [
+        ffmpeg,
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        job.source,
+        "-vf",
+        scale,
+        "-c:v",
+        "mjpeg",
+        "-q:v",
+        "5",
+        "-pix_fmt",
+        "yuvj420p",
+        "-an",
+        output,
+    ]
+
+
+class ProxyBuilder:
+    """
+    Encodes proxy jobs with ffmpeg. build() is safe to call from several threads at once, and
+    cancel() stops all the ffmpeg processes that are running.
+    """
+
+    def __init__(self, ffmpeg):
+        self.ffmpeg = ffmpeg
+        self.is_cancelled = False
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    def build(self, job):
+        """
+        Encodes the proxy to a temporary file and moves it to its destination if it succeeded.
+        Returns True if it built the proxy, False if the build got cancelled, and raises a
+        RuntimeError if ffmpeg failed
+        """
+        if self.is_cancelled:
+            return False
+        os.makedirs(os.path.dirname(job.output), exist_ok=True)
+        temporary_output = os.path.splitext(job.output)[0] + ".part.avi"
+        try:
+            process = subprocess.Popen(
+                get_ffmpeg_command(self.ffmpeg, job, temporary_output),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as error:
+            raise RuntimeError("Couldn't run ffmpeg: {}".format(error))
+        with self._lock:
+            self._processes.add(process)
+            if self.is_cancelled:
+                process.terminate()
+        is_success = process.wait() == 0
+        with self._lock:
+            self._processes.discard(process)
+
+        if is_success and not self.is_cancelled:
+            os.replace(temporary_output, job.output)
+        elif os.path.exists(temporary_output):
+            os.remove(temporary_output)
+        if not (is_success or self.is_cancelled):
+            raise RuntimeError("ffmpeg couldn't encode the proxy")
+        return is_success and not self.is_cancelled
+
+    def cancel(self):
+        """Stops the running ffmpeg processes"""
+        self.is_cancelled = True
+        with self._lock:
+            for process in self._processes:
+                process.terminate()
+
+
+def build_proxies(context, strips, max_workers=0):
+    """
+    Starts a background task that builds the proxies of the movie `strips` that are missing or
+    older than their source, for the proxy sizes set in the add-on preferences.
+    Returns a tuple of (report_type, message) for the operator that calls it.
+    Args:
+    - max_workers (optional): the number of ffmpeg processes to run at once, 0 for half the CPUs
+    """
+    ffmpeg = find_ffmpeg(context)
+    if not ffmpeg:
+        return "ERROR", "Couldn't find ffmpeg. Set its path in the add-on preferences"
+
+    sizes = get_proxy_sizes(context)
+    if not sizes:
+        return "ERROR", "No proxy size set in the add-on preferences"
+
+    jobs = [job for job in find_proxy_jobs(strips, sizes) if not job.is_up_to_date()]
+    if not jobs:
+        use_proxies(context.scene, [s.name for s in strips], sizes)
+        return "INFO", "All proxies are up to date"
+
+    # Strips are looked up by name when the build ends, as they may get deleted in the meantime
+    scene_name = context.scene.name
+    strip_names = [s.name for s in strips]
+
+    def on_finish(task):
+        if task.is_cancelled:
+            return
+        scene = bpy.data.scenes.get(scene_name)
+        if scene:
+            use_proxies(scene, strip_names, sizes)
+        if task.failed_count:
+            task.set_report("WARNING", format_build_failures(task))
+        else:
+            task.set_report("INFO", "Built {} proxies".format(task.total))
+
+    builder = ProxyBuilder(ffmpeg)
+    submit_task(
+        Task(
+            "Build Proxies",
+            jobs,
+            builder.build,
+            on_finish=on_finish,
+            on_cancel=builder.cancel,
+            max_workers=max_workers or max(1, (os.cpu_count() or 2) // 2),
+        )
+    )
+    return "INFO", "Building {} proxies in the background".format(len(jobs))
+
+
+def format_build_failures(task, max_files=3):
+    """
+    Returns a message like "Built 6 proxies, 2 failed: 50% of a.mp4, 25% of b.mp4" listing the
+    first `max_files` failed jobs of the proxy build `task`
+    """
+    failures = [
+        "{}% of {}".format(job.size, os.path.basename(job.source)) for job, _ in task.errors
+    ]
+    if len(failures) > max_files:
+        failures = failures[:max_files] + ["..."]
+    return "Built {} proxies, {} failed: {}".format(
+        task.total - task.failed_count, task.failed_count, ", ".join(failures)
+    )
+
+
+def use_proxies(scene, strip_names, sizes):
+    """Makes the strips use the proxies of the given sizes"""
+    sequences = scene.sequence_editor.sequences_all
+    for name in strip_names:
+        s = sequences.get(name)
+        if not s:
+            continue
+        s.use_proxy = True
+        for size in sizes:
+            setattr(s.proxy, "build_{}".format(size), True)
@@ -0,0 +1,222 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Keeps the disk space proxies use under a budget.
+Indexes proxy files in a SQLite database with the last time a scene used them, and deletes the
+least recently used proxies of media that no open scene references when the total goes over the
+budget set in the add-on preferences. See update_proxy_storage().
+"""
+import os
+import sqlite3
+import time
+
+import bpy
+
+from .functions import get_config_directory
+from .proxy_builder import PROXY_SIZES, get_proxy_directory
+from .tasks import Task, get_tasks, submit_task
+
+DATABASE_NAME = "proxy_storage.sqlite3"
+PROXY_FILE_NAMES = tuple("proxy_{}.avi".format(size) for size in PROXY_SIZES)
+PROXY_STORAGE_TASK_NAME = "Clean Up Proxies"
+# Seconds to wait for another connection to release the database before raising
+# sqlite3.OperationalError
+DATABASE_TIMEOUT = 10.0
+
+
+def get_database_path():
+    return os.path.join(get_config_directory(), DATABASE_NAME)
+
+
+class ProxyStorage:
+    """
+    SQLite table of known proxy files with their source media, size, and last use time
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, timeout=DATABASE_TIMEOUT)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS proxies "
+            "(path TEXT PRIMARY KEY, source TEXT, size_bytes INTEGER, last_used REAL)"
+        )
+
+    def mark_used(self, proxies, timestamp=None):
+        """
+        Stores the proxies in the database and sets their last use time
+        Args:
+        - proxies: a list of (proxy_path, source_path) tuples
+        """
+        timestamp = timestamp or time.time()
+        rows = []
+        for path, source in proxies:
+            try:
+                rows.append((path, source, os.path.getsize(path), timestamp))
+            except OSError:
+                continue
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO proxies VALUES (?, ?, ?, ?)", rows)
+
+    def forget_missing(self):
+        """Removes the proxies that don't exist on the disk anymore from the database"""
+        paths = [row[0] for row in self.connection.execute("SELECT path FROM proxies")]
+        missing = [(path,) for path in paths if not os.path.isfile(path)]
+        with self.connection:
+            self.connection.executemany("DELETE FROM proxies WHERE path = ?", missing)
+
+    def get_total_size(self):
+        row = self.connection.execute("SELECT SUM(size_bytes) FROM proxies").fetchone()
+        return row[0] or 0
+
+    def evict(self, budget_bytes, protected_sources):
+        """
+        Deletes the least recently used proxies until their total size is under `budget_bytes`,
+        skipping the proxies of the `protected_sources`.
+        Returns the list of deleted proxy paths.
+        """
+        total_size = self.get_total_size()
+        if total_size <= budget_bytes:
+            return []
+
+        evicted = []
+        query = "SELECT path, source, size_bytes FROM proxies ORDER BY last_used"
+        for path, source, size_bytes in self.connection.execute(query).fetchall():
+            if total_size <= budget_bytes:
+                break
+            if source in protected_sources:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            remove_empty_directory(os.path.dirname(path))
+            evicted.append(path)
+            total_size -= size_bytes
+
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM proxies WHERE path = ?", [(path,) for path in evicted]
+            )
+        return evicted
+
+    def close(self):
+        self.connection.close()
+
+
+def remove_empty_directory(path):
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def find_scene_proxy_directories():
+    """
+    Returns a tuple of (directories, sources): the list of (proxy_directory, source_path) tuples
+    of the movie strips that use proxies in all scenes, and the set of the source files of all
+    movie strips. Reads Blender data, so it must run on the main thread.
+    """
+    directories, sources = set(), set()
+    for scene in bpy.data.scenes:
+        if not scene.sequence_editor:
+            continue
+        for s in scene.sequence_editor.sequences_all:
+            if s.type != "MOVIE":
+                continue
+            source = bpy.path.abspath(s.filepath)
+            sources.add(source)
+            if s.use_proxy:
+                directories.add((get_proxy_directory(s), source))
+    return list(directories), sources
+
+
+def find_proxy_files(directories):
+    """
+    Returns the list of (proxy_path, source_path) tuples of the proxy files that exist in the
+    `directories` returned by find_scene_proxy_directories()
+    """
+    proxies = []
+    for directory, source in directories:
+        for name in PROXY_FILE_NAMES:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                proxies.append((path, source))
+    return proxies
+
+
+def find_missing_proxies(context):
+    """
+    Returns the movie strips of the scene that use proxies but miss one of the proxy files they
+    should have
+    """
+    missing = []
+    for s in context.scene.sequence_editor.sequences_all:
+        if not (s.type == "MOVIE" and s.use_proxy):
+            continue
+        directory = get_proxy_directory(s)
+        for size in PROXY_SIZES:
+            if not getattr(s.proxy, "build_{}".format(size)):
+                continue
+            if not os.path.isfile(os.path.join(directory, "proxy_{}.avi".format(size))):
+                missing.append(s)
+                break
+    return missing
+
+
+def update_proxy_storage(budget_gb=0.0):
+    """
+    Marks the proxies of all open scenes as used now, and if `budget_gb` is greater than 0,
+    evicts the least recently used proxies of media the open scenes don't reference.
+    Returns a tuple of (evicted_paths, total_size_bytes).
+    """
+    directories, sources = find_scene_proxy_directories()
+    return update_proxy_database(directories, sources, budget_gb)
+
+
+def update_proxy_storage_in_background(budget_gb=0.0):
+    """
+    Like update_proxy_storage(), but walks the proxy folders and writes to the database in a
+    background Task, so large proxy folders don't freeze the interface.
+    Returns the Task, or None if an update is already running.
+    """
+    if any(task.name == PROXY_STORAGE_TASK_NAME for task in get_tasks()):
+        return None
+    directories, sources = find_scene_proxy_directories()
+    return submit_task(
+        Task(
+            PROXY_STORAGE_TASK_NAME,
+            [(directories, sources)],
+            lambda item: update_proxy_database_unless_locked(item[0], item[1], budget_gb),
+        )
+    )
+
+
+def update_proxy_database_unless_locked(directories, sources, budget_gb=0.0):
+    """
+    Calls update_proxy_database(), or skips the update and returns None if another connection
+    keeps the database locked. For automatic updates: the next one records the proxies anyway.
+    """
+    try:
+        return update_proxy_database(directories, sources, budget_gb)
+    except sqlite3.OperationalError:
+        return None
+
+
+def update_proxy_database(directories, sources, budget_gb=0.0):
+    """
+    Records the proxies in `directories` as used now and evicts old proxies to stay under
+    `budget_gb`. Doesn't access Blender data, so it can run on any thread: the database
+    connection is opened and closed in the calling thread.
+    Returns a tuple of (evicted_paths, total_size_bytes).
+    """
+    proxies = find_proxy_files(directories)
+    storage = ProxyStorage(get_database_path())
+    try:
+        storage.forget_missing()
+        storage.mark_used(proxies)
+        evicted = storage.evict(budget_gb * 1024**3, sources) if budget_gb > 0 else []
+        total_size = storage.get_total_size()
+    finally:
+        storage.close()
+    return evicted, total_size
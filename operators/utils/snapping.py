@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Magnetic snapping to strip cuts, strip keyframes, timeline markers, and the time cursor.
+Keeps sorted arrays of the frames to snap to so finding the closest one is a binary search, and
+only snaps within a distance in pixels, converted to frames with the view's zoom.
+See find_snap_frame().
+"""
+import numpy as np
+
+from .cache import SequencerCache
+from .cut_index import get_keyframe_frames, get_marker_frames
+from .hit_test import ViewTransform
+from .strip_snapshot import get_strip_snapshot
+
+# In order of priority when two targets are at the same distance
+SNAP_SOURCES = ("CUTS", "MARKERS", "KEYFRAMES", "PLAYHEAD")
+
+
+class SnapIndex:
+    """
+    Sorted arrays of the unique cut frames of the strips in `snapshot`, of the keyframes of these
+    strips in `keyframe_frames`, see get_keyframe_frames(), and of the `marker_frames`
+    """
+
+    def __init__(self, snapshot, keyframe_frames, marker_frames):
+        self.keyframe_frames = keyframe_frames
+        self.markers_count = len(marker_frames)
+        self.markers = np.unique(marker_frames)
+        self.cuts = np.unique(
+            np.concatenate((snapshot.frame_final_start, snapshot.frame_final_end))
+        )
+        keyframes = [
+            frames
+            for name, frames in keyframe_frames.items()
+            if snapshot.count and snapshot.collection.find(name) != -1
+        ]
+        self.keyframes = np.unique(np.concatenate(keyframes)) if keyframes else np.empty(0, int)
+
+
+def build_snap_index(context):
+    return SnapIndex(
+        get_strip_snapshot(context), get_keyframe_frames(context), get_marker_frames(context)
+    )
+
+
+_snap_index_cache = SequencerCache(build_snap_index)
+
+
+def get_snap_index(context, check_keyframes=True):
+    """
+    Returns the SnapIndex of `context.sequences`, rebuilding it if the strips, the number of
+    markers, or with `check_keyframes`, the strips' keyframes changed
+    """
+    snap_index = _snap_index_cache.get(context)
+    if snap_index.markers_count != len(context.scene.timeline_markers) or (
+        check_keyframes and snap_index.keyframe_frames is not get_keyframe_frames(context)
+    ):
+        _snap_index_cache.clear()
+        snap_index = _snap_index_cache.get(context)
+    return snap_index
+
+
+def find_nearest(frames, frame):
+    """Returns the value in the sorted array `frames` closest to `frame`, or None if it's empty"""
+    index = int(np.searchsorted(frames, frame))
+    candidates = frames[max(index - 1, 0) : index + 1]
+    if not len(candidates):
+        return None
+    return int(candidates[np.argmin(np.abs(candidates - frame))])
+
+
+def get_snap_sources(context):
+    """Returns the snap sources enabled in the scene's Power Sequencer settings"""
+    settings = context.scene.power_sequencer
+    return [
+        source for source in SNAP_SOURCES if getattr(settings, "snap_to_{}".format(source.lower()))
+    ]
+
+
+def get_snap_distance(context):
+    """
+    Returns the snap distance from the scene's settings converted from pixels to frames with the
+    zoom of the region under the mouse, or None if the region has no view to measure it
+    """
+    view2d = getattr(context.region, "view2d", None)
+    if not view2d:
+        return None
+    pixels = context.scene.power_sequencer.snap_distance
+    return pixels * abs(ViewTransform(context.region).frames_per_pixel)
+
+
+def find_snap_frame(context, frame, sources=None, playhead=None, max_distance=None):
+    """
+    Returns a tuple of (frame, source) with the snap target closest to `frame` and its source in
+    SNAP_SOURCES, or (frame, None) if there is no target within `max_distance` frames.
+    Args:
+    - sources (optional): the sources to snap to, all of them by default
+    - playhead (optional): the frame of the time cursor, the scene's current frame by default.
+    Operators that move the time cursor as they run should pass its initial frame
+    - max_distance (optional): the maximum distance to snap from, in frames
+    """
+    sources = SNAP_SOURCES if sources is None else sources
+    snap_index = get_snap_index(context, "KEYFRAMES" in sources)
+    targets = {}
+    if "CUTS" in sources:
+        targets["CUTS"] = find_nearest(snap_index.cuts, frame)
+    if "MARKERS" in sources:
+        targets["MARKERS"] = find_nearest(snap_index.markers, frame)
+    if "KEYFRAMES" in sources:
+        targets["KEYFRAMES"] = find_nearest(snap_index.keyframes, frame)
+    if "PLAYHEAD" in sources:
+        targets["PLAYHEAD"] = context.scene.frame_current if playhead is None else playhead
+
+    snap_frame, snap_source = frame, None
+    best_distance = max_distance if max_distance is not None else float("inf")
+    for source in SNAP_SOURCES:
+        target = targets.get(source)
+        if target is None:
+            continue
+        distance = abs(target - frame)
+        if distance < best_distance or (distance == best_distance and snap_source is None):
+            snap_frame, snap_source, best_distance = target, source, distance
+    return snap_frame, snap_source
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Applies many cuts and trims to strips in one pass. See apply_cuts().
+"""
+from bisect import bisect_right
+from collections import defaultdict
+
+import bpy
+
+from .cache import invalidate
+from .global_settings import SequenceTypes
+from .strip_index import get_strip_index
+
+
+def apply_cuts(context, cuts=(), trims=(), sequences=None, to_delete=()):
+    """
+    Cuts strips at the given frames and removes the content of strips in the given frame ranges.
+    Args:
+    - cuts: a list of (frame, channels) tuples. `channels` is a set of channels to cut in, or None
+    to cut in all channels
+    - trims: a list of (frame_start, frame_end, channels) tuples, the frame ranges to remove
+    - sequences (optional): only cut and trim these sequences. If it doesn't receive any, the
+    function works with all the unlocked strips in the current context
+    - to_delete (optional): other strips to delete along with the ones the trims fully cover
+
+    Computes the pieces to keep for every strip, then cuts them from the right with one split per
+    piece and sets the handles of each piece directly. Deletes all the strips to remove at the end.
+    Returns the list of the resulting strips, sorted by channel and frame_final_start.
+    """
+    cuts_per_strip, trims_per_strip = find_strips_to_cut(context, cuts, trims, sequences)
+
+    initial_selection = context.selected_sequences
+    to_delete = list(to_delete)
+    resulting_strips, pieces_to_select = [], []
+    uses_operator = False
+    for s in set(cuts_per_strip) | set(trims_per_strip):
+        pieces = calculate_pieces(
+            s.frame_final_start,
+            s.frame_final_end,
+            cuts_per_strip.get(s, []),
+            trims_per_strip.get(s, []),
+        )
+        if not pieces:
+            to_delete.append(s)
+            continue
+
+        was_selected = s.select
+        strip_pieces = [s]
+        for frame_start, frame_end in reversed(pieces[1:]):
+            right = split_strip(context, s, frame_start)
+            uses_operator = uses_operator or not hasattr(s, "split")
+            if right.frame_final_end != frame_end:
+                right.frame_final_end = frame_end
+            strip_pieces.append(right)
+
+        frame_start, frame_end = pieces[0]
+        if s.frame_final_end != frame_end:
+            s.frame_final_end = frame_end
+        if s.frame_final_start != frame_start:
+            s.frame_final_start = frame_start
+        resulting_strips.extend(strip_pieces)
+        if was_selected:
+            pieces_to_select.extend(strip_pieces)
+
+    to_delete = [s for s in to_delete if s not in resulting_strips]
+    if uses_operator:
+        restore_selection(initial_selection + pieces_to_select, to_delete)
+    delete_strips(to_delete)
+    invalidate()
+    return sorted(resulting_strips, key=lambda s: (s.channel, s.frame_final_start))
+
+
+def find_strips_to_cut(context, cuts, trims, sequences=None):
+    """
+    Returns two dictionaries mapping each strip to the sorted list of frames to cut it at, and to
+    the list of frame ranges to remove from it
+    """
+    if sequences is None:
+        strip_index = get_strip_index(context)
+
+        def find_strips(frame_start, frame_end, channels):
+            return [
+                s
+                for s in strip_index.find_overlapping(frame_start, frame_end, channels)
+                if not s.lock and s.type in SequenceTypes.CUTABLE
+            ]
+
+    else:
+        sequences = [s for s in sequences if s.type in SequenceTypes.CUTABLE]
+
+        def find_strips(frame_start, frame_end, channels):
+            return [
+                s
+                for s in sequences
+                if s.frame_final_start <= frame_end
+                and s.frame_final_end >= frame_start
+                and (channels is None or s.channel in channels)
+            ]
+
+    cuts_per_strip = defaultdict(list)
+    for frame, channels in sorted(cuts, key=lambda c: c[0]):
+        for s in find_strips(frame, frame, channels):
+            if s.frame_final_start < frame < s.frame_final_end:
+                cuts_per_strip[s].append(frame)
+
+    trims_per_strip = defaultdict(list)
+    for frame_start, frame_end, channels in trims:
+        frame_start, frame_end = min(frame_start, frame_end), max(frame_start, frame_end)
+        for s in find_strips(frame_start, frame_end, channels):
+            trims_per_strip[s].append((frame_start, frame_end))
+    return cuts_per_strip, trims_per_strip
+
+
+def calculate_pieces(frame_start, frame_end, cut_frames, trim_ranges):
+    """
+    Returns the sorted list of (frame_start, frame_end) pieces that remain of a strip going from
+    `frame_start` to `frame_end` after removing the `trim_ranges` and cutting at `cut_frames`
+    """
+    segments = []
+    cursor = frame_start
+    for trim_start, trim_end in sorted(trim_ranges):
+        if trim_start > cursor:
+            segments.append((cursor, min(trim_start, frame_end)))
+        cursor = max(cursor, trim_end)
+        if cursor >= frame_end:
+            break
+    if cursor < frame_end:
+        segments.append((cursor, frame_end))
+
+    pieces = []
+    for segment_start, segment_end in segments:
+        index = bisect_right(cut_frames, segment_start)
+        for frame in cut_frames[index:]:
+            if frame >= segment_end:
+                break
+            pieces.append((segment_start, frame))
+            segment_start = frame
+        pieces.append((segment_start, segment_end))
+    return pieces
+
+
+def split_strip(context, strip, frame):
+    """
+    Splits the strip at `frame` and returns the right part.
+    Uses Sequence.split in recent versions of Blender and the split operator in older versions.
+    """
+    if hasattr(strip, "split"):
+        return strip.split(frame=frame, split_method="SOFT")
+
+    bpy.ops.sequencer.select_all(action="DESELECT")
+    strip.select = True
+    bpy.ops.sequencer.split(frame=frame, type="SOFT", side="RIGHT")
+    return context.selected_sequences[0]
+
+
+def restore_selection(to_select, to_delete):
+    """
+    Selects the strips that were selected before calling the split operator, and the new pieces
+    of the selected strips
+    """
+    bpy.ops.sequencer.select_all(action="DESELECT")
+    for s in to_select:
+        if s not in to_delete:
+            s.select = True
+
+
+def delete_strips(to_delete):
+    """
+    Deletes the list of sequences `to_delete` in one pass
+    """
+    # Effect strips get deleted with their source so we skip them to avoid errors.
+    to_delete = [s for s in to_delete if s.type in SequenceTypes.CUTABLE]
+    sequences = bpy.context.scene.sequence_editor.sequences
+    for s in to_delete:
+        sequences.remove(s)
+    invalidate()
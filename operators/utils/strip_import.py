@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Creates strips from files with the sequences.new_* functions instead of the add strip operators.
+plan_import() decides the channel and order of every strip up front, and create_strips() creates
+them one after the other in a single loop, without changing the selection or redrawing the UI.
+"""
+import os
+import re
+from collections import defaultdict
+
+from .cache import get_sequences_collection, invalidate
+from .strip_snapshot import get_strip_snapshot
+
+# Matches file names ending with a frame number, like shot_0001.png
+NUMBERED_FILE_PATTERN = re.compile(r"^(.*?)(\d+)(\.[^.]+)$")
+MIN_SEQUENCE_LENGTH = 3
+
+
+class ImportItem:
+    """
+    Data structure to represent a strip to create
+    Args:
+    - type: one of "MOVIE", "SOUND", "IMAGE", or "IMAGE_SEQUENCE"
+    - channel: the channel to create the strip in
+    - sound_channel: for movies with sound, the channel of the sound strip
+    - frames: for image sequences, the sorted file names of the images after the first one
+    """
+
+    def __init__(self, type, filepath, channel, sound_channel=0, frames=()):
+        self.type = type
+        self.filepath = filepath
+        self.channel = channel
+        self.sound_channel = sound_channel
+        self.frames = frames
+
+    def __repr__(self):
+        return "ImportItem {}: {} in channel {}".format(self.type, self.filepath, self.channel)
+
+
+def plan_import(
+    context,
+    frame,
+    videos,
+    audios,
+    images,
+    keep_audio=True,
+    media_info=None,
+    detect_image_sequences=True,
+):
+    """
+    Returns the list of ImportItem to create, with each type of file in its own channel above the
+    strips after `frame`: audio files first, then videos with their sound below them, then images
+    Args:
+    - media_info (optional): a dictionary mapping file paths to a MediaInfo, to only create sound
+    strips for videos that have audio
+    - detect_image_sequences (optional): import runs of numbered images as image sequences
+    """
+    media_info = media_info or {}
+    snapshot = get_strip_snapshot(context)
+    used_channels = snapshot.channel[snapshot.frame_final_end > frame]
+    channel = int(used_channels.max()) + 1 if used_channels.size else 1
+
+    plan = []
+    if audios:
+        plan.extend(ImportItem("SOUND", f, channel) for f in audios)
+        channel += 1
+    if videos:
+        sound_channel = 0
+        if keep_audio:
+            sound_channel, channel = channel, channel + 1
+        for f in videos:
+            info = media_info.get(f)
+            has_audio = info.has_audio if info else True
+            plan.append(ImportItem("MOVIE", f, channel, sound_channel if has_audio else 0))
+        channel += 1
+    if images:
+        image_sequences, stills = (
+            find_image_sequences(images) if detect_image_sequences else ([], images)
+        )
+        for run in image_sequences:
+            frames = [os.path.basename(f) for f in run[1:]]
+            plan.append(ImportItem("IMAGE_SEQUENCE", run[0], channel, frames=frames))
+        plan.extend(ImportItem("IMAGE", f, channel) for f in stills)
+    return plan
+
+
+def find_image_sequences(filepaths):
+    """
+    Groups images with the same folder, name prefix, and extension, that end with consecutive
+    frame numbers.
+    Returns a tuple of two lists: (image_sequences, stills). Each image sequence is a list of file
+    paths sorted by frame number. Stills are all the other images.
+    """
+    groups = defaultdict(list)
+    stills = []
+    for path in filepaths:
+        directory, name = os.path.split(path)
+        match = NUMBERED_FILE_PATTERN.match(name)
+        if not match:
+            stills.append(path)
+            continue
+        prefix, number, extension = match.groups()
+        groups[(directory, prefix, extension.lower())].append((int(number), path))
+
+    image_sequences = []
+    for numbered_files in groups.values():
+        numbered_files.sort()
+        run = [numbered_files[0]]
+        for numbered_file in numbered_files[1:]:
+            if numbered_file[0] == run[-1][0] + 1:
+                run.append(numbered_file)
+                continue
+            add_run(run, image_sequences, stills)
+            run = [numbered_file]
+        add_run(run, image_sequences, stills)
+    return image_sequences, stills
+
+
+def add_run(run, image_sequences, stills):
+    paths = [path for number, path in run]
+    if len(paths) >= MIN_SEQUENCE_LENGTH:
+        image_sequences.append(paths)
+    else:
+        stills.extend(paths)
+
+
+def create_strips(context, plan, frame, image_length, image_padding, set_strip_options=None):
+    """
+    Creates the strips in `plan`, placing strips of each channel one after the other from `frame`.
+    Returns the list of the new strips.
+    Args:
+    - image_length, image_padding: the duration of image strips and the gap between them in frames
+    - set_strip_options (optional): a function called with each new strip to set its properties
+    """
+    sequences = get_sequences_collection(context)
+    next_frames = {}
+    created = []
+    for item in plan:
+        frame_start = next_frames.get(item.channel, frame)
+        name = os.path.basename(item.filepath)
+        if item.type == "SOUND":
+            strips = [sequences.new_sound(name, item.filepath, item.channel, frame_start)]
+        elif item.type == "MOVIE":
+            strips = [sequences.new_movie(name, item.filepath, item.channel, frame_start)]
+            if item.sound_channel:
+                try:
+                    strips.append(
+                        sequences.new_sound(name, item.filepath, item.sound_channel, frame_start)
+                    )
+                except RuntimeError:
+                    pass
+        elif item.type == "IMAGE_SEQUENCE":
+            strip = sequences.new_image(name, item.filepath, item.channel, frame_start)
+            for frame_name in item.frames:
+                strip.elements.append(frame_name)
+            strips = [strip]
+        else:
+            strip = sequences.new_image(name, item.filepath, item.channel, frame_start)
+            strip.frame_final_duration = image_length
+            strips = [strip]
+
+        frame_end = strips[0].frame_final_end
+        is_image = item.type in ["IMAGE", "IMAGE_SEQUENCE"]
+        next_frames[item.channel] = frame_end + (image_padding if is_image else 0)
+        for s in strips:
+            if set_strip_options:
+                set_strip_options(s)
+            created.append(s)
+
+    invalidate()
+    return created
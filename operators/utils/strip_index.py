@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Sorted index of the strips in the current editing level, to find strips by frame and channel
+without looping over all of `context.sequences`. Use get_strip_index() to get an up-to-date index.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import attrgetter
+
+from .cache import SequencerCache
+
+
+class ChannelIndex:
+    """
+    Strips of a single channel sorted by frame_final_start.
+    `max_ends[i]` is the highest frame_final_end of the strips up to index i, which lets us stop
+    searching backwards as soon as no earlier strip can reach a given frame.
+    """
+
+    def __init__(self, strips):
+        self.strips = sorted(strips, key=attrgetter("frame_final_start"))
+        self.starts = [s.frame_final_start for s in self.strips]
+        self.ends = [s.frame_final_end for s in self.strips]
+
+        self.max_ends = []
+        max_end = None
+        for end in self.ends:
+            max_end = end if max_end is None else max(max_end, end)
+            self.max_ends.append(max_end)
+
+        self.strips_by_end = sorted(self.strips, key=attrgetter("frame_final_end"))
+        self.sorted_ends = [s.frame_final_end for s in self.strips_by_end]
+
+    def find_overlapping(self, frame_start, frame_end):
+        """
+        Returns the strips that start before or at `frame_end` and end after or at `frame_start`,
+        sorted by frame_final_start
+        """
+        found = []
+        index = bisect_right(self.starts, frame_end) - 1
+        while index >= 0 and self.max_ends[index] >= frame_start:
+            if self.ends[index] >= frame_start:
+                found.append(self.strips[index])
+            index -= 1
+        found.reverse()
+        return found
+
+    def find_next(self, frame):
+        """Returns the first strip that starts at or after `frame`, or None"""
+        index = bisect_left(self.starts, frame)
+        return self.strips[index] if index < len(self.strips) else None
+
+    def find_previous(self, frame):
+        """Returns the last strip that ends at or before `frame`, or None"""
+        index = bisect_right(self.sorted_ends, frame) - 1
+        return self.strips_by_end[index] if index >= 0 else None
+
+
+class StripIndex:
+    """
+    Index of a list of strips by channel and by cut frame.
+    Lookups take O(log n) per channel instead of reading every strip's properties.
+    """
+
+    def __init__(self, sequences):
+        self.strips = sorted(sequences, key=attrgetter("frame_final_start"))
+        self.starts = [s.frame_final_start for s in self.strips]
+
+        self.strips_by_end = sorted(self.strips, key=attrgetter("frame_final_end"))
+        self.ends = [s.frame_final_end for s in self.strips_by_end]
+
+        self.cuts = sorted(set(self.starts) | set(self.ends))
+        self.strips_starting_at = defaultdict(list)
+        self.strips_ending_at = defaultdict(list)
+        for s, start in zip(self.strips, self.starts):
+            self.strips_starting_at[start].append(s)
+        for s, end in zip(self.strips_by_end, self.ends):
+            self.strips_ending_at[end].append(s)
+
+        strips_per_channel = defaultdict(list)
+        for s in self.strips:
+            strips_per_channel[s.channel].append(s)
+        self.channels = {
+            channel: ChannelIndex(strips) for channel, strips in strips_per_channel.items()
+        }
+
+    def find_at_frame(self, frame, channels=None):
+        """
+        Returns the strips that overlap `frame`, including strips that start or end on it.
+        Args:
+        - channels (optional): only search in these channels
+        """
+        return self.find_overlapping(frame, frame, channels)
+
+    def find_overlapping(self, frame_start, frame_end, channels=None):
+        """
+        Returns the strips that overlap the closed range [frame_start, frame_end]
+        Args:
+        - channels (optional): only search in these channels
+        """
+        channels = self.channels.keys() if channels is None else channels
+        found = []
+        for channel in channels:
+            channel_index = self.channels.get(channel)
+            if channel_index:
+                found.extend(channel_index.find_overlapping(frame_start, frame_end))
+        return found
+
+    def find_starting_after(self, frame):
+        """Returns the strips that start strictly after `frame`, sorted by frame_final_start"""
+        return self.strips[bisect_right(self.starts, frame) :]
+
+    def find_ending_before(self, frame):
+        """Returns the strips that end at or before `frame`, sorted by frame_final_end"""
+        return self.strips_by_end[: bisect_right(self.ends, frame)]
+
+    def find_next_in_channel(self, channel, frame):
+        """Returns the first strip in `channel` that starts at or after `frame`, or None"""
+        channel_index = self.channels.get(channel)
+        return channel_index.find_next(frame) if channel_index else None
+
+    def find_previous_in_channel(self, channel, frame):
+        """Returns the last strip in `channel` that ends at or before `frame`, or None"""
+        channel_index = self.channels.get(channel)
+        return channel_index.find_previous(frame) if channel_index else None
+
+    def find_cut_before(self, frame):
+        """Returns the last cut at or before `frame`, or None"""
+        index = bisect_right(self.cuts, frame) - 1
+        return self.cuts[index] if index >= 0 else None
+
+    def find_cut_after(self, frame):
+        """Returns the first cut at or after `frame`, or None"""
+        index = bisect_left(self.cuts, frame)
+        return self.cuts[index] if index < len(self.cuts) else None
+
+    def find_nearest_cut(self, frame):
+        """Returns the cut closest to `frame`, or None if there are no strips"""
+        before, after = self.find_cut_before(frame), self.find_cut_after(frame)
+        if before is None or after is None:
+            return after if before is None else before
+        return before if frame - before <= after - frame else after
+
+    def find_end_before(self, frame):
+        """Returns the last strip end at or before `frame`, or None"""
+        index = bisect_right(self.ends, frame) - 1
+        return self.ends[index] if index >= 0 else None
+
+    def find_start_after(self, frame):
+        """Returns the first strip start at or after `frame`, or None"""
+        index = bisect_left(self.starts, frame)
+        return self.starts[index] if index < len(self.starts) else None
+
+
+def build_strip_index(context):
+    return StripIndex(context.sequences or [])
+
+
+_strip_index_cache = SequencerCache(build_strip_index)
+
+
+def get_strip_index(context):
+    """
+    Returns the StripIndex of `context.sequences`, rebuilding it if the strips changed
+    """
+    return _strip_index_cache.get(context)
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Moves many strips at once by writing their frame_start and channel directly.
+Unlike bpy.ops.transform.seq_slide, it doesn't touch the selection or go through the operator
+stack, so operators can move thousands of strips in one call. See move_strips().
+"""
+from bisect import bisect_left, insort
+
+import bpy
+
+from .cache import invalidate
+from .channel_links import get_channel_links
+from .keyframes import offset_keyframes
+
+
+class ChannelOccupancy:
+    """
+    Frame ranges taken by strips in each channel, to test for overlaps while planning and applying
+    moves. Ranges are half-open so strips can touch without overlapping.
+    Args:
+    - load_channel (optional): a function that returns the sorted list of (start, end, key) ranges
+    of a channel, called the first time the channel is used
+    """
+
+    def __init__(self, load_channel=None):
+        self.channels = {}
+        self.load_channel = load_channel
+
+    def get_ranges(self, channel):
+        ranges = self.channels.get(channel)
+        if ranges is None:
+            ranges = self.load_channel(channel) if self.load_channel else []
+            self.channels[channel] = ranges
+        return ranges
+
+    def add(self, channel, start, end, key):
+        insort(self.get_ranges(channel), (start, end, key))
+
+    def remove(self, channel, start, end, key):
+        ranges = self.get_ranges(channel)
+        index = bisect_left(ranges, (start, end, key))
+        if index < len(ranges) and ranges[index] == (start, end, key):
+            del ranges[index]
+
+    def is_free(self, channel, start, end, ignore=None):
+        ranges = self.get_ranges(channel)
+        if not ranges:
+            return True
+        index = bisect_left(ranges, (end,)) - 1
+        while index >= 0:
+            range_start, range_end, key = ranges[index]
+            index -= 1
+            if key == ignore:
+                continue
+            return range_end <= start
+        return True
+
+    def get_last_end(self, channel):
+        ranges = self.get_ranges(channel)
+        return max(r[1] for r in ranges) if ranges else 0
+
+
+def move_strips(context, offsets, move_keyframes=True):
+    """
+    Moves strips by a number of frames and channels without changing the selection.
+    Args:
+    - offsets: a dictionary mapping strips to a (frame_offset, channel_offset) tuple
+    - move_keyframes (optional): also move the strips' animation, like their fades
+
+    Plans all the target positions in one pass: if a strip's target overlaps a strip that doesn't
+    move or the target of another moved strip, it goes to the first free channel above, like
+    Blender's shuffle. Then it orders the writes so strips never overlap while moving, and writes
+    frame_start and channel once per strip in most cases.
+    Locked strips don't move. Effect strips with inputs only change channel, as their frames
+    follow their inputs.
+    """
+    links = get_channel_links(context)
+    snapshot = links.snapshot
+    offsets = {
+        s: offset
+        for s, offset in offsets.items()
+        if offset != (0, 0) and not snapshot.lock[snapshot.get_index(s)]
+    }
+    if not offsets:
+        return
+
+    moving = {snapshot.get_index(s): s for s in offsets}
+
+    # Only reads the strips of the channels that strips move from or to
+    def load_channel(channel, skip_moving=False):
+        return [
+            (int(snapshot.frame_final_start[i]), int(snapshot.frame_final_end[i]), i)
+            for i in links.iter_channel(channel)
+            if not (skip_moving and i in moving)
+        ]
+
+    live = ChannelOccupancy(load_channel)
+    static = ChannelOccupancy(lambda channel: load_channel(channel, skip_moving=True))
+
+    positions = {
+        index: (
+            int(snapshot.channel[index]),
+            int(snapshot.frame_final_start[index]),
+            int(snapshot.frame_final_end[index]),
+        )
+        for index in moving
+    }
+    targets = plan_targets(offsets, moving, positions, static)
+
+    def write_order(index):
+        frame_offset, channel_offset = offsets[moving[index]]
+        channel, start, end = positions[index]
+        return (-sign(channel_offset) * channel, -sign(frame_offset) * start)
+
+    pending = sorted((i for i in moving if not is_effect_with_inputs(moving[i])), key=write_order)
+    parked = set()
+    while pending:
+        remaining = [i for i in pending if not move_strip(moving[i], i, positions, targets, live)]
+        if len(remaining) == len(pending):
+            # Strips wait for each other in a cycle: move one out of the way, and if it's still
+            # blocked after that, write its position anyway and let Blender shuffle it
+            index = remaining[0]
+            if index in parked:
+                move_strip(moving[index], index, positions, targets, live, force=True)
+                remaining.remove(index)
+            else:
+                park_strip(moving[index], index, positions, live)
+                parked.add(index)
+        pending = remaining
+
+    for index, s in moving.items():
+        if is_effect_with_inputs(s) and s.channel != targets[index][0]:
+            s.channel = targets[index][0]
+    if move_keyframes:
+        offset_keyframes(context, {s: offset[0] for s, offset in offsets.items()})
+    invalidate()
+
+
+def plan_targets(offsets, moving, positions, static):
+    """
+    Returns a dictionary mapping the index of each moving strip to its target
+    (channel, frame_final_start, frame_final_end)
+    """
+    max_channel = bpy.types.Sequence.bl_rna.properties["channel"].hard_max
+    planned = ChannelOccupancy()
+    targets = {}
+    for index in sorted(moving, key=lambda i: positions[i]):
+        frame_offset, channel_offset = offsets[moving[index]]
+        channel, start, end = positions[index]
+        start, end = start + frame_offset, end + frame_offset
+        channel = min(max(1, channel + channel_offset), max_channel)
+        while channel < max_channel and not (
+            static.is_free(channel, start, end) and planned.is_free(channel, start, end)
+        ):
+            channel += 1
+        planned.add(channel, start, end, index)
+        targets[index] = (channel, start, end)
+    return targets
+
+
+def move_strip(strip, index, positions, targets, live, force=False):
+    """
+    Writes the strip's target position if it's free, or always if `force` is True.
+    Returns False if another strip is in the way, so the caller can retry later.
+    """
+    channel, start, end = positions[index]
+    target_channel, target_start, target_end = targets[index]
+    if not (force or live.is_free(target_channel, target_start, target_end, index)):
+        return False
+
+    # When changing both the frames and the channel, the strip must not overlap another strip in
+    # between the two writes or Blender shuffles it
+    write_frame_first = target_channel == channel or live.is_free(
+        channel, target_start, target_end, index
+    )
+    if not (write_frame_first or force or live.is_free(target_channel, start, end, index)):
+        park_strip(strip, index, positions, live, target_channel)
+        channel, start, end = positions[index]
+        write_frame_first = False
+
+    live.remove(channel, start, end, index)
+    set_strip_position(
+        strip, start, target_start, channel, target_channel, frame_last=not write_frame_first
+    )
+    live.add(target_channel, target_start, target_end, index)
+    positions[index] = targets[index]
+    return True
+
+
+def park_strip(strip, index, positions, live, other_channel=None):
+    """
+    Moves a strip after the last strip of its channel, and of `other_channel`, to free its slot
+    for strips that are waiting for it to move
+    """
+    channel, start, end = positions[index]
+    channels = [channel] if other_channel is None else [channel, other_channel]
+    park_start = max(live.get_last_end(c) for c in channels) + 1
+    park_end = park_start + end - start
+
+    live.remove(channel, start, end, index)
+    set_strip_position(strip, start, park_start, channel, channel)
+    live.add(channel, park_start, park_end, index)
+    positions[index] = (channel, park_start, park_end)
+
+
+def set_strip_position(strip, start, target_start, channel, target_channel, frame_last=False):
+    if frame_last and target_channel != channel:
+        strip.channel = target_channel
+    if target_start != start:
+        strip.frame_start += target_start - start
+    if not frame_last and target_channel != channel:
+        strip.channel = target_channel
+
+
+def is_effect_with_inputs(strip):
+    return getattr(strip, "input_count", 0) > 0
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
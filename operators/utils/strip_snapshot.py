@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Bulk copy of the strips' frames, channels, and flags into NumPy arrays.
+Reading these properties strip by strip is the main cost of operators on long timelines: the
+snapshot reads each of them for all strips with a single call to foreach_get, and the masks below
+filter strips without touching Blender's data.
+"""
+import numpy as np
+
+from .cache import SequencerCache, get_sequences_collection
+
+
+class StripSnapshot:
+    """
+    Arrays of properties of the strips in `collection`, in the collection's order.
+    Combine the mask_* methods with NumPy's boolean operators, then call get_strips() to get the
+    corresponding sequences.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.count = len(collection)
+
+        self.frame_final_start = self._read_int("frame_final_start")
+        self.frame_final_end = self._read_int("frame_final_end")
+        self.channel = self._read_int("channel")
+        self.lock = self._read_bool("lock")
+        self.select = self._read_bool("select")
+        # Enum properties don't support raw access so we read the types one by one
+        self.type = np.array([s.type for s in collection], dtype=object)
+
+        self._strips = None
+        self._indices = None
+
+    def _read_int(self, attribute):
+        array = np.empty(self.count, dtype=np.int32)
+        if self.count:
+            self.collection.foreach_get(attribute, array)
+        return array
+
+    def _read_bool(self, attribute):
+        array = np.empty(self.count, dtype=bool)
+        if self.count:
+            self.collection.foreach_get(attribute, array)
+        return array
+
+    def update_selection(self):
+        """Reads the strips' select flags again, as selecting strips doesn't clear the caches"""
+        if self.count:
+            self.collection.foreach_get("select", self.select)
+
+    @property
+    def strips(self):
+        if self._strips is None:
+            self._strips = self.collection[:]
+        return self._strips
+
+    def get_index(self, strip):
+        """Returns the position of `strip` in the snapshot's arrays"""
+        if self._indices is None:
+            self._indices = {s: index for index, s in enumerate(self.strips)}
+        return self._indices[strip]
+
+    def get_strips(self, mask):
+        """Returns the list of sequences for which `mask` is True"""
+        strips = self.strips
+        return [strips[i] for i in np.flatnonzero(mask)]
+
+    def mask_all(self):
+        return np.ones(self.count, dtype=bool)
+
+    def mask_overlapping(self, frame_start, frame_end):
+        """Strips that overlap the closed range [frame_start, frame_end]"""
+        return (self.frame_final_start <= frame_end) & (self.frame_final_end >= frame_start)
+
+    def mask_inside(self, frame_start, frame_end):
+        """Strips that start and end in the closed range [frame_start, frame_end]"""
+        return (
+            (frame_start <= self.frame_final_start)
+            & (self.frame_final_start <= frame_end)
+            & (frame_start <= self.frame_final_end)
+            & (self.frame_final_end <= frame_end)
+        )
+
+    def mask_starts_after(self, frame):
+        return self.frame_final_start > frame
+
+    def mask_ends_before(self, frame):
+        return self.frame_final_end < frame
+
+    def mask_channels(self, channels):
+        return np.isin(self.channel, list(channels))
+
+    def mask_types(self, types):
+        return np.isin(self.type, list(types))
+
+    def mask_unlocked(self):
+        return ~self.lock
+
+    def set_selection(self, mask):
+        """Selects the strips where `mask` is True and deselects all the others"""
+        self.select[:] = mask
+        if self.count:
+            self.collection.foreach_set("select", self.select)
+
+
+def build_strip_snapshot(context):
+    collection = get_sequences_collection(context)
+    return StripSnapshot(collection if collection is not None else [])
+
+
+_strip_snapshot_cache = SequencerCache(build_strip_snapshot)
+
+
+def get_strip_snapshot(context):
+    """
+    Returns the StripSnapshot of `context.sequences`, rebuilding it if the strips changed
+    """
+    snapshot = _strip_snapshot_cache.get(context)
+    snapshot.update_selection()
+    return snapshot
@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+"""
+Runs long operations in the background without blocking Blender's interface.
+A Task processes a list of items on worker threads. A timer passes each result back to the main
+thread, where callbacks can safely change Blender data, shows the progress of running tasks in
+the status bar, and reports the tasks' results when they end. See submit_task().
+"""
+import itertools
+import queue
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from .info_progress_bar import InfoProgressBar
+
+PUMP_INTERVAL = 0.2
+
+_task_ids = itertools.count(1)
+_tasks = []
+_progress_bar = InfoProgressBar(lambda: _tasks)
+
+
+class Task:
+    """
+    Calls `work(item)` for each of the `items` on up to `max_workers` threads.
+    `work` must not access Blender data: it runs outside the main thread. It raises an exception
+    to mark an item as failed: the task counts failures and stores them in `errors`.
+    Args:
+    - on_result (optional): called on the main thread with (item, result) for each processed item.
+    The result is None if `work` raised an exception
+    - on_finish (optional): called on the main thread with the task once all items are processed or
+    the task got cancelled. It can call set_report() to show a message to the user
+    - on_cancel (optional): called on the main thread when the task gets cancelled, to stop work
+    in progress, like external processes
+    """
+
+    def __init__(
+        self,
+        name,
+        items,
+        work,
+        on_result=None,
+        on_finish=None,
+        on_cancel=None,
+        max_workers=1,
+    ):
+        self.id = next(_task_ids)
+        self.name = name
+        self.items = list(items)
+        self.work = work
+        self.on_result = on_result
+        self.on_finish = on_finish
+        self.on_cancel = on_cancel
+        self.max_workers = max_workers
+
+        self.status = "QUEUED"
+        self.done_count = 0
+        self.errors = []
+        # (type, message) to report when the task ends, see set_report()
+        self.report = None
+        self.start_time = 0.0
+        self._pool = None
+        self._futures = []
+        self._results = queue.Queue()
+
+    @property
+    def total(self):
+        return len(self.items)
+
+    @property
+    def is_running(self):
+        return self.status in ["QUEUED", "RUNNING"]
+
+    @property
+    def is_cancelled(self):
+        return self.status == "CANCELLED"
+
+    @property
+    def failed_count(self):
+        return len(self.errors)
+
+    def set_report(self, report_type, message):
+        """
+        Reports `message` in the status bar and the info editor when the task ends
+        Args:
+        - report_type: "INFO" or "WARNING"
+        """
+        self.report = (report_type, message)
+
+    def get_progress(self):
+        """Returns the ratio of processed items, between 0 and 1"""
+        return self.done_count / self.total if self.total else 1.0
+
+    def get_eta(self):
+        """
+        Returns the estimated time left in seconds from the average time per processed item, or
+        None before the first item is done
+        """
+        if not self.done_count:
+            return None
+        elapsed = time.time() - self.start_time
+        return elapsed / self.done_count * (self.total - self.done_count)
+
+    def start(self):
+        self.status = "RUNNING"
+        self.start_time = time.time()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        self._futures = [self._pool.submit(self._run, item) for item in self.items]
+
+    def _run(self, item):
+        if self.is_cancelled:
+            return
+        result, error = None, None
+        try:
+            result = self.work(item)
+        except Exception as exception:
+            error = exception
+        self._results.put((item, result, error))
+
+    def pump(self):
+        """Calls on_result for the items processed since the last call. Main thread only."""
+        while self.is_running:
+            try:
+                item, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.done_count += 1
+            if error is not None:
+                self.errors.append((item, error))
+            if self.on_result:
+                self.on_result(item, result)
+
+        if self.is_running and self.done_count == self.total:
+            self.status = "FINISHED"
+            self._pool.shutdown(wait=False)
+            if self.on_finish:
+                self.on_finish(self)
+
+    def cancel(self):
+        """Drops the pending items and stops the work in progress. Main thread only."""
+        if not self.is_running:
+            return
+        self.status = "CANCELLED"
+        for future in self._futures:
+            future.cancel()
+        if self.on_cancel:
+            self.on_cancel()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+        if self.on_finish:
+            self.on_finish(self)
+
+    def __repr__(self):
+        return "Task {} {}: {}/{} {}".format(
+            self.id, self.name, self.done_count, self.total, self.status
+        )
+
+
+def submit_task(task):
+    """Starts the task and the timer that reports its results to the main thread"""
+    _tasks.append(task)
+    task.start()
+    _progress_bar.visible = True
+    if not bpy.app.timers.is_registered(pump_tasks):
+        bpy.app.timers.register(pump_tasks, first_interval=PUMP_INTERVAL)
+    return task
+
+
+def pump_tasks():
+    """Timer function that processes the results of running tasks and removes finished ones"""
+    for task in list(_tasks):
+        try:
+            task.pump()
+        except Exception:
+            # An error in a callback must not stop the timer and the other tasks with it
+            traceback.print_exc()
+            task.cancel()
+        if not task.is_running:
+            _tasks.remove(task)
+            if task.report:
+                show_report(*task.report)
+    _progress_bar.update()
+    if _tasks:
+        return PUMP_INTERVAL
+    _progress_bar.visible = False
+    return None
+
+
+def show_report(report_type, message):
+    """
+    Reports the message of a finished task. Timers can't report directly, so this goes through an
+    operator, whose reports Blender shows in the status bar
+    """
+    try:
+        bpy.ops.power_sequencer.task_report(report_type=report_type, message=message)
+    except (AttributeError, RuntimeError):
+        # The add-on is getting disabled or there is no window to report to
+        traceback.print_exc()
+
+
+def get_tasks():
+    """Returns the list of running tasks"""
+    return list(_tasks)
+
+
+def find_task(task_id):
+    return next((task for task in _tasks if task.id == task_id), None)
+
+
+def cancel_all_tasks():
+    for task in list(_tasks):
+        task.cancel()
+    _tasks.clear()
+    _progress_bar.visible = False
+    if bpy.app.timers.is_registered(pump_tasks):
+        bpy.app.timers.unregister(pump_tasks)
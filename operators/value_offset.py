@@ -3,6 +3,7 @@
 import bpy
 
 from .utils.doc import doc_brief, doc_description, doc_idname, doc_name
+from .utils.poll import has_selected_strips
 from .utils.functions import convert_duration_to_frames
 
 
@@ -63,7 +64,7 @@ class POWER_SEQUENCER_OT_value_offset(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.selected_sequences
+        return has_selected_strips(context)
 
     def invoke(self, context, event):
         self.offset = abs(self.offset)
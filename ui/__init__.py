@@ -15,6 +15,9 @@ from .menu_toolbar import (
     POWER_SEQUENCER_MT_audio,
     POWER_SEQUENCER_MT_transitions,
 )
+from .panel_profiler import POWER_SEQUENCER_PT_profiler
+from .panel_snapping import POWER_SEQUENCER_PT_snapping
+from .panel_tasks import POWER_SEQUENCER_PT_tasks
 
 classes = [
     POWER_SEQUENCER_MT_contextual,
@@ -29,6 +32,9 @@ classes = [
     POWER_SEQUENCER_MT_preview,
     POWER_SEQUENCER_MT_audio,
     POWER_SEQUENCER_MT_transitions,
+    POWER_SEQUENCER_PT_snapping,
+    POWER_SEQUENCER_PT_tasks,
+    POWER_SEQUENCER_PT_profiler,
 ]
 
 register_ui, unregister_ui = bpy.utils.register_classes_factory(classes)
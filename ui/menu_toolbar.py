@@ -146,6 +146,8 @@ class POWER_SEQUENCER_MT_file(bpy.types.Menu):
         )
         layout.operator("power_sequencer.save_direct")
         layout.operator("power_sequencer.import_local_footage")
+        layout.operator("power_sequencer.proxies_build")
+        layout.operator("power_sequencer.proxies_manage")
 
 
 class POWER_SEQUENCER_MT_trim(bpy.types.Menu):
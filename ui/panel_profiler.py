@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from ..addon_preferences import get_preferences
+from ..operators.utils.profiler import get_profiler
+
+# Number of operators listed in the panel, slowest first
+SUMMARY_LENGTH = 10
+
+
+class POWER_SEQUENCER_PT_profiler(bpy.types.Panel):
+    """Sums up the time Power Sequencer's operators took, when profiling is on"""
+
+    bl_label = "Profiler"
+    bl_space_type = "SEQUENCE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Power Sequencer"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(get_preferences(context), "profile_operators")
+
+        profiler = get_profiler()
+        summary = profiler.get_summary()
+        if not summary:
+            layout.label(text="No recorded operator calls")
+        else:
+            flow = layout.grid_flow(row_major=True, columns=4, even_columns=False, align=True)
+            for text in ["Operator", "Calls", "Mean", "Max"]:
+                flow.label(text=text)
+            for name, category, calls, _, mean, longest in summary[:SUMMARY_LENGTH]:
+                flow.label(text="{} ({})".format(name, category))
+                flow.label(text=str(calls))
+                flow.label(text="{:.1f} ms".format(mean * 1000.0))
+                flow.label(text="{:.1f} ms".format(longest * 1000.0))
+            layout.label(text="{}/{} events".format(len(profiler.events), profiler.events.maxlen))
+
+        row = layout.row(align=True)
+        row.operator("power_sequencer.profiler_export", text="Export Trace", icon="EXPORT")
+        row.operator("power_sequencer.profiler_clear", text="Clear", icon="TRASH")
@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+
+class POWER_SEQUENCER_PT_snapping(bpy.types.Panel):
+    """Settings of the snapping of Power Sequencer's mouse tools, like Mouse Trim with Ctrl"""
+
+    bl_label = "Snapping"
+    bl_space_type = "SEQUENCE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Power Sequencer"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.power_sequencer
+
+        column = layout.column(heading="Snap To", align=True)
+        column.prop(settings, "snap_to_cuts")
+        column.prop(settings, "snap_to_markers")
+        column.prop(settings, "snap_to_keyframes")
+        column.prop(settings, "snap_to_playhead")
+        layout.prop(settings, "snap_distance")
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2016-2020 by Nathan Lovato, Daniel Oakey, Razvan Radulescu, and contributors
+import bpy
+
+from ..operators.utils.info_progress_bar import format_task_progress
+from ..operators.utils.tasks import get_tasks
+
+
+class POWER_SEQUENCER_PT_tasks(bpy.types.Panel):
+    """Lists the background tasks that are running, with their progress"""
+
+    bl_label = "Background Tasks"
+    bl_space_type = "SEQUENCE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Power Sequencer"
+
+    def draw(self, context):
+        layout = self.layout
+        tasks = get_tasks()
+        if not tasks:
+            layout.label(text="No running tasks")
+            return
+
+        for task in tasks:
+            row = layout.row(align=True)
+            row.label(text=format_task_progress(task))
+            row.operator("power_sequencer.task_cancel", text="", icon="X").task_id = task.id
+        layout.operator("power_sequencer.task_cancel", text="Cancel All").task_id = 0